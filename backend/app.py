@@ -4,28 +4,46 @@ Wraps the complete reading assessment pipeline into REST endpoints
 """
 
 from fastapi import (
-    FastAPI, File, UploadFile, Form, HTTPException, Depends, Header
+    FastAPI, File, UploadFile, Form, HTTPException, Depends, Header,
+    WebSocket, WebSocketDisconnect
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 from sqlalchemy.orm import Session
 import io
 import wave
 import json
+import hashlib
+import re
 import os
+import tempfile
 import time
+import asyncio
+import threading
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from vosk import Model, KaldiRecognizer
 from text_comparison import compare_text, get_performance_feedback
 from reading_speed import ReadingSpeedAnalyzer
 from dyslexia_risk_scoring import DyslexiaRiskScorer
-from text_to_speech import DyslexiaAssistanceEngine
+from text_to_speech import DyslexiaAssistanceEngine, AUDIO_URL_PREFIX
+from tts_cache import TTSAudioCache
+from audio_profiles import AUDIO_PROFILES
+from tts_prewarm import TTSPrewarmer
 from pronunciation_trainer import PronunciationTrainer, PronunciationComparator
 from speed_trainer import SpeedTrainer
 from phrase_trainer import PhraseTrainer
-from age_based_paragraphs import get_paragraph_for_age, get_age_group_info
-from database import init_db, get_db
+from assessment_segments import AssessmentRecordingStore, get_segments
+from session_store import create_session_store
+from age_based_paragraphs import (
+    AGE_BASED_PARAGRAPHS, get_paragraph_for_age, get_age_group_info
+)
+from database import init_db, get_db, SessionLocal
+from write_behind import WriteBehindQueue
 from auth_utils import (
     verify_password, create_access_token, decode_access_token,
     validate_email, validate_password
@@ -34,7 +52,11 @@ from crud import (
     UserCRUD,
     AssessmentCRUD,
     ResultCRUD,
-    ProgressCRUD
+    ProgressCRUD,
+    PronunciationCRUD,
+    WordMasteryCRUD,
+    SpeedTrainerCRUD,
+    ChunkReadingCRUD
 )
 import schemas
 
@@ -52,6 +74,36 @@ def startup_event():
     """Initialize database when app starts"""
     init_db()
     print("[OK] Database tables initialized")
+    pronunciation_attempt_writer.start()
+    print("[OK] Pronunciation attempt writer started")
+    speed_trainer_result_writer.start()
+    chunk_reading_result_writer.start()
+    if tts_engine and tts_engine.pool:
+        # Start TTS workers in the background so startup is not blocked
+        threading.Thread(target=tts_engine.pool.warm_up, daemon=True).start()
+    if tts_prewarmer and os.getenv("TTS_PREWARM", "1") == "1":
+        tts_prewarmer.start()
+        print("[OK] TTS prewarm started")
+    speed_trainer_sessions.start()
+    phrase_trainer_sessions.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """Flush buffered writes and stop background workers"""
+    pronunciation_attempt_writer.stop()
+    print("[OK] Pronunciation attempts flushed")
+    speed_trainer_result_writer.stop()
+    chunk_reading_result_writer.stop()
+    print("[OK] Trainer results flushed")
+    recognition_executor.shutdown(wait=False)
+    speed_trainer_sessions.stop()
+    phrase_trainer_sessions.stop()
+    if tts_prewarmer:
+        tts_prewarmer.stop()
+    if tts_engine:
+        tts_engine.shutdown()
+        print("[OK] TTS workers stopped")
 
 
 # Add CORS middleware
@@ -75,7 +127,26 @@ model = Model(model_path)
 
 # Initialize TTS Engine for Assistance Module
 try:
-    tts_engine = DyslexiaAssistanceEngine(rate=100, volume=0.9)
+    tts_cache = TTSAudioCache(
+        cache_dir=os.getenv(
+            "TTS_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "dyslexia_tts_cache")
+        ),
+        memory_max_bytes=int(os.getenv("TTS_CACHE_MEMORY_MB", "32")) << 20,
+        disk_max_bytes=int(os.getenv("TTS_CACHE_DISK_MB", "512")) << 20
+    )
+    tts_engine = DyslexiaAssistanceEngine(
+        rate=100,
+        volume=0.9,
+        pool_size=int(os.getenv("TTS_WORKERS", "2")),
+        cache=tts_cache,
+        batch_size=int(os.getenv("TTS_BATCH_SIZE", "8")),
+        # Compact delivery profile (see audio_profiles.AUDIO_PROFILES)
+        output_format=os.getenv("TTS_OUTPUT_FORMAT", "pcm16_16k"),
+        # Audio URLs must be absolute: the frontend may be served elsewhere
+        public_url=os.getenv("PUBLIC_BASE_URL", "http://localhost:8000"),
+        max_prefetch=int(os.getenv("TTS_PREFETCH_MAX", "256"))
+    )
     print("[OK] Assistance Module (TTS) ready")
 except Exception as e:
     print(f"[WARN] TTS Engine initialization warning: {e}")
@@ -92,13 +163,122 @@ except Exception as e:
     print(f"[WARN] Pronunciation Trainer initialization warning: {e}")
     pronunciation_trainer = None
 
-# Initialize Speed Trainer Sessions storage
-# Speed trainer session storage
-speed_trainer_sessions = {}
+# Recognition workers: Vosk decoding runs off the event loop on this pool
+RECOGNITION_WORKERS = int(
+    os.getenv("RECOGNITION_WORKERS", str(min(8, os.cpu_count() or 2)))
+)
+recognition_executor = ThreadPoolExecutor(
+    max_workers=RECOGNITION_WORKERS,
+    thread_name_prefix="recognition"
+)
+
+# Maximum (word, audio) pairs accepted by /pronunciation/batch-check
+MAX_BATCH_WORDS = 25
+
+def _flush_pronunciation_attempts(attempts: list):
+    """Bulk-insert a batch of buffered pronunciation attempts"""
+    db = SessionLocal()
+    try:
+        PronunciationCRUD.create_attempts_bulk(db, attempts)
+    finally:
+        db.close()
+
+
+# Pronunciation attempts are written behind the drill loop in batches
+pronunciation_attempt_writer = WriteBehindQueue(
+    "pronunciation_attempts",
+    _flush_pronunciation_attempts,
+    max_batch_size=int(os.getenv("ATTEMPT_WRITE_BATCH_SIZE", "100")),
+    flush_interval=float(os.getenv("ATTEMPT_WRITE_INTERVAL", "2.0"))
+)
+
+def _flush_speed_trainer_results(sessions: list):
+    """Bulk-insert a batch of completed speed trainer sessions"""
+    db = SessionLocal()
+    try:
+        SpeedTrainerCRUD.create_sessions_bulk(db, sessions)
+    finally:
+        db.close()
+
+
+def _flush_chunk_reading_results(sessions: list):
+    """Bulk-insert a batch of completed chunk reading sessions"""
+    db = SessionLocal()
+    try:
+        ChunkReadingCRUD.create_sessions_bulk(db, sessions)
+    finally:
+        db.close()
+
+
+# Completed trainer sessions are written behind the results endpoints.
+# Rows only copy the text and numbers (never the trainer), so evicting a
+# session from its store releases everything held for it in memory.
+speed_trainer_result_writer = WriteBehindQueue(
+    "speed_trainer_results",
+    _flush_speed_trainer_results,
+    max_batch_size=int(os.getenv("TRAINER_RESULT_WRITE_BATCH_SIZE", "50")),
+    flush_interval=float(os.getenv("TRAINER_RESULT_WRITE_INTERVAL", "2.0"))
+)
+chunk_reading_result_writer = WriteBehindQueue(
+    "chunk_reading_results",
+    _flush_chunk_reading_results,
+    max_batch_size=int(os.getenv("TRAINER_RESULT_WRITE_BATCH_SIZE", "50")),
+    flush_interval=float(os.getenv("TRAINER_RESULT_WRITE_INTERVAL", "2.0"))
+)
+
+def _load_word_error_counts() -> dict:
+    """Failed attempts per word, used to rank TTS prewarming"""
+    db = SessionLocal()
+    try:
+        return WordMasteryCRUD.get_error_counts(db)
+    finally:
+        db.close()
+
+
+# Paragraph library vocabulary is synthesized into the TTS cache in the
+# background, most frequently misread words first
+tts_prewarmer = None
+if tts_engine:
+    tts_prewarmer = TTSPrewarmer(
+        tts_engine, error_counts_func=_load_word_error_counts
+    )
+    tts_prewarmer.add_source(
+        "age_based_paragraphs",
+        [p for paragraphs in AGE_BASED_PARAGRAPHS.values() for p in paragraphs]
+    )
+
+# Recent assessment recordings kept for misread-word segment replay
+assessment_recordings = AssessmentRecordingStore(
+    max_recordings=int(os.getenv("ASSESSMENT_RECORDINGS_MAX", "200")),
+    ttl_seconds=int(os.getenv("ASSESSMENT_RECORDINGS_TTL", "900"))
+)
+
+# Trainer session storage: idle sessions expire, and the least recently
+# used ones are evicted when the entry or memory cap is reached
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "1800"))
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "5000"))
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_MB", "64")) * 1024 * 1024
+
+# Speed trainer session storage (SESSION_BACKEND=sqlite shares sessions
+# between uvicorn workers)
+speed_trainer_sessions = create_session_store(
+    "speed_trainer",
+    SpeedTrainer.to_state,
+    SpeedTrainer.from_state,
+    ttl_seconds=SESSION_TTL_SECONDS,
+    max_entries=SESSION_MAX_ENTRIES,
+    max_bytes=SESSION_MAX_BYTES
+)
 
-# Initialize Phrase Trainer Sessions storage
 # Phrase trainer session storage
-phrase_trainer_sessions = {}
+phrase_trainer_sessions = create_session_store(
+    "chunk_reading",
+    PhraseTrainer.to_state,
+    PhraseTrainer.from_state,
+    ttl_seconds=SESSION_TTL_SECONDS,
+    max_entries=SESSION_MAX_ENTRIES,
+    max_bytes=SESSION_MAX_BYTES
+)
 
 
 # ================== Pydantic Models ==================
@@ -125,9 +305,10 @@ class PronunciationCheckResult(BaseModel):
     is_correct: bool
     similarity_ratio: float
     feedback: str
-    pronunciation_audio: Optional[str] = None
+    pronunciation_audio: Optional[str] = None  # URL of the cached clip
     raw_recognized: str = ""
     exact_match: bool = False
+    confidence: Optional[float] = None
 
 
 class PronunciationFeedback(BaseModel):
@@ -208,6 +389,7 @@ class AssessmentResponse(BaseModel):
     difficulty_assessment: str
     risk_assessment: RiskAssessment
     assistance: Optional[AssistanceData] = None
+    recording_id: Optional[str] = None
     status: str = "success"
 
 
@@ -238,6 +420,7 @@ class PaceReadingRequest(BaseModel):
     """Request to prepare pace reading training"""
     text: str
     speeds: Optional[List[int]] = None  # Custom WPM values
+    weighted_timeline: bool = False  # Longer words shown longer
 
     class Config:
         json_schema_extra = {
@@ -256,6 +439,7 @@ class PaceReadingResponse(BaseModel):
     speeds: List[int]
     intervals: List[int]
     session_id: str = ""
+    timeline: Optional[dict] = None  # See SpeedTrainer.build_timeline
 
 
 class SpeedTrainerAction(BaseModel):
@@ -264,6 +448,26 @@ class SpeedTrainerAction(BaseModel):
     session_id: Optional[str] = None
 
 
+class TrainerActionBatch(BaseModel):
+    """Ordered actions applied to a trainer session in one request"""
+    actions: List[str]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "actions": ["resume", "advance_word", "advance_word"]
+            }
+        }
+
+
+class SpeedTrainerCheckpoint(BaseModel):
+    """Reading position reported by a client running the timeline"""
+    round: int
+    word_index: int
+    is_paused: bool = False
+    is_completed: bool = False
+
+
 class SpeedTrainerStats(BaseModel):
     """Statistics from a speed training session"""
     total_words: int
@@ -319,6 +523,8 @@ class ChunkReadingResponse(BaseModel):
     min_phrase_length: int
     max_phrase_length: int
     session_id: str = ""
+    # Read-along audio per phrase (synthesized in the background)
+    phrase_audio_urls: List[str] = []
 
 
 class ChunkReadingSession(BaseModel):
@@ -368,7 +574,56 @@ class ChunkReadingCompletionResult(BaseModel):
 
 # ================== Helper Functions ==================
 
-def process_audio_file(audio_bytes: bytes, filename: str = 'audio.wav') -> str:
+def get_user_id_from_authorization(
+    authorization: Optional[str]
+) -> Optional[int]:
+    """
+    Resolve the user ID from a Bearer token without a database lookup.
+
+    Args:
+        authorization: Authorization header value (may be None)
+
+    Returns:
+        User ID, or None if the request is anonymous or the token is invalid
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    payload = decode_access_token(authorization.replace("Bearer ", ""))
+    if not payload:
+        return None
+    return payload.get("user_id")
+
+
+def record_pronunciation_attempt(
+    user_id: Optional[int], result: dict, attempt_number: int = 1
+):
+    """
+    Queue a pronunciation attempt for write-behind persistence.
+
+    Args:
+        user_id: Authenticated user (anonymous attempts are not stored)
+        result: Result dict from PronunciationTrainer.evaluate_attempt
+        attempt_number: Attempt number reported by the client
+    """
+    if not user_id:
+        return
+    pronunciation_attempt_writer.put({
+        "user_id": user_id,
+        "word": result["correct"][:100],
+        "attempt_number": attempt_number,
+        "recognized_text": result["attempt_details"]["raw_recognized"][:100],
+        "is_correct": result["is_correct"],
+        "similarity_ratio": result["similarity_ratio"],
+        "feedback": result["feedback"],
+        "created_at": datetime.now()
+    })
+
+
+def process_audio_file(
+    audio_bytes: bytes,
+    filename: str = 'audio.wav',
+    word_timings: Optional[list] = None
+) -> str:
     """
     Process audio file and extract recognized text using Vosk
     Expects WAV format audio
@@ -376,6 +631,8 @@ def process_audio_file(audio_bytes: bytes, filename: str = 'audio.wav') -> str:
     Args:
         audio_bytes: Raw WAV audio data
         filename: Original filename (for logging)
+        word_timings: Optional list that receives Vosk per-word
+            timestamps ({"word", "start", "end", "conf"})
 
     Returns:
         Recognized text from the audio
@@ -431,7 +688,7 @@ def process_audio_file(audio_bytes: bytes, filename: str = 'audio.wav') -> str:
 
             print("[VOSK] Creating Vosk recognizer (target 16kHz)...")
             recognizer = KaldiRecognizer(model, sample_rate)
-            recognizer.SetWords(None)  # Use default word list
+            recognizer.SetWords(word_timings is not None)
 
             # Process audio in optimal chunk size for Vosk
             frames_processed = 0
@@ -450,6 +707,8 @@ def process_audio_file(audio_bytes: bytes, filename: str = 'audio.wav') -> str:
                     try:
                         if recognizer.AcceptWaveform(data):
                             result = json.loads(recognizer.Result())
+                            if word_timings is not None:
+                                word_timings.extend(result.get("result", []))
                             if result.get("text"):
                                 interim_results.append(
                                     result.get("text")
@@ -472,6 +731,8 @@ def process_audio_file(audio_bytes: bytes, filename: str = 'audio.wav') -> str:
             try:
                 final_result = json.loads(recognizer.FinalResult())
                 final_text = final_result.get("text", "")
+                if word_timings is not None:
+                    word_timings.extend(final_result.get("result", []))
             except Exception as e:
                 print(f"[WARN] Error getting final result: {e}")
                 final_text = ""
@@ -771,6 +1032,10 @@ async def get_suggested_paragraph(
         paragraph = get_paragraph_for_age(age, index)
         age_group_info = get_age_group_info(age)
 
+        # Warm this paragraph's words before the child finishes reading
+        if tts_prewarmer:
+            tts_prewarmer.prioritize(paragraph)
+
         group = age_group_info["age_group"]
         return {
             "success": True,
@@ -801,8 +1066,6 @@ async def get_all_paragraphs():
         JSON with all paragraphs grouped by age and difficulty level
     """
     try:
-        from age_based_paragraphs import AGE_BASED_PARAGRAPHS
-
         result = {}
         for age_group, paragraphs in AGE_BASED_PARAGRAPHS.items():
             age_num = (
@@ -838,13 +1101,246 @@ async def get_all_paragraphs():
 
 # ================== TTS Endpoints ================
 
+# Clips are content-addressed, so a URL always maps to the same bytes
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+BYTE_RANGE = re.compile(r"bytes=\s*(\d*)\s*-\s*(\d*)\s*(?:,|$)")
+UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def content_disposition(filename: str) -> str:
+    """
+    Build an inline Content-Disposition header for a (user-derived)
+    filename: an ASCII-safe fallback plus the RFC 5987 UTF-8 form.
+
+    Args:
+        filename: Download filename
+
+    Returns:
+        Header value
+    """
+    fallback = UNSAFE_FILENAME_CHARACTERS.sub("_", filename) or "audio.wav"
+    return (
+        f'inline; filename="{fallback}"; '
+        f"filename*=UTF-8''{quote(filename, safe='')}"
+    )
+
+
+def parse_byte_range(
+    range_header: Optional[str],
+    total: int
+) -> Optional[Tuple[int, int]]:
+    """
+    Parse the first range of a Range header.
+
+    Args:
+        range_header: Request Range header (e.g. "bytes=0-1023")
+        total: Size of the representation in bytes
+
+    Returns:
+        Inclusive (start, end), (start, -1) if the range parses but
+        cannot be satisfied, or None if there is no usable Range header
+        (which RFC 9110 says to ignore)
+    """
+    match = BYTE_RANGE.match(range_header or "")
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    start_text, end_text = match.groups()
+    if start_text:
+        start = int(start_text)
+        if end_text and int(end_text) < start:
+            return None  # Invalid range-spec
+        if start >= total:
+            return start, -1
+        end = int(end_text) if end_text else total - 1
+        return start, min(end, total - 1)
+    # Suffix range: the last N bytes
+    suffix = int(end_text)
+    if suffix == 0 or total == 0:
+        return 0, -1
+    return max(0, total - suffix), total - 1
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check whether an If-None-Match header lists the (unquoted) etag"""
+    if not if_none_match:
+        return False
+    return f'"{etag}"' in [tag.strip() for tag in if_none_match.split(",")]
+
+
+def not_modified_response(
+    etag: str,
+    cache_control: str = AUDIO_CACHE_CONTROL
+) -> Response:
+    """304 response for a clip the client already has"""
+    headers = {"ETag": f'"{etag}"', "Cache-Control": cache_control}
+    return Response(status_code=304, headers=headers)
+
+
+def audio_response(
+    audio_bytes: bytes,
+    etag: str,
+    filename: str,
+    range_header: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+    cache_control: str = AUDIO_CACHE_CONTROL
+) -> Response:
+    """
+    Serve raw WAV bytes with ETag validation and single-range support
+
+    Args:
+        audio_bytes: Complete WAV file
+        etag: Entity tag of the clip (its cache key)
+        filename: Download filename
+        range_header: Request Range header (e.g. "bytes=0-1023")
+        if_none_match: Request If-None-Match header
+
+    Returns:
+        200, 206, 304 or 416 response
+    """
+    quoted_etag = f'"{etag}"'
+    headers = {
+        "ETag": quoted_etag,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition(filename)
+    }
+
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    total = len(audio_bytes)
+    byte_range = parse_byte_range(range_header, total)
+    if byte_range is not None:
+        start, end = byte_range
+        if start > end:
+            headers["Content-Range"] = f"bytes */{total}"
+            return Response(status_code=416, headers=headers)
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+        return Response(
+            content=audio_bytes[start:end + 1],
+            status_code=206,
+            media_type="audio/wav",
+            headers=headers
+        )
+
+    return Response(
+        content=audio_bytes, media_type="audio/wav", headers=headers
+    )
+
+
+def validate_audio_format(audio_format: Optional[str]) -> Optional[str]:
+    """Reject unknown audio profiles with a 400 (None = engine default)"""
+    if audio_format and audio_format not in AUDIO_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unknown audio format '{audio_format}'. "
+                f"Available: {', '.join(AUDIO_PROFILES)}"
+            )
+        )
+    return audio_format or None
+
+
+async def validate_tts_settings(
+    audio_format: Optional[str],
+    rate: Optional[int],
+    volume: Optional[float],
+    voice: Optional[str]
+) -> dict:
+    """
+    Validate TTS request settings, raising 400 on bad values
+
+    Returns:
+        Settings overrides for the TTS engine (None = engine default)
+    """
+    if rate is not None and not 50 <= rate <= 300:
+        detail = "Rate must be between 50 and 300"
+        raise HTTPException(status_code=400, detail=detail)
+    if volume is not None and not 0.0 <= volume <= 1.0:
+        detail = "Volume must be between 0.0 and 1.0"
+        raise HTTPException(status_code=400, detail=detail)
+    # Voice IDs reach the TTS workers and the cache key; only known ones
+    if voice and not await run_in_threadpool(tts_engine.is_known_voice, voice):
+        raise HTTPException(status_code=400, detail=f"Unknown voice '{voice}'")
+    return {
+        "output_format": validate_audio_format(audio_format),
+        "rate": rate,
+        "volume": volume,
+        "voice": voice
+    }
+
+
+@app.get(AUDIO_URL_PREFIX + "{key}")
+async def get_tts_audio(
+    key: str,
+    text: Optional[str] = None,
+    format: Optional[str] = None,
+    rate: Optional[int] = None,
+    volume: Optional[float] = None,
+    voice: Optional[str] = None,
+    range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Serve a TTS clip by its cache key (as returned in audio URLs)
+
+    Args:
+        key: Cache key of the clip
+        text: Text of the clip, used to re-synthesize it on a cache miss
+        format: Audio profile of the clip
+        rate: Speech rate of the clip
+        volume: Volume of the clip
+        voice: Voice ID of the clip
+        range: Optional byte range
+        if_none_match: Optional ETag for conditional requests
+
+    Returns:
+        WAV audio with ETag, Cache-Control and Range support
+    """
+    if not tts_engine:
+        raise HTTPException(status_code=503, detail="TTS Engine not available")
+    if len(key) != 64 or any(c not in "0123456789abcdef" for c in key):
+        raise HTTPException(status_code=404, detail="Audio not found")
+    if etag_matches(key, if_none_match):
+        return not_modified_response(key)
+
+    settings = await validate_tts_settings(format, rate, volume, voice)
+    # Prefetched clips may still be synthesizing; wait for them. Evicted
+    # clips (or clips prefetched by another worker) are synthesized again
+    # from the text in the URL.
+    audio_bytes = await run_in_threadpool(
+        tts_engine.get_ready_audio, key, text, **settings
+    )
+    if not audio_bytes:
+        raise HTTPException(status_code=404, detail="Audio not found")
+    return audio_response(
+        audio_bytes, key, f"{key}.wav", range, if_none_match
+    )
+
+
 @app.post("/tts/word")
-async def generate_word_pronunciation(word: str = Form(...)):
+async def generate_word_pronunciation(
+    word: str = Form(...),
+    format: Optional[str] = Form(None),
+    rate: Optional[int] = Form(None),
+    volume: Optional[float] = Form(None),
+    voice: Optional[str] = Form(None),
+    range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Generate audio pronunciation for a word
 
     Args:
         word: Word to pronounce
+        format: Audio profile, e.g. "pcm16_16k" or "mulaw_8k"
+            (server default if omitted)
+        rate: Speech rate (50-300, e.g. 60 for slow pronunciation)
+        volume: Volume level (0.0-1.0)
+        voice: System voice ID (default voice if omitted)
+        range: Optional byte range
+        if_none_match: Optional ETag for conditional requests
 
     Returns:
         WAV audio file of word pronunciation
@@ -859,17 +1355,28 @@ async def generate_word_pronunciation(word: str = Form(...)):
                 detail="TTS Engine not available"
             )
 
+        settings = await validate_tts_settings(format, rate, volume, voice)
+        # The ETag is the cache key, so revalidation needs no synthesis
+        etag = tts_engine.cache_key(word, **settings)
+        if etag_matches(etag, if_none_match):
+            return not_modified_response(etag, cache_control="no-cache")
+
         print(f"🔊 Generating pronunciation for: '{word}'")
-        audio_bytes, _ = tts_engine.generate_audio_file(word)
+        audio_bytes = await run_in_threadpool(
+            tts_engine.get_audio, word, **settings
+        )
 
         if not audio_bytes:
             detail = "Failed to generate audio"
             raise HTTPException(status_code=500, detail=detail)
 
-        return StreamingResponse(
-            io.BytesIO(audio_bytes),
-            media_type="audio/wav",
-            headers={"Content-Disposition": f"attachment; filename={word}.wav"}
+        return audio_response(
+            audio_bytes,
+            etag,
+            f"{word}.wav",
+            range,
+            if_none_match,
+            cache_control="no-cache"
         )
 
     except HTTPException:
@@ -882,6 +1389,19 @@ async def generate_word_pronunciation(word: str = Form(...)):
         )
 
 
+@app.get("/tts/prewarm/status")
+async def get_tts_prewarm_status():
+    """
+    Get progress of the background TTS cache prewarm
+
+    Returns:
+        JSON with prewarm state and word counts
+    """
+    if not tts_prewarmer:
+        raise HTTPException(status_code=503, detail="TTS Engine not available")
+    return {"success": True, **tts_prewarmer.status()}
+
+
 @app.post("/tts/correction")
 async def get_word_correction(
     wrong_word: str = Form(...),
@@ -909,8 +1429,8 @@ async def get_word_correction(
             f"🆘 Generating correction: '{wrong_word}' "
             f"-> '{correct_word}'"
         )
-        assistance = tts_engine.generate_word_assistance(
-            wrong_word, correct_word
+        assistance = await run_in_threadpool(
+            tts_engine.generate_word_assistance, wrong_word, correct_word
         )
 
         return assistance
@@ -965,6 +1485,25 @@ async def health_check():
     return {"status": "🟢 Healthy", "model": "Vosk loaded"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Internal metrics of background workers, queues and caches"""
+    return {
+        "pronunciation_attempt_writer": pronunciation_attempt_writer.metrics(),
+        "speed_trainer_result_writer": speed_trainer_result_writer.metrics(),
+        "chunk_reading_result_writer": chunk_reading_result_writer.metrics(),
+        "assessment_recordings": len(assessment_recordings),
+        "tts_pool": (
+            tts_engine.pool.metrics() if tts_engine and tts_engine.pool
+            else None
+        ),
+        "tts_cache": tts_engine.cache.metrics() if tts_engine else None,
+        "tts_engine": tts_engine.metrics() if tts_engine else None,
+        "speed_trainer_sessions": speed_trainer_sessions.metrics(),
+        "chunk_reading_sessions": phrase_trainer_sessions.metrics()
+    }
+
+
 @app.post("/assess", response_model=AssessmentResponse)
 async def assess_reading(
     age: int = Form(...),
@@ -1043,6 +1582,7 @@ async def assess_reading(
 
         # PRIORITY 1: Use frontend Web Speech API if provided
         # This is the actual text the user said (captured live)
+        vosk_word_timings = None
         if recognized_text and recognized_text.strip():
             txt_strip = recognized_text.strip()
             print(f"✅ Using frontend Web Speech API: '{txt_strip}'")
@@ -1053,7 +1593,10 @@ async def assess_reading(
             # PRIORITY 2: Fallback to Vosk
             print("⚠️ No frontend, using Vosk...")
             filename = audio_file.filename or 'audio.wav'
-            vosk_text = process_audio_file(audio_bytes, filename)
+            vosk_word_timings = []
+            vosk_text = process_audio_file(
+                audio_bytes, filename, vosk_word_timings
+            )
             step_times['speech_recognition'] = time.time()
 
             if vosk_text:
@@ -1169,6 +1712,16 @@ async def assess_reading(
             )
             step_times['assistance'] = time.time() - assistance_start
 
+        # Keep the recording so misread words can be replayed; word
+        # timings are decoded lazily unless Vosk already produced them
+        recording_id = None
+        if has_errors:
+            recording = assessment_recordings.add(audio_bytes, paragraph)
+            if recording:
+                recording.word_timings = vosk_word_timings
+                recording_id = recording.recording_id
+                print(f"🎞️ Recording kept for segments: {recording_id}")
+
         # ========== Build Response ==========
         print("✅ Building assessment response...")
         response = AssessmentResponse(
@@ -1189,6 +1742,7 @@ async def assess_reading(
             difficulty_assessment=difficulty,
             risk_assessment=RiskAssessment(**risk_assessment),
             assistance=assistance_data,
+            recording_id=recording_id,
             status="success"
         )
 
@@ -1273,6 +1827,152 @@ async def assess_reading(
         raise HTTPException(status_code=500, detail=msg)
 
 
+@app.get("/assess/{recording_id}/segments")
+async def list_assessment_segments(recording_id: str):
+    """
+    List the audio segments of misread and skipped words from an
+    assessment recording.
+
+    Args:
+        recording_id: recording_id returned by /assess
+
+    Returns:
+        Segments with expected word, spoken word and time span
+    """
+    try:
+        recording = assessment_recordings.get(recording_id)
+        if not recording:
+            detail = f"Recording {recording_id} not found or expired"
+            raise HTTPException(status_code=404, detail=detail)
+
+        loop = asyncio.get_running_loop()
+        segments = await loop.run_in_executor(
+            recognition_executor, get_segments, model, recording
+        )
+
+        return {
+            "recording_id": recording_id,
+            "duration_seconds": round(recording.duration_seconds, 3),
+            "total_segments": len(segments),
+            "segments": segments
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Segment List Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to list segments: {str(e)}")
+
+
+async def _get_assessment_segment(recording_id: str, index: int):
+    """Look up a recording and one of its error segments (404 if missing)"""
+    recording = assessment_recordings.get(recording_id)
+    if not recording:
+        detail = f"Recording {recording_id} not found or expired"
+        raise HTTPException(status_code=404, detail=detail)
+
+    loop = asyncio.get_running_loop()
+    segments = await loop.run_in_executor(
+        recognition_executor, get_segments, model, recording
+    )
+    if index < 0 or index >= len(segments):
+        detail = f"Segment {index} not found"
+        raise HTTPException(status_code=404, detail=detail)
+
+    return recording, segments[index]
+
+
+@app.get("/assess/{recording_id}/segments/{index}")
+async def get_assessment_segment_audio(recording_id: str, index: int):
+    """
+    Get the WAV clip of one misread or skipped word from the original
+    assessment recording.
+
+    Args:
+        recording_id: recording_id returned by /assess
+        index: Segment index from /assess/{recording_id}/segments
+
+    Returns:
+        WAV audio of the word's span (served without copying the PCM)
+    """
+    try:
+        recording, segment = await _get_assessment_segment(
+            recording_id, index
+        )
+        pcm = recording.slice(segment["start"], segment["end"])
+
+        return StreamingResponse(
+            iter([recording.wav_header(len(pcm)), pcm]),
+            media_type="audio/wav",
+            headers={
+                "Content-Length": str(44 + len(pcm)),
+                "Content-Disposition": content_disposition(
+                    f"{segment['expected']}_original.wav"
+                )
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Segment Audio Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get segment: {str(e)}")
+
+
+@app.post(
+    "/assess/{recording_id}/segments/{index}/check",
+    response_model=PronunciationCheckResult
+)
+async def check_assessment_segment(recording_id: str, index: int):
+    """
+    Run the pronunciation check on the original assessment attempt of a
+    misread word, without another upload.
+
+    Args:
+        recording_id: recording_id returned by /assess
+        index: Segment index from /assess/{recording_id}/segments
+
+    Returns:
+        Pronunciation check result for the original attempt
+    """
+    try:
+        if not pronunciation_trainer:
+            detail = "Pronunciation training not available"
+            raise HTTPException(status_code=503, detail=detail)
+
+        recording, segment = await _get_assessment_segment(
+            recording_id, index
+        )
+        pcm = recording.slice(segment["start"], segment["end"])
+        clip = recording.wav_header(len(pcm)) + pcm
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            recognition_executor,
+            pronunciation_trainer.evaluate_attempt,
+            segment["expected"],
+            clip
+        )
+
+        return PronunciationCheckResult(
+            word=segment["expected"],
+            recognized=result["recognized"],
+            correct=result["correct"],
+            is_correct=result["is_correct"],
+            similarity_ratio=result["similarity_ratio"],
+            feedback=result["feedback"],
+            raw_recognized=result["attempt_details"]["raw_recognized"],
+            exact_match=result["attempt_details"]["exact_match"],
+            confidence=result["confidence"]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Segment Check Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Segment check failed: {str(e)}")
+
+
 @app.post("/assess-text", response_model=AssessmentResponse)
 async def assess_with_text(
     request: AssessmentRequest,
@@ -1417,15 +2117,24 @@ async def assess_with_text(
 # ================== Pronunciation Training Endpoints ==================
 
 @app.post("/pronunciation/word-audio")
-async def get_word_pronunciation(word: str = Form(...)):
+async def get_word_pronunciation(
+    word: str = Form(...),
+    format: Optional[str] = Form(None),
+    range: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get pronunciation audio for a word (for 'Hear it' button)
 
     Args:
         word: Word to pronounce
+        format: Audio profile, e.g. "pcm16_16k" or "mulaw_8k"
+            (server default if omitted)
+        range: Optional byte range
+        if_none_match: Optional ETag for conditional requests
 
     Returns:
-        WAV audio file or base64 encoded audio
+        WAV audio file
     """
     try:
         if not word or len(word.strip()) == 0:
@@ -1435,18 +2144,24 @@ async def get_word_pronunciation(word: str = Form(...)):
             detail = "Pronunciation assistance not available"
             raise HTTPException(status_code=503, detail=detail)
 
+        audio_format = validate_audio_format(format)
+
         print(f"🎵 Generating pronunciation for: '{word}'")
-        audio_bytes, audio_base64 = pronunciation_trainer.speak_word(word)
+        audio_bytes = await run_in_threadpool(
+            tts_engine.get_audio, word, output_format=audio_format
+        )
 
         if not audio_bytes:
             detail = "Failed to generate pronunciation"
             raise HTTPException(status_code=500, detail=detail)
 
-        # Return as streaming response for better browser support
-        return StreamingResponse(
-            io.BytesIO(audio_bytes),
-            media_type="audio/wav",
-            headers={"Content-Disposition": f"attachment; filename={word}_pronunciation.wav"}
+        return audio_response(
+            audio_bytes,
+            tts_engine.cache_key(word, output_format=audio_format),
+            f"{word}_pronunciation.wav",
+            range,
+            if_none_match,
+            cache_control="no-cache"
         )
 
     except HTTPException:
@@ -1461,7 +2176,9 @@ async def check_pronunciation(
     word: str = Form(...),
     audio_file: UploadFile = File(
         ..., description="WAV audio of user attempting word"
-    )
+    ),
+    attempt_number: int = Form(1),
+    authorization: Optional[str] = Header(None)
 ):
     """
     Check user's pronunciation of a word and provide feedback
@@ -1474,6 +2191,9 @@ async def check_pronunciation(
     Args:
         word: Target word to check pronunciation for
         audio_file: WAV audio of user's attempt
+        attempt_number: Attempt number for this word (client-tracked)
+        authorization: Optional Bearer token; attempts of signed-in
+            users are recorded
 
     Returns:
         Pronunciation check result with feedback
@@ -1497,8 +2217,20 @@ async def check_pronunciation(
 
         print(f"🎵 Audio file size: {len(audio_bytes)} bytes")
 
-        # Run pronunciation training
-        result = pronunciation_trainer.pronunciation_training(word, audio_bytes)
+        # Run pronunciation training on a recognition worker
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            recognition_executor,
+            pronunciation_trainer.pronunciation_training,
+            word,
+            audio_bytes
+        )
+
+        record_pronunciation_attempt(
+            get_user_id_from_authorization(authorization),
+            result,
+            attempt_number
+        )
 
         # Prepare response
         return PronunciationCheckResult(
@@ -1510,7 +2242,8 @@ async def check_pronunciation(
             feedback=result["feedback"],
             pronunciation_audio=result["pronunciation_audio"],
             raw_recognized=result["attempt_details"]["raw_recognized"],
-            exact_match=result["attempt_details"]["exact_match"]
+            exact_match=result["attempt_details"]["exact_match"],
+            confidence=result["confidence"]
         )
 
     except HTTPException:
@@ -1562,14 +2295,22 @@ async def compare_words(
 @app.post("/pronunciation/batch-check")
 async def batch_check_pronunciations(
     words: str = Form(..., description="JSON array of words to check"),
-    audio_files: list = []
+    audio_files: List[UploadFile] = File(
+        ..., description="WAV audio files, one per word, in the same order"
+    ),
+    authorization: Optional[str] = Header(None)
 ):
     """
     Check pronunciation for multiple words (batch operation)
 
+    All clips are decoded concurrently on the recognition workers and
+    compared with their target word; results keep the order of `words`.
+
     Args:
         words: JSON array of target words
         audio_files: List of audio files (one per word)
+        authorization: Optional Bearer token; attempts of signed-in
+            users are recorded
 
     Returns:
         List of pronunciation check results
@@ -1582,29 +2323,93 @@ async def batch_check_pronunciations(
         # Parse words JSON
         try:
             word_list = json.loads(words)
-            if not isinstance(word_list, list):
-                raise ValueError("Words must be a JSON array")
         except json.JSONDecodeError:
             detail = "Invalid JSON for words"
             raise HTTPException(status_code=400, detail=detail)
 
+        if not isinstance(word_list, list):
+            detail = "Words must be a JSON array"
+            raise HTTPException(status_code=400, detail=detail)
+
+        if len(word_list) != len(audio_files):
+            detail = (
+                f"Got {len(word_list)} words but "
+                f"{len(audio_files)} audio files"
+            )
+            raise HTTPException(status_code=400, detail=detail)
+
+        if len(word_list) > MAX_BATCH_WORDS:
+            detail = f"At most {MAX_BATCH_WORDS} words per batch"
+            raise HTTPException(status_code=400, detail=detail)
+
         print(f"📚 Batch pronunciation check for {len(word_list)} words")
 
-        results = []
-        for word in word_list:
-            if isinstance(word, str) and word.strip():
-                # For batch, we provide pronunciation
-                # and similarity without audio
-                # In production, you'd correlate audio_files with words
+        # Read all uploads first, then decode them concurrently
+        audio_list = [await f.read() for f in audio_files]
+
+        loop = asyncio.get_running_loop()
+        pending = []
+        for word, audio_bytes in zip(word_list, audio_list):
+            if not isinstance(word, str) or not word.strip():
+                pending.append(None)
+            elif len(audio_bytes) == 0:
+                pending.append(None)
+            else:
+                pending.append(loop.run_in_executor(
+                    recognition_executor,
+                    pronunciation_trainer.evaluate_attempt,
+                    word.strip(),
+                    audio_bytes
+                ))
+
+        checked = await asyncio.gather(
+            *(p for p in pending if p is not None),
+            return_exceptions=True
+        )
+        checked = iter(checked)
+        user_id = get_user_id_from_authorization(authorization)
 
+        results = []
+        for index, (word, task) in enumerate(zip(word_list, pending)):
+            if task is None:
                 results.append({
+                    "index": index,
                     "word": word,
-                    "status": "ready",
-                    "feedback": f"Ready to practice pronunciation of '{word}'"
+                    "status": "error",
+                    "feedback": "Word and audio are both required"
                 })
+                continue
 
+            result = next(checked)
+            if isinstance(result, Exception):
+                print(f"❌ Batch item {index} failed: {result}")
+                results.append({
+                    "index": index,
+                    "word": word,
+                    "status": "error",
+                    "feedback": f"Pronunciation check failed: {result}"
+                })
+                continue
+
+            record_pronunciation_attempt(user_id, result)
+            results.append({
+                "index": index,
+                "word": result["word"],
+                "status": "checked",
+                "recognized": result["recognized"],
+                "correct": result["correct"],
+                "is_correct": result["is_correct"],
+                "similarity_ratio": result["similarity_ratio"],
+                "feedback": result["feedback"],
+                "raw_recognized": result["attempt_details"]["raw_recognized"],
+                "exact_match": result["attempt_details"]["exact_match"],
+                "confidence": result["confidence"]
+            })
+
+        correct_count = sum(1 for r in results if r.get("is_correct"))
         return {
             "total_words": len(word_list),
+            "correct_words": correct_count,
             "words": results
         }
 
@@ -1615,6 +2420,241 @@ async def batch_check_pronunciations(
         raise HTTPException(status_code=500, detail=f"Batch check failed: {str(e)}")
 
 
+@app.get("/pronunciation/drill")
+async def generate_pronunciation_drill(
+    limit: int = 10,
+    min_attempts: int = 1,
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Build a pronunciation drill from the words the user struggles with
+    most, read from the per-user word mastery table.
+
+    Args:
+        limit: Number of words in the drill (1-50)
+        min_attempts: Only include words attempted at least this often
+        authorization: Authorization header with token
+        db: Database session
+
+    Returns:
+        Drill words ordered from weakest to strongest
+    """
+    try:
+        user_id = get_user_id_from_authorization(authorization)
+        if not user_id:
+            detail = "Invalid or missing token"
+            raise HTTPException(status_code=401, detail=detail)
+
+        if limit < 1 or limit > 50:
+            detail = "Limit must be between 1 and 50"
+            raise HTTPException(status_code=400, detail=detail)
+
+        weakest = WordMasteryCRUD.get_weakest_words(
+            db, user_id, limit=limit, min_attempts=min_attempts
+        )
+
+        words = []
+        for mastery in weakest:
+            entry = schemas.WordMasteryResponse.from_orm(mastery).dict()
+            entry["success_rate"] = round(
+                mastery.success_count / mastery.attempt_count, 3
+            ) if mastery.attempt_count else 0.0
+            words.append(entry)
+
+        return {
+            "user_id": user_id,
+            "total_words": len(words),
+            "words": words
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Drill Generation Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to generate drill: {str(e)}")
+
+
+# ================== Trainer Session Helpers ==================
+
+# "full" returns the complete session, "state" only its mutable fields
+SESSION_VIEWS = ("full", "state")
+
+
+def validate_session_view(view: str) -> str:
+    """Reject unknown session views with a 400"""
+    if view not in SESSION_VIEWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown view '{view}'. Available: {', '.join(SESSION_VIEWS)}"
+        )
+    return view
+
+
+SPEED_TRAINER_ACTIONS = ("start", "pause", "resume", "reset", "advance_word")
+CHUNK_READING_ACTIONS = ("start", "pause", "resume", "reset", "advance_phrase")
+MAX_BATCH_ACTIONS = 100
+
+
+def validate_actions(actions: List[str], allowed: tuple) -> List[str]:
+    """
+    Normalize actions and reject unknown ones with a 400 before any of
+    them is applied.
+
+    Args:
+        actions: Requested actions, in order
+        allowed: Actions supported by the trainer
+
+    Returns:
+        Lower-cased actions
+    """
+    normalized = [action.lower() for action in actions]
+    for action in normalized:
+        if action not in allowed:
+            raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+    return normalized
+
+
+def _apply_speed_trainer_action(trainer: SpeedTrainer, action: str) -> str:
+    """Apply one validated action to a speed trainer; returns its result"""
+    if action == "start":
+        # Mark first round as in progress
+        if trainer.session and trainer.session.rounds:
+            trainer.session.rounds[0].status = "in_progress"
+        return "Training started"
+    if action == "pause":
+        trainer.pause()
+        return "Training paused"
+    if action == "resume":
+        trainer.resume()
+        return "Training resumed"
+    if action == "reset":
+        trainer.reset()
+        return "Training reset to beginning"
+    success = trainer.advance_to_next_word()
+    return "Advanced to next word" if success else "Training complete"
+
+
+def _apply_chunk_reading_action(trainer: PhraseTrainer, action: str) -> str:
+    """Apply one validated action to a phrase trainer; returns its result"""
+    if action == "start":
+        # Mark session as started
+        return "Chunk reading started"
+    if action == "pause":
+        trainer.pause()
+        return "Training paused"
+    if action == "resume":
+        trainer.resume()
+        return "Training resumed"
+    if action == "reset":
+        trainer.reset()
+        return "Training reset to beginning"
+    success = trainer.advance_to_next_phrase()
+    return "Advanced to next phrase" if success else "Training complete"
+
+
+async def update_session(store, session_id: str, update: Callable):
+    """
+    Run a locked get → update → put cycle on a stored trainer.
+
+    Session locks block (the SQLite store waits up to its busy timeout
+    for the database write lock), so the cycle runs in the threadpool
+    instead of on the event loop.
+
+    Args:
+        store: Session store holding the trainer
+        session_id: ID of the training session
+        update: Called with the trainer; may raise HTTPException to
+            abort without saving
+
+    Returns:
+        Tuple of (trainer, update result)
+    """
+    def cycle():
+        with store.lock(session_id):
+            trainer = store.get(session_id)
+            if trainer is None:
+                raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+            result = update(trainer)
+            # Save so other workers see the change
+            store.put(session_id, trainer)
+        return trainer, result
+
+    return await run_in_threadpool(cycle)
+
+
+async def take_session(store, session_id: str):
+    """
+    Remove a trainer from its store and return it, so a session can only
+    be submitted once (a retried or double-clicked submit gets a 404
+    instead of writing a duplicate row).
+
+    Args:
+        store: Session store holding the trainer
+        session_id: ID of the training session
+
+    Returns:
+        The removed trainer
+    """
+    def take():
+        with store.lock(session_id):
+            trainer = store.get(session_id)
+            if trainer is None:
+                raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+            if not trainer.session:
+                raise HTTPException(status_code=400, detail="Session data is invalid")
+            store.delete(session_id)
+        return trainer
+
+    return await run_in_threadpool(take)
+
+
+def session_etag(state: dict, view: str) -> str:
+    """
+    Entity tag of a trainer session representation.
+
+    The static part of a session (text, words, rounds) never changes, so
+    hashing the mutable state identifies every version of both views.
+    """
+    digest = hashlib.sha1(
+        json.dumps(state, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()[:16]
+    return f'"{view}-{digest}"'
+
+
+def session_response(
+    trainer,
+    view: str,
+    if_none_match: Optional[str] = None
+) -> Response:
+    """
+    Serve trainer session data with an ETag (304 when unchanged)
+
+    Args:
+        trainer: SpeedTrainer or PhraseTrainer
+        view: "full" or "state"
+        if_none_match: Request If-None-Match header
+
+    Returns:
+        200 JSON response or 304
+    """
+    state = trainer.get_session_state()
+    etag = session_etag(state, view)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if if_none_match and etag in [
+        tag.strip() for tag in if_none_match.split(",")
+    ]:
+        return Response(status_code=304, headers=headers)
+
+    payload = state if view == "state" else trainer.get_session_data()
+    return Response(
+        content=json.dumps(payload, separators=(",", ":")),
+        media_type="application/json",
+        headers=headers
+    )
+
+
 # ================== Speed Trainer Endpoints ==================
 
 @app.post("/speed-trainer/prepare")
@@ -1645,7 +2685,7 @@ async def prepare_pace_reading_session(request: PaceReadingRequest):
         session = trainer.create_session(request.text, speeds, session_id)
 
         # Store session globally
-        speed_trainer_sessions[session_id] = trainer
+        await run_in_threadpool(speed_trainer_sessions.put, session_id, trainer)
 
         # Return session data
         session_data = trainer.get_session_data()
@@ -1653,11 +2693,12 @@ async def prepare_pace_reading_session(request: PaceReadingRequest):
 
         return PaceReadingResponse(
             text=session.text,
-            words=session.words,
+            words=list(session.words),
             total_words=session.total_words,
             speeds=speeds,
             intervals=[trainer.calculate_interval(wpm) for wpm in speeds],
-            session_id=session_id
+            session_id=session_id,
+            timeline=trainer.build_timeline(request.weighted_timeline)
         )
 
     except HTTPException:
@@ -1668,24 +2709,30 @@ async def prepare_pace_reading_session(request: PaceReadingRequest):
 
 
 @app.get("/speed-trainer/session/{session_id}")
-async def get_session_data(session_id: str):
+async def get_session_data(
+    session_id: str,
+    view: str = "full",
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get current session data (words, current position, round info)
 
     Args:
         session_id: ID of the training session
+        view: "full" for everything, "state" for position, flags and
+            round statuses only
+        if_none_match: Optional ETag for conditional requests
 
     Returns:
-        Current session state and configuration
+        Current session state and configuration (304 if unchanged)
     """
     try:
-        if session_id not in speed_trainer_sessions:
+        validate_session_view(view)
+        trainer = await run_in_threadpool(speed_trainer_sessions.get, session_id)
+        if trainer is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        trainer = speed_trainer_sessions[session_id]
-        session_data = trainer.get_session_data()
-
-        return session_data
+        return session_response(trainer, view, if_none_match)
 
     except HTTPException:
         raise
@@ -1697,7 +2744,9 @@ async def get_session_data(session_id: str):
 @app.post("/speed-trainer/action/{session_id}")
 async def perform_session_action(
     session_id: str,
-    action_request: SpeedTrainerAction
+    action_request: SpeedTrainerAction,
+    response: Response,
+    view: str = "full"
 ):
     """
     Perform action on training session.
@@ -1707,48 +2756,85 @@ async def perform_session_action(
     Args:
         session_id: ID of the training session
         action_request: Action to perform and optional session_id
+        view: "full" or "state" (mutable fields only) session_data
 
     Returns:
         Updated session state after action
     """
     try:
-        if session_id not in speed_trainer_sessions:
-            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+        validate_session_view(view)
+        action, = validate_actions([action_request.action], SPEED_TRAINER_ACTIONS)
+        trainer, result = await update_session(
+            speed_trainer_sessions,
+            session_id,
+            lambda trainer: _apply_speed_trainer_action(trainer, action)
+        )
 
-        trainer = speed_trainer_sessions[session_id]
-        action = action_request.action.lower()
+        # Return updated session data
+        state = trainer.get_session_state()
+        response.headers["ETag"] = session_etag(state, view)
+        session_data = state if view == "state" else trainer.get_session_data()
+
+        return {
+            "action": action,
+            "result": result,
+            "session_data": session_data,
+            "success": True
+        }
 
-        if action == "start":
-            # Mark first round as in progress
-            if trainer.session and trainer.session.rounds:
-                trainer.session.rounds[0].status = "in_progress"
-            result = "Training started"
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Speed Trainer Action Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to perform action: {str(e)}")
 
-        elif action == "pause":
-            trainer.pause()
-            result = "Training paused"
 
-        elif action == "resume":
-            trainer.resume()
-            result = "Training resumed"
+@app.post("/speed-trainer/actions/{session_id}")
+async def perform_session_actions(
+    session_id: str,
+    batch: TrainerActionBatch,
+    response: Response,
+    view: str = "full"
+):
+    """
+    Apply several actions to a training session atomically, in order.
 
-        elif action == "reset":
-            trainer.reset()
-            result = "Training reset to beginning"
+    All actions are validated first; they are then applied under the
+    session's lock and the session is saved once.
 
-        elif action == "advance_word":
-            success = trainer.advance_to_next_word()
-            result = "Advanced to next word" if success else "Training complete"
+    Args:
+        session_id: ID of the training session
+        batch: Actions to perform (see /speed-trainer/action)
+        view: "full" or "state" (mutable fields only) session_data
 
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+    Returns:
+        Result of every action and the final session state
+    """
+    try:
+        validate_session_view(view)
+        if not batch.actions or len(batch.actions) > MAX_BATCH_ACTIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Send between 1 and {MAX_BATCH_ACTIONS} actions"
+            )
+        actions = validate_actions(batch.actions, SPEED_TRAINER_ACTIONS)
+
+        trainer, results = await update_session(
+            speed_trainer_sessions,
+            session_id,
+            lambda trainer: [
+                _apply_speed_trainer_action(trainer, action)
+                for action in actions
+            ]
+        )
 
-        # Return updated session data
-        session_data = trainer.get_session_data()
+        state = trainer.get_session_state()
+        response.headers["ETag"] = session_etag(state, view)
+        session_data = state if view == "state" else trainer.get_session_data()
 
         return {
-            "action": action,
-            "result": result,
+            "actions": actions,
+            "results": results,
             "session_data": session_data,
             "success": True
         }
@@ -1756,8 +2842,242 @@ async def perform_session_action(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Speed Trainer Action Error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to perform action: {str(e)}")
+        print(f"❌ Speed Trainer Actions Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to perform actions: {str(e)}")
+
+
+@app.post("/speed-trainer/checkpoint/{session_id}")
+async def checkpoint_pace_reading(
+    session_id: str,
+    checkpoint: SpeedTrainerCheckpoint
+):
+    """
+    Sync the position of a client running the prepared timeline locally.
+
+    Clients call this every few seconds instead of one action per word.
+
+    Args:
+        session_id: ID of the training session
+        checkpoint: Client's current round, word index and flags
+
+    Returns:
+        Reconciled compact position
+    """
+    try:
+        def sync(trainer: SpeedTrainer):
+            if not trainer.sync_position(
+                checkpoint.round,
+                checkpoint.word_index,
+                checkpoint.is_paused,
+                checkpoint.is_completed
+            ):
+                raise HTTPException(status_code=400, detail="Position is out of range")
+
+        trainer, _ = await update_session(
+            speed_trainer_sessions, session_id, sync
+        )
+
+        return {"success": True, **trainer.get_position()}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Speed Trainer Checkpoint Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to sync checkpoint: {str(e)}")
+
+
+def _pace_state_message(trainer: SpeedTrainer) -> dict:
+    """Compact pacing state sent over the speed trainer stream"""
+    return {"type": "state", **trainer.get_position()}
+
+
+def _advance_pace(trainer: SpeedTrainer) -> Optional[dict]:
+    """
+    Advance a streamed session by one word.
+
+    Returns:
+        The tick to push, or None if the session was paused or completed
+        (e.g. by a REST action from another tab or worker)
+    """
+    session = trainer.session
+    if session is None or session.is_paused or session.is_completed:
+        return None
+
+    previous_round = session.current_round
+    if not trainer.advance_to_next_word():
+        return {"type": "complete"}
+
+    current_round = trainer.get_current_round()
+    return {
+        "type": "tick",
+        "round": session.current_round,
+        "word_index": session.current_word_index,
+        "round_changed": session.current_round != previous_round,
+        "wpm": current_round.wpm,
+        "interval_ms": current_round.interval_ms
+    }
+
+
+async def _pace_ticks(
+    websocket: WebSocket,
+    session_id: str,
+    interval_ms: float,
+    stopped: threading.Event
+):
+    """
+    Advance the session one word per round interval and push the new
+    position to the client.
+
+    Every tick is a locked load/advance/save of the stored session, so
+    REST actions, checkpoints, other workers and snapshots always see the
+    current position and are never overwritten by a stale copy. Ticks are
+    scheduled against absolute deadlines so processing and network time
+    do not accumulate into drift.
+
+    `stopped` is checked inside the locked cycle: cancelling the task
+    cannot interrupt a tick already running in the threadpool, but that
+    tick then leaves the session untouched.
+    """
+    def advance(trainer: SpeedTrainer) -> Optional[dict]:
+        if stopped.is_set():
+            return None
+        return _advance_pace(trainer)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while True:
+        deadline += interval_ms / 1000
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+        try:
+            _, tick = await update_session(
+                speed_trainer_sessions, session_id, advance
+            )
+        except HTTPException as e:
+            await websocket.send_json({"type": "error", "detail": e.detail})
+            return
+
+        if tick is None:
+            return
+        if tick["type"] == "complete":
+            await websocket.send_json(tick)
+            return
+
+        if tick["round_changed"]:
+            # _complete_round moved on to the next speed
+            await websocket.send_json({
+                "type": "round",
+                "round": tick["round"],
+                "wpm": tick["wpm"],
+                "interval_ms": tick["interval_ms"]
+            })
+
+        await websocket.send_json({
+            "type": "tick",
+            "round": tick["round"],
+            "word_index": tick["word_index"]
+        })
+        interval_ms = tick["interval_ms"]
+
+
+def _apply_pace_control(trainer: SpeedTrainer, action: str) -> Optional[float]:
+    """
+    Apply a stream control message to a speed trainer.
+
+    Returns:
+        Interval (ms) of the current round when ticking should run,
+        None when it should stop
+    """
+    if action in ("start", "resume"):
+        current_round = trainer.get_current_round()
+        if current_round is None:
+            return None
+        if current_round.status == "pending":
+            current_round.status = "in_progress"
+        trainer.resume()
+        return current_round.interval_ms
+    if action == "pause":
+        trainer.pause()
+    else:
+        trainer.reset()
+    return None
+
+
+@app.websocket("/speed-trainer/stream/{session_id}")
+async def stream_pace_reading(websocket: WebSocket, session_id: str):
+    """
+    Server-paced word highlighting for a speed trainer session.
+
+    The client sends control messages ({"action": "start" | "pause" |
+    "resume" | "reset"}); while running the server pushes
+    {"type": "tick", "round", "word_index"} at the round's interval_ms,
+    {"type": "round", ...} when a round completes and {"type": "complete"}
+    at the end. Every control message is answered with {"type": "state"}.
+    The session is never held across messages: controls and ticks each
+    load, update and save it under the session lock.
+
+    Args:
+        websocket: Client connection
+        session_id: ID of the training session
+    """
+    await websocket.accept()
+    trainer = await run_in_threadpool(speed_trainer_sessions.get, session_id)
+    if trainer is None:
+        await websocket.close(code=4404, reason=f"Session {session_id} not found")
+        return
+
+    ticker = None
+    ticker_stopped = None
+
+    async def stop_ticker():
+        nonlocal ticker
+        if ticker:
+            ticker_stopped.set()
+            ticker.cancel()
+            # Wait for a tick still running in the threadpool and collect
+            # the task's outcome (cancellation or a send error)
+            await asyncio.gather(ticker, return_exceptions=True)
+            ticker = None
+
+    try:
+        await websocket.send_json(_pace_state_message(trainer))
+        while True:
+            message = await websocket.receive_json()
+            action = str(message.get("action", "")).lower()
+
+            if action not in ("start", "resume", "pause", "reset"):
+                await websocket.send_json({
+                    "type": "error",
+                    "detail": f"Unknown action: {action}"
+                })
+                continue
+
+            if action in ("pause", "reset"):
+                await stop_ticker()
+            trainer, interval_ms = await update_session(
+                speed_trainer_sessions,
+                session_id,
+                lambda trainer: _apply_pace_control(trainer, action)
+            )
+            if interval_ms is not None and (ticker is None or ticker.done()):
+                await stop_ticker()  # Collect a ticker that ended by itself
+                ticker_stopped = threading.Event()
+                ticker = asyncio.create_task(
+                    _pace_ticks(websocket, session_id, interval_ms, ticker_stopped)
+                )
+
+            await websocket.send_json(_pace_state_message(trainer))
+
+    except WebSocketDisconnect:
+        pass
+    except HTTPException as e:
+        # Session expired or was deleted while streaming
+        await websocket.close(code=4404, reason=str(e.detail))
+    except Exception as e:
+        print(f"❌ Speed Trainer Stream Error: {e}")
+    finally:
+        # Every tick is already saved; just stop advancing
+        await stop_ticker()
 
 
 @app.get("/speed-trainer/stats/{session_id}")
@@ -1772,10 +3092,10 @@ async def get_session_stats(session_id: str):
         Session statistics (words, rounds, progress, timing)
     """
     try:
-        if session_id not in speed_trainer_sessions:
+        trainer = await run_in_threadpool(speed_trainer_sessions.get, session_id)
+        if trainer is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        trainer = speed_trainer_sessions[session_id]
         stats = trainer.get_session_stats()
 
         return stats
@@ -1791,12 +3111,19 @@ async def get_session_stats(session_id: str):
     "/speed-trainer/submit-results",
     response_model=SpeedTrainerCompletionResult
 )
-async def submit_speed_trainer_results(request: SpeedTrainerResults):
+async def submit_speed_trainer_results(
+    request: SpeedTrainerResults,
+    authorization: Optional[str] = Header(None)
+):
     """
     Submit reading completion results and calculate final WPM.
 
+    The session is closed by the submit; results of signed-in users are
+    saved to their progress.
+
     Args:
         request: Session ID and elapsed time in seconds
+        authorization: Optional Bearer token
 
     Returns:
         Completion result with calculated WPM
@@ -1805,22 +3132,25 @@ async def submit_speed_trainer_results(request: SpeedTrainerResults):
         session_id = request.session_id
         elapsed_time = request.elapsed_time_seconds
 
-        if session_id not in speed_trainer_sessions:
-            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-
-        trainer = speed_trainer_sessions[session_id]
+        user_id = get_user_id_from_authorization(authorization)
+        trainer = await take_session(speed_trainer_sessions, session_id)
         session = trainer.session
 
-        if not session:
-            detail = "Session data is invalid"
-            raise HTTPException(status_code=400, detail=detail)
-
         # Calculate WPM based on actual elapsed time
         if elapsed_time > 0:
             calculated_wpm = (session.total_words / elapsed_time) * 60
         else:
             calculated_wpm = 0
 
+        # Persist in the background; the response does not wait for it
+        speed_trainer_result_writer.put({
+            "user_id": user_id,
+            "session_text": session.text,
+            "total_words": session.total_words,
+            "elapsed_time_seconds": elapsed_time,
+            "calculated_wpm": round(calculated_wpm, 2)
+        })
+
         print("\n✅ SPEED TRAINER SESSION COMPLETED")
         print(f"   Session ID: {session_id}")
         print(f"   Total Words: {session.total_words}")
@@ -1877,7 +3207,18 @@ async def prepare_chunk_reading_session(request: ChunkReadingRequest):
         session = trainer.create_session(request.text, session_id)
 
         # Store session globally
-        phrase_trainer_sessions[session_id] = trainer
+        await run_in_threadpool(phrase_trainer_sessions.put, session_id, trainer)
+
+        # Synthesize read-along audio for every phrase in the background
+        phrases = list(session.phrases)
+        phrase_audio_urls = []
+        if tts_engine:
+            audio_urls = await run_in_threadpool(
+                tts_engine.prefetch_audio, phrases
+            )
+            phrase_audio_urls = [
+                audio_urls[phrase] for phrase in phrases
+            ]
 
         print("✅ Chunk Reading Session Created")
         print(f"   Session ID: {session_id}")
@@ -1886,11 +3227,12 @@ async def prepare_chunk_reading_session(request: ChunkReadingRequest):
 
         return ChunkReadingResponse(
             text=session.text,
-            phrases=session.phrases,
+            phrases=phrases,
             total_phrases=session.total_phrases,
             min_phrase_length=min_len,
             max_phrase_length=max_len,
-            session_id=session_id
+            session_id=session_id,
+            phrase_audio_urls=phrase_audio_urls
         )
 
     except HTTPException:
@@ -1904,33 +3246,29 @@ async def prepare_chunk_reading_session(request: ChunkReadingRequest):
     "/chunk-reading/session/{session_id}",
     response_model=ChunkReadingSession
 )
-async def get_chunk_reading_session(session_id: str):
+async def get_chunk_reading_session(
+    session_id: str,
+    view: str = "full",
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get current chunk reading session data.
 
     Args:
         session_id: ID of the training session
+        view: "full" for everything, "state" for position and flags only
+        if_none_match: Optional ETag for conditional requests
 
     Returns:
-        Current session state and configuration
+        Current session state and configuration (304 if unchanged)
     """
     try:
-        if session_id not in phrase_trainer_sessions:
+        validate_session_view(view)
+        trainer = await run_in_threadpool(phrase_trainer_sessions.get, session_id)
+        if trainer is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        trainer = phrase_trainer_sessions[session_id]
-        session_data = trainer.get_session_data()
-
-        return ChunkReadingSession(
-            text=session_data["text"],
-            phrases=session_data["phrases"],
-            total_phrases=session_data["total_phrases"],
-            current_phrase_index=session_data["current_phrase_index"],
-            current_phrase=session_data["current_phrase"],
-            is_paused=session_data["is_paused"],
-            is_completed=session_data["is_completed"],
-            session_id=session_data["session_id"]
-        )
+        return session_response(trainer, view, if_none_match)
 
     except HTTPException:
         raise
@@ -1942,7 +3280,9 @@ async def get_chunk_reading_session(session_id: str):
 @app.post("/chunk-reading/action/{session_id}")
 async def perform_chunk_reading_action(
     session_id: str,
-    action_request: ChunkReadingAction
+    action_request: ChunkReadingAction,
+    response: Response,
+    view: str = "full"
 ):
     """
     Perform action on chunk reading session.
@@ -1951,64 +3291,94 @@ async def perform_chunk_reading_action(
         session_id: ID of the training session
         action_request: Action to perform (start, pause, resume,
             reset, advance_phrase)
+        view: "full" or "state" (mutable fields only) session_data
 
     Returns:
         Updated session state after action
     """
     try:
-        if session_id not in phrase_trainer_sessions:
-            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+        validate_session_view(view)
+        action, = validate_actions([action_request.action], CHUNK_READING_ACTIONS)
+        trainer, result = await update_session(
+            phrase_trainer_sessions,
+            session_id,
+            lambda trainer: _apply_chunk_reading_action(trainer, action)
+        )
+
+        # Return updated session data
+        state = trainer.get_session_state()
+        response.headers["ETag"] = session_etag(state, view)
+        session_data = state if view == "state" else trainer.get_session_data()
 
-        trainer = phrase_trainer_sessions[session_id]
-        action = action_request.action.lower()
+        return {
+            "action": action,
+            "result": result,
+            "session_data": session_data,
+            "success": True
+        }
 
-        if action == "start":
-            # Mark session as started
-            result = "Chunk reading started"
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"❌ Chunk Reading Action Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to perform action: {str(e)}")
 
-        elif action == "pause":
-            trainer.pause()
-            result = "Training paused"
 
-        elif action == "resume":
-            trainer.resume()
-            result = "Training resumed"
+@app.post("/chunk-reading/actions/{session_id}")
+async def perform_chunk_reading_actions(
+    session_id: str,
+    batch: TrainerActionBatch,
+    response: Response,
+    view: str = "full"
+):
+    """
+    Apply several actions to a chunk reading session atomically, in order.
 
-        elif action == "reset":
-            trainer.reset()
-            result = "Training reset to beginning"
+    All actions are validated first; they are then applied under the
+    session's lock and the session is saved once.
 
-        elif action == "advance_phrase":
-            success = trainer.advance_to_next_phrase()
-            result = "Advanced to next phrase" if success else "Training complete"
+    Args:
+        session_id: ID of the training session
+        batch: Actions to perform (see /chunk-reading/action)
+        view: "full" or "state" (mutable fields only) session_data
 
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+    Returns:
+        Result of every action and the final session state
+    """
+    try:
+        validate_session_view(view)
+        if not batch.actions or len(batch.actions) > MAX_BATCH_ACTIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Send between 1 and {MAX_BATCH_ACTIONS} actions"
+            )
+        actions = validate_actions(batch.actions, CHUNK_READING_ACTIONS)
+
+        trainer, results = await update_session(
+            phrase_trainer_sessions,
+            session_id,
+            lambda trainer: [
+                _apply_chunk_reading_action(trainer, action)
+                for action in actions
+            ]
+        )
 
-        # Return updated session data
-        session_data = trainer.get_session_data()
+        state = trainer.get_session_state()
+        response.headers["ETag"] = session_etag(state, view)
+        session_data = state if view == "state" else trainer.get_session_data()
 
         return {
-            "action": action,
-            "result": result,
-            "session_data": {
-                "text": session_data["text"],
-                "phrases": session_data["phrases"],
-                "total_phrases": session_data["total_phrases"],
-                "current_phrase_index": session_data["current_phrase_index"],
-                "current_phrase": session_data["current_phrase"],
-                "is_paused": session_data["is_paused"],
-                "is_completed": session_data["is_completed"],
-                "session_id": session_data["session_id"]
-            },
+            "actions": actions,
+            "results": results,
+            "session_data": session_data,
             "success": True
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Chunk Reading Action Error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to perform action: {str(e)}")
+        print(f"❌ Chunk Reading Actions Error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to perform actions: {str(e)}")
 
 
 @app.get("/chunk-reading/stats/{session_id}", response_model=ChunkReadingStats)
@@ -2023,10 +3393,10 @@ async def get_chunk_reading_stats(session_id: str):
         Session statistics (phrases, progress, completion)
     """
     try:
-        if session_id not in phrase_trainer_sessions:
+        trainer = await run_in_threadpool(phrase_trainer_sessions.get, session_id)
+        if trainer is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        trainer = phrase_trainer_sessions[session_id]
         stats = trainer.get_session_stats()
 
         return ChunkReadingStats(
@@ -2048,12 +3418,19 @@ async def get_chunk_reading_stats(session_id: str):
     "/chunk-reading/submit-results",
     response_model=ChunkReadingCompletionResult
 )
-async def submit_chunk_reading_results(request: ChunkReadingResults):
+async def submit_chunk_reading_results(
+    request: ChunkReadingResults,
+    authorization: Optional[str] = Header(None)
+):
     """
     Submit chunk reading completion results and calculate metrics.
 
+    The session is closed by the submit; results of signed-in users are
+    saved to their progress.
+
     Args:
         request: Session ID and elapsed time in seconds
+        authorization: Optional Bearer token
 
     Returns:
         Completion result with calculated WPM and phrases/second
@@ -2062,18 +3439,12 @@ async def submit_chunk_reading_results(request: ChunkReadingResults):
         session_id = request.session_id
         elapsed_time = request.elapsed_time_seconds
 
-        if session_id not in phrase_trainer_sessions:
-            raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-
-        trainer = phrase_trainer_sessions[session_id]
+        user_id = get_user_id_from_authorization(authorization)
+        trainer = await take_session(phrase_trainer_sessions, session_id)
         session = trainer.session
 
-        if not session:
-            detail = "Session data is invalid"
-            raise HTTPException(status_code=400, detail=detail)
-
         # Count total words in all phrases
-        total_words = sum(len(phrase.split()) for phrase in session.phrases)
+        total_words = len(session.offsets) // 2
 
         # Calculate metrics based on actual elapsed time
         if elapsed_time > 0:
@@ -2083,6 +3454,17 @@ async def submit_chunk_reading_results(request: ChunkReadingResults):
             calculated_wpm = 0
             phrases_per_second = 0
 
+        # Persist in the background; the response does not wait for it
+        chunk_reading_result_writer.put({
+            "user_id": user_id,
+            "session_text": session.text,
+            "total_phrases": session.total_phrases,
+            "total_words": total_words,
+            "elapsed_time_seconds": elapsed_time,
+            "calculated_wpm": round(calculated_wpm, 2),
+            "phrases_per_second": round(phrases_per_second, 2)
+        })
+
         print("\n✅ CHUNK READING SESSION COMPLETED")
         print(f"   Session ID: {session_id}")
         print(f"   Total Phrases: {session.total_phrases}")
@@ -0,0 +1,292 @@
+"""
+Assessment Recording Segments Module
+
+Keeps the PCM audio of recent /assess recordings in memory for a short
+time so the clip of each misread or skipped word can be replayed or
+re-checked by the pronunciation trainer without another upload.
+
+Features:
+- Bounded in-memory recording store (max entries + idle TTL)
+- Lazy Vosk word-timestamp decoding (only when segments are requested)
+- Alignment of timed words against the reference paragraph
+- Zero-copy PCM slices wrapped in a WAV header for playback
+"""
+
+import io
+import json
+import struct
+import threading
+import time
+import uuid
+import wave
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+
+from vosk import KaldiRecognizer
+from text_comparison import clean_text
+
+
+# Padding added around each word span so clips do not start mid-phoneme
+SEGMENT_PADDING_SECONDS = 0.15
+
+# Minimum clip length for skipped words (they have no span of their own)
+MISSING_WORD_WINDOW_SECONDS = 0.5
+
+
+class AssessmentRecording:
+    """PCM audio and word timings of a single assessment recording"""
+
+    def __init__(
+        self,
+        recording_id: str,
+        pcm: bytes,
+        sample_rate: int,
+        sample_width: int,
+        channels: int,
+        reference_text: str
+    ):
+        self.recording_id = recording_id
+        self.pcm = pcm
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.reference_text = reference_text
+        self.word_timings: Optional[List[Dict]] = None
+        self.segments: Optional[List[Dict]] = None
+        self.last_access = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def duration_seconds(self) -> float:
+        """Length of the recording in seconds"""
+        frame_bytes = self.sample_width * self.channels
+        return len(self.pcm) / (frame_bytes * self.sample_rate)
+
+    def slice(self, start: float, end: float) -> memoryview:
+        """
+        Get the PCM between two timestamps without copying.
+
+        Args:
+            start: Start time in seconds
+            end: End time in seconds
+
+        Returns:
+            memoryview over the recording's PCM buffer
+        """
+        frame_bytes = self.sample_width * self.channels
+        first = max(0, int(start * self.sample_rate)) * frame_bytes
+        last = min(len(self.pcm), int(end * self.sample_rate) * frame_bytes)
+        return memoryview(self.pcm)[first:max(first, last)]
+
+    def wav_header(self, data_size: int) -> bytes:
+        """
+        Build a PCM WAV header for a slice of this recording.
+
+        Args:
+            data_size: Size of the PCM payload in bytes
+
+        Returns:
+            44-byte RIFF/WAVE header
+        """
+        block_align = self.sample_width * self.channels
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align,
+            self.sample_width * 8,
+            b'data', data_size
+        )
+
+
+class AssessmentRecordingStore:
+    """
+    Bounded, thread-safe store of recent assessment recordings.
+
+    Recordings are dropped after `ttl_seconds` without access, and the
+    least recently used one is evicted once `max_recordings` is reached.
+    """
+
+    def __init__(self, max_recordings: int = 200, ttl_seconds: int = 900):
+        self.max_recordings = max_recordings
+        self.ttl_seconds = ttl_seconds
+        self._recordings: "OrderedDict[str, AssessmentRecording]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def add(
+        self, audio_bytes: bytes, reference_text: str
+    ) -> Optional[AssessmentRecording]:
+        """
+        Keep a WAV recording for later segment extraction.
+
+        Args:
+            audio_bytes: WAV audio uploaded to /assess
+            reference_text: Paragraph the user read
+
+        Returns:
+            The stored recording, or None if the audio is not PCM WAV
+        """
+        try:
+            with wave.open(io.BytesIO(audio_bytes), 'rb') as wav_file:
+                if wav_file.getcomptype() != 'NONE':
+                    return None
+                recording = AssessmentRecording(
+                    recording_id=str(uuid.uuid4())[:8],
+                    pcm=wav_file.readframes(wav_file.getnframes()),
+                    sample_rate=wav_file.getframerate(),
+                    sample_width=wav_file.getsampwidth(),
+                    channels=wav_file.getnchannels(),
+                    reference_text=reference_text
+                )
+        except (wave.Error, EOFError):
+            return None
+
+        with self._lock:
+            self._prune()
+            self._recordings[recording.recording_id] = recording
+            while len(self._recordings) > self.max_recordings:
+                self._recordings.popitem(last=False)
+        return recording
+
+    def get(self, recording_id: str) -> Optional[AssessmentRecording]:
+        """Get a recording by ID (None if unknown or expired)"""
+        with self._lock:
+            self._prune()
+            recording = self._recordings.get(recording_id)
+            if recording:
+                recording.last_access = time.monotonic()
+                self._recordings.move_to_end(recording_id)
+            return recording
+
+    def __len__(self) -> int:
+        return len(self._recordings)
+
+    def _prune(self):
+        """Drop recordings idle for longer than the TTL (lock held)"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._recordings:
+            oldest = next(iter(self._recordings.values()))
+            if oldest.last_access >= cutoff:
+                break
+            self._recordings.popitem(last=False)
+
+
+def decode_word_timings(model, recording: AssessmentRecording) -> List[Dict]:
+    """
+    Decode a recording with Vosk and return per-word timestamps.
+
+    Args:
+        model: Loaded Vosk Model
+        recording: Recording to decode
+
+    Returns:
+        List of {"word", "start", "end", "conf"} dicts in spoken order
+    """
+    recognizer = KaldiRecognizer(model, recording.sample_rate)
+    recognizer.SetWords(True)
+
+    timings = []
+    chunk_size = 4096 * recording.sample_width * recording.channels
+    pcm = memoryview(recording.pcm)
+    for offset in range(0, len(pcm), chunk_size):
+        if recognizer.AcceptWaveform(bytes(pcm[offset:offset + chunk_size])):
+            timings.extend(json.loads(recognizer.Result()).get("result", []))
+    timings.extend(json.loads(recognizer.FinalResult()).get("result", []))
+    return timings
+
+
+def align_error_segments(
+    reference_text: str, word_timings: List[Dict], duration: float
+) -> List[Dict]:
+    """
+    Locate the audio span of every misread or skipped reference word.
+
+    Args:
+        reference_text: Paragraph the user should have read
+        word_timings: Timed words from decode_word_timings
+        duration: Length of the recording in seconds
+
+    Returns:
+        List of segments ordered by position in the paragraph, each with
+        index, type ("wrong" or "missing"), expected, spoken, start, end
+    """
+    ref = clean_text(reference_text).split()
+    timed = [w for w in word_timings if clean_text(w.get("word", ""))]
+    spoken = [clean_text(w["word"]) for w in timed]
+
+    def gap_span(j: int):
+        # Span between the spoken words around a skipped reference word
+        start = timed[j - 1]["end"] if j > 0 else 0.0
+        end = timed[j]["start"] if j < len(timed) else duration
+        if end - start < MISSING_WORD_WINDOW_SECONDS:
+            middle = (start + end) / 2
+            start = middle - MISSING_WORD_WINDOW_SECONDS / 2
+            end = middle + MISSING_WORD_WINDOW_SECONDS / 2
+        return start, end
+
+    segments = []
+    matcher = SequenceMatcher(None, ref, spoken, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "replace":
+            for k in range(i2 - i1):
+                if j1 + k < j2:
+                    word = timed[j1 + k]
+                    start, end = word["start"], word["end"]
+                    segment_type, said = "wrong", spoken[j1 + k]
+                else:
+                    start, end = gap_span(j2)
+                    segment_type, said = "missing", ""
+                segments.append({
+                    "type": segment_type,
+                    "expected": ref[i1 + k],
+                    "spoken": said,
+                    "start": start,
+                    "end": end
+                })
+        elif tag == "delete":
+            start, end = gap_span(j1)
+            for k in range(i1, i2):
+                segments.append({
+                    "type": "missing",
+                    "expected": ref[k],
+                    "spoken": "",
+                    "start": start,
+                    "end": end
+                })
+
+    for index, segment in enumerate(segments):
+        segment["index"] = index
+        segment["start"] = round(
+            max(0.0, segment["start"] - SEGMENT_PADDING_SECONDS), 3
+        )
+        segment["end"] = round(
+            min(duration, segment["end"] + SEGMENT_PADDING_SECONDS), 3
+        )
+    return segments
+
+
+def get_segments(model, recording: AssessmentRecording) -> List[Dict]:
+    """
+    Get (and cache) the error segments of a recording, decoding word
+    timings on first use.
+
+    Args:
+        model: Loaded Vosk Model
+        recording: Recording to segment
+
+    Returns:
+        List of error segments (see align_error_segments)
+    """
+    with recording.lock:
+        if recording.segments is None:
+            if recording.word_timings is None:
+                recording.word_timings = decode_word_timings(model, recording)
+            recording.segments = align_error_segments(
+                recording.reference_text,
+                recording.word_timings,
+                recording.duration_seconds
+            )
+        return recording.segments
@@ -0,0 +1,172 @@
+"""
+Audio Output Profiles Module
+
+Converts the WAV files written by the system TTS voice (often 22.05 kHz
+or higher, sometimes stereo) into compact profiles for delivery:
+
+- "wav":       unchanged system output
+- "pcm16_16k": 16 kHz mono 16-bit PCM
+- "pcm16_8k":  8 kHz mono 16-bit PCM
+- "mulaw_8k":  8 kHz mono 8-bit G.711 mu-law (WAV format tag 7)
+"""
+
+import io
+import struct
+import wave
+from typing import Dict
+
+import numpy as np
+
+
+AUDIO_PROFILES: Dict[str, Dict] = {
+    "wav": {"sample_rate": None, "encoding": None},
+    "pcm16_16k": {"sample_rate": 16000, "encoding": "pcm16"},
+    "pcm16_8k": {"sample_rate": 8000, "encoding": "pcm16"},
+    "mulaw_8k": {"sample_rate": 8000, "encoding": "mulaw"},
+}
+
+# Taps of the anti-aliasing filter applied before downsampling
+LOWPASS_TAPS = 63
+
+
+def read_wav_mono(wav_bytes: bytes):
+    """
+    Decode a PCM WAV file into mono float samples.
+
+    Args:
+        wav_bytes: PCM WAV file (8, 16, 24 or 32-bit)
+
+    Returns:
+        Tuple of (float32 samples in [-1, 1], sample_rate)
+    """
+    with wave.open(io.BytesIO(wav_bytes), 'rb') as wav_file:
+        channels = wav_file.getnchannels()
+        width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32)
+                   - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768.0
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        ints = (raw[:, 0].astype(np.int32)
+                | (raw[:, 1].astype(np.int32) << 8)
+                | (raw[:, 2].astype(np.int32) << 16))
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608.0
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {width}")
+
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels]
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, sample_rate
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample mono float samples (windowed-sinc low-pass + interpolation).
+
+    Args:
+        samples: Mono float samples
+        source_rate: Sample rate of the input
+        target_rate: Wanted sample rate
+
+    Returns:
+        Resampled float32 samples
+    """
+    if source_rate == target_rate or len(samples) == 0:
+        return samples.astype(np.float32)
+
+    if target_rate < source_rate:
+        # Remove content above the new Nyquist frequency to avoid aliasing
+        cutoff = target_rate / source_rate / 2
+        n = np.arange(LOWPASS_TAPS) - (LOWPASS_TAPS - 1) / 2
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(LOWPASS_TAPS)
+        samples = np.convolve(samples, taps / taps.sum(), mode='same')
+
+    duration = len(samples) / source_rate
+    target_count = max(1, int(round(duration * target_rate)))
+    source_times = np.arange(len(samples)) / source_rate
+    target_times = np.arange(target_count) / target_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def encode_mulaw(samples: np.ndarray) -> bytes:
+    """
+    Encode float samples as G.711 mu-law bytes.
+
+    Args:
+        samples: Mono float samples in [-1, 1]
+
+    Returns:
+        One byte per sample
+    """
+    pcm = np.clip(samples * 32768.0, -32768, 32767).astype(np.int32)
+    # 14-bit magnitude with the G.711 bias; negative codes drop the sign bit
+    value = pcm >> 2
+    mask = np.where(value < 0, 0x7F, 0xFF)
+    value = np.minimum(np.abs(value), 8158) + 33
+    exponent = np.floor(np.log2(value)).astype(np.int32) - 5
+    mantissa = (value >> (exponent + 1)) & 0x0F
+    encoded = ((exponent << 4) | mantissa) ^ mask
+    return encoded.astype(np.uint8).tobytes()
+
+
+def mulaw_wav_header(data_size: int, sample_rate: int) -> bytes:
+    """
+    Build a WAV header for mono mu-law data (the wave module only
+    writes integer PCM).
+
+    Args:
+        data_size: Size of the mu-law payload in bytes
+        sample_rate: Sample rate of the payload
+
+    Returns:
+        58-byte RIFF/WAVE header (fmt + fact + data chunk headers)
+    """
+    return struct.pack(
+        '<4sI4s4sIHHIIHHH4sII4sI',
+        b'RIFF', 50 + data_size, b'WAVE',
+        b'fmt ', 18, 7, 1, sample_rate, sample_rate, 1, 8, 0,
+        b'fact', 4, data_size,
+        b'data', data_size
+    )
+
+
+def convert_wav(wav_bytes: bytes, profile: str) -> bytes:
+    """
+    Convert a WAV file to an output profile.
+
+    Args:
+        wav_bytes: PCM WAV file from the TTS worker
+        profile: Key of AUDIO_PROFILES
+
+    Returns:
+        WAV file in the requested profile
+    """
+    settings = AUDIO_PROFILES[profile]
+    if settings["encoding"] is None:
+        return wav_bytes
+
+    samples, source_rate = read_wav_mono(wav_bytes)
+    target_rate = settings["sample_rate"]
+    samples = resample(samples, source_rate, target_rate)
+
+    if settings["encoding"] == "mulaw":
+        data = encode_mulaw(samples)
+        return mulaw_wav_header(len(data), target_rate) + data
+
+    pcm = np.clip(samples * 32768.0, -32768, 32767).astype('<i2')
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(target_rate)
+        wav_file.writeframes(pcm.tobytes())
+    return output.getvalue()
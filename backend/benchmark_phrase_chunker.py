@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Benchmark the phrase chunker on paragraph- to book-length input"""
+
+import sys
+import time
+
+import phrase_trainer
+from phrase_trainer import PhraseTrainer, chunk_text
+from age_based_paragraphs import AGE_BASED_PARAGRAPHS
+
+MAX_WORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+SIZES = [size for size in (1000, 10000, 100000, 200000, 500000)
+         if size <= MAX_WORDS]
+
+library = [p for paragraphs in AGE_BASED_PARAGRAPHS.values() for p in paragraphs]
+corpus_words = " ".join(library).split()
+
+
+def book(word_count):
+    # Repeat the paragraph library until the text has word_count words
+    repeats = word_count // len(corpus_words) + 1
+    return " ".join((corpus_words * repeats)[:word_count])
+
+
+print("=" * 60)
+print("Phrase Chunker Benchmark")
+print("=" * 60)
+
+print("Cold chunking (cache cleared each run):")
+for size in SIZES:
+    text = book(size)
+    phrase_trainer._chunk_cache.clear()
+    start = time.perf_counter()
+    offsets, boundaries = chunk_text(text, 2, 4)
+    elapsed = time.perf_counter() - start
+    print(f"  {size:>7} words  {elapsed * 1000:9.1f} ms  "
+          f"{size / elapsed / 1e6:5.2f} M words/s  "
+          f"({len(boundaries) - 1} phrases)")
+
+print("Session creation for library paragraphs:")
+runs = 20
+for label, clear in (("cold", True), ("cached", False)):
+    start = time.perf_counter()
+    for _ in range(runs):
+        if clear:
+            phrase_trainer._chunk_cache.clear()
+        for paragraph in library:
+            PhraseTrainer().create_session(paragraph)
+    elapsed = time.perf_counter() - start
+    per_session = elapsed / (runs * len(library)) * 1e6
+    print(f"  {label:<7} {per_session:7.1f} us/session")
+
+print("=" * 60)
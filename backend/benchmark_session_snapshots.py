@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark session snapshots: put overhead, snapshot time and restore time"""
+
+import os
+import sys
+import tempfile
+import time
+
+from session_store import SessionSnapshot, SessionStore
+from speed_trainer import SpeedTrainer
+from phrase_trainer import PhraseTrainer
+from age_based_paragraphs import AGE_BASED_PARAGRAPHS
+
+SESSIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+LIMITS = dict(max_entries=SESSIONS * 2, max_bytes=1 << 40)
+
+library = [p for paragraphs in AGE_BASED_PARAGRAPHS.values() for p in paragraphs]
+path = os.path.join(tempfile.mkdtemp(), "session_snapshots.db")
+
+
+def make_trainers():
+    # Half speed trainer, half phrase trainer sessions over library paragraphs
+    trainers = []
+    for i in range(SESSIONS):
+        text = library[i % len(library)]
+        if i % 2:
+            trainer = PhraseTrainer()
+        else:
+            trainer = SpeedTrainer()
+        trainer.create_session(text)
+        trainers.append((f"session-{i}", trainer))
+    return trainers
+
+
+def snapshots(table):
+    return (
+        SessionSnapshot(path, f"snapshot_{table}_speed",
+                        SpeedTrainer.to_state, SpeedTrainer.from_state),
+        SessionSnapshot(path, f"snapshot_{table}_phrase",
+                        PhraseTrainer.to_state, PhraseTrainer.from_state),
+    )
+
+
+def stores(snapshot_pair):
+    speed, phrase = snapshot_pair or (None, None)
+    return (SessionStore("speed", snapshot=speed, **LIMITS),
+            SessionStore("phrase", snapshot=phrase, **LIMITS))
+
+
+def fill(store_pair, trainers):
+    start = time.perf_counter()
+    for i, (session_id, trainer) in enumerate(trainers):
+        store_pair[i % 2].put(session_id, trainer)
+    return time.perf_counter() - start
+
+
+print("=" * 60)
+print(f"Session Snapshot Benchmark ({SESSIONS} sessions)")
+print("=" * 60)
+
+trainers = make_trainers()
+
+plain = stores(None)
+elapsed = fill(plain, trainers)
+print(f"put, no snapshots      {elapsed / SESSIONS * 1e6:7.2f} us/session")
+
+live = stores(snapshots("bench"))
+elapsed = fill(live, trainers)
+print(f"put, snapshots on      {elapsed / SESSIONS * 1e6:7.2f} us/session")
+
+start = time.perf_counter()
+written = sum(store.write_snapshot() for store in live)
+elapsed = time.perf_counter() - start
+print(f"full snapshot          {elapsed * 1000:7.1f} ms "
+      f"({written} sessions, {os.path.getsize(path) / 1e6:.1f} MB file)")
+
+# Typical tick: a few percent of sessions changed since the last snapshot
+changed = trainers[:SESSIONS // 50]
+for i, (session_id, trainer) in enumerate(changed):
+    live[i % 2].put(session_id, trainer)
+start = time.perf_counter()
+written = sum(store.write_snapshot() for store in live)
+elapsed = time.perf_counter() - start
+print(f"incremental snapshot   {elapsed * 1000:7.1f} ms ({written} dirty sessions)")
+
+# Simulated restart: a fresh store on the same file restores on first get
+restarted = stores(snapshots("bench"))
+start = time.perf_counter()
+first = restarted[0].get(trainers[0][0])
+elapsed = time.perf_counter() - start
+assert first is not None and first.text == trainers[0][1].text
+print(f"first restore          {elapsed * 1e6:7.1f} us")
+
+start = time.perf_counter()
+for i, (session_id, _) in enumerate(trainers):
+    assert restarted[i % 2].get(session_id) is not None
+elapsed = time.perf_counter() - start
+print(f"restore all            {elapsed * 1000:7.1f} ms "
+      f"({elapsed / SESSIONS * 1e6:.1f} us/session)")
+
+start = time.perf_counter()
+for i, (session_id, _) in enumerate(trainers):
+    restarted[i % 2].get(session_id)
+elapsed = time.perf_counter() - start
+print(f"get after restore      {elapsed / SESSIONS * 1e6:7.2f} us/session")
+
+print("=" * 60)
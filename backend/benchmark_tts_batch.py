@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Benchmark batched TTS synthesis against single-word synthesis"""
+
+import sys
+import time
+
+from text_to_speech import DyslexiaAssistanceEngine
+from tts_cache import TTSAudioCache
+from age_based_paragraphs import AGE_BASED_PARAGRAPHS
+from text_comparison import clean_text
+
+WORD_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+BATCH_SIZES = [4, 8, 16]
+
+words = sorted({
+    word
+    for paragraphs in AGE_BASED_PARAGRAPHS.values()
+    for paragraph in paragraphs
+    for word in clean_text(paragraph).split()
+})[:WORD_COUNT]
+
+print("=" * 60)
+print(f"TTS Batch Benchmark ({len(words)} words)")
+print("=" * 60)
+
+
+def fresh_engine():
+    # Memory-only cache so every run synthesizes every word
+    engine = DyslexiaAssistanceEngine(cache=TTSAudioCache(), pool_size=1)
+    engine.pool.warm_up()
+    return engine
+
+
+def report(label, elapsed, audio):
+    ok = sum(1 for data in audio if data)
+    print(f"  {label:<22} {elapsed:6.2f}s  "
+          f"{len(words) / elapsed:7.1f} words/s  ({ok}/{len(words)} ok)")
+
+
+engine = fresh_engine()
+start = time.time()
+audio = [engine.generate_audio_file(word)[0] for word in words]
+report("single-word", time.time() - start, audio)
+engine.shutdown()
+
+for batch_size in BATCH_SIZES:
+    engine = fresh_engine()
+    start = time.time()
+    audio = engine.generate_audio_batch(words, batch_size=batch_size)
+    report(f"batch (size {batch_size})", time.time() - start, audio.values())
+    engine.shutdown()
+
+print("=" * 60)
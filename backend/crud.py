@@ -5,13 +5,15 @@ Data Access Layer (DAL) for the application
 
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func, and_
+from sqlalchemy.dialects import postgresql, sqlite
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+import hashlib
 
 from models import (
     User, Assessment, AssessmentResult, PronunciationAttempt,
     PronunciationCheck, ProgressHistory, SpeedTrainerSession,
-    ChunkReadingSession
+    ChunkReadingSession, WordMastery, Paragraph
 )
 from auth_utils import hash_password
 import schemas
@@ -193,6 +195,14 @@ class PronunciationCRUD:
         db.refresh(db_attempt)
         return db_attempt
 
+    @staticmethod
+    def create_attempts_bulk(db: Session, attempts: List[dict]) -> int:
+        """Insert many pronunciation attempts and update word mastery"""
+        db.bulk_insert_mappings(PronunciationAttempt, attempts)
+        WordMasteryCRUD.apply_attempts(db, attempts)
+        db.commit()
+        return len(attempts)
+
     @staticmethod
     def get_word_attempts(db: Session, user_id: int, word: str) -> List[PronunciationAttempt]:
         """Get all attempts for a specific word by user"""
@@ -233,6 +243,117 @@ class PronunciationCRUD:
         ).all()
 
 
+# ================== Word Mastery Operations ==================
+
+class WordMasteryCRUD:
+    # Weight of the newest attempt in the moving similarity average
+    EMA_ALPHA = 0.3
+
+    @staticmethod
+    def apply_attempts(db: Session, attempts: List[dict]) -> None:
+        """
+        Fold pronunciation attempts into word_mastery with one upsert per
+        (user, word). Attempts must be in chronological order; the caller
+        commits.
+        """
+        alpha = WordMasteryCRUD.EMA_ALPHA
+        grouped = {}
+        for attempt in attempts:
+            key = (attempt["user_id"], attempt["word"])
+            grouped.setdefault(key, []).append(attempt)
+
+        dialect = db.get_bind().dialect.name
+        for (user_id, word), rows in grouped.items():
+            count = len(rows)
+            successes = sum(1 for r in rows if r["is_correct"])
+            last_seen = max(r["created_at"] for r in rows)
+            ratios = [r["similarity_ratio"] or 0.0 for r in rows]
+
+            # EMA over this batch: new = old * decay + contribution
+            decay = (1 - alpha) ** count
+            contribution = sum(
+                alpha * (1 - alpha) ** (count - i) * x
+                for i, x in enumerate(ratios, 1)
+            )
+            # A brand-new row starts its average at the first ratio
+            first_ema = ratios[0] * (1 - alpha) ** (count - 1) + sum(
+                alpha * (1 - alpha) ** (count - i) * x
+                for i, x in enumerate(ratios[1:], 2)
+            )
+
+            values = dict(
+                user_id=user_id,
+                word=word,
+                attempt_count=count,
+                success_count=successes,
+                ema_similarity=first_ema,
+                last_seen=last_seen
+            )
+            updates = dict(
+                attempt_count=WordMastery.attempt_count + count,
+                success_count=WordMastery.success_count + successes,
+                ema_similarity=(
+                    WordMastery.ema_similarity * decay + contribution
+                ),
+                last_seen=last_seen
+            )
+
+            if dialect in ("postgresql", "sqlite"):
+                insert = (
+                    postgresql.insert if dialect == "postgresql"
+                    else sqlite.insert
+                )
+                stmt = insert(WordMastery).values(**values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["user_id", "word"], set_=updates
+                )
+                db.execute(stmt)
+                continue
+
+            # Generic fallback: read-modify-write
+            db_mastery = db.query(WordMastery).filter(
+                and_(WordMastery.user_id == user_id, WordMastery.word == word)
+            ).with_for_update().first()
+            if db_mastery:
+                db_mastery.attempt_count += count
+                db_mastery.success_count += successes
+                db_mastery.ema_similarity = (
+                    db_mastery.ema_similarity * decay + contribution
+                )
+                db_mastery.last_seen = last_seen
+            else:
+                db.add(WordMastery(**values))
+
+    @staticmethod
+    def get_weakest_words(db: Session, user_id: int, limit: int = 10, min_attempts: int = 1) -> List[WordMastery]:
+        """Get the user's words with the lowest moving similarity"""
+        return db.query(WordMastery).filter(
+            and_(
+                WordMastery.user_id == user_id,
+                WordMastery.attempt_count >= min_attempts
+            )
+        ).order_by(
+            WordMastery.ema_similarity,
+            desc(WordMastery.last_seen)
+        ).limit(limit).all()
+
+    @staticmethod
+    def get_word_mastery(db: Session, user_id: int, word: str) -> Optional[WordMastery]:
+        """Get the user's mastery record for a single word"""
+        return db.query(WordMastery).filter(
+            and_(WordMastery.user_id == user_id, WordMastery.word == word)
+        ).first()
+
+    @staticmethod
+    def get_error_counts(db: Session) -> dict:
+        """Get the number of failed attempts per word across all users"""
+        errors = func.sum(WordMastery.attempt_count - WordMastery.success_count)
+        rows = db.query(WordMastery.word, errors).group_by(
+            WordMastery.word
+        ).all()
+        return {word: int(count or 0) for word, count in rows}
+
+
 # ================== Progress History Operations ==================
 
 class ProgressCRUD:
@@ -314,15 +435,63 @@ class ProgressCRUD:
         ).order_by(desc(ProgressHistory.created_at)).limit(limit).all()
 
 
+# ================== Paragraph Operations ==================
+
+class ParagraphCRUD:
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Hash identifying a paragraph text"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_or_create_ids(db: Session, texts: Iterable[str]) -> Dict[str, int]:
+        """Map texts to paragraph ids, inserting unknown texts (not committed)"""
+        by_hash = {ParagraphCRUD.text_hash(text): text for text in texts}
+        if not by_hash:
+            return {}
+
+        ids = {
+            text_hash: paragraph_id
+            for paragraph_id, text_hash in db.query(
+                Paragraph.id, Paragraph.text_hash
+            ).filter(Paragraph.text_hash.in_(list(by_hash)))
+        }
+        missing = [
+            Paragraph(text_hash=text_hash, text=text)
+            for text_hash, text in by_hash.items() if text_hash not in ids
+        ]
+        if missing:
+            db.add_all(missing)
+            db.flush()
+            ids.update({paragraph.text_hash: paragraph.id for paragraph in missing})
+
+        return {text: ids[text_hash] for text_hash, text in by_hash.items()}
+
+
+def _with_paragraph_ids(db: Session, sessions: List[dict]) -> List[dict]:
+    """Replace session_text in session rows by a paragraph_id reference"""
+    paragraph_ids = ParagraphCRUD.get_or_create_ids(
+        db, (session["session_text"] for session in sessions)
+    )
+    return [
+        {
+            **{k: v for k, v in session.items() if k != "session_text"},
+            "paragraph_id": paragraph_ids[session["session_text"]]
+        }
+        for session in sessions
+    ]
+
+
 # ================== Speed Trainer Operations ==================
 
 class SpeedTrainerCRUD:
     @staticmethod
     def create_session(db: Session, session_data: schemas.SpeedTrainerSessionCreate, user_id: Optional[int] = None) -> SpeedTrainerSession:
         """Create speed trainer session"""
+        paragraph_ids = ParagraphCRUD.get_or_create_ids(db, [session_data.session_text])
         db_session = SpeedTrainerSession(
             user_id=user_id,
-            session_text=session_data.session_text,
+            paragraph_id=paragraph_ids[session_data.session_text],
             total_words=session_data.total_words,
             elapsed_time_seconds=session_data.elapsed_time_seconds,
             calculated_wpm=session_data.calculated_wpm
@@ -332,6 +501,13 @@ class SpeedTrainerCRUD:
         db.refresh(db_session)
         return db_session
 
+    @staticmethod
+    def create_sessions_bulk(db: Session, sessions: List[dict]) -> int:
+        """Insert many completed sessions (rows with session_text)"""
+        db.bulk_insert_mappings(SpeedTrainerSession, _with_paragraph_ids(db, sessions))
+        db.commit()
+        return len(sessions)
+
     @staticmethod
     def get_session_by_id(db: Session, session_id: int) -> Optional[SpeedTrainerSession]:
         """Get speed trainer session by ID"""
@@ -351,9 +527,10 @@ class ChunkReadingCRUD:
     @staticmethod
     def create_session(db: Session, session_data: schemas.ChunkReadingSessionCreate, user_id: Optional[int] = None) -> ChunkReadingSession:
         """Create chunk reading session"""
+        paragraph_ids = ParagraphCRUD.get_or_create_ids(db, [session_data.session_text])
         db_session = ChunkReadingSession(
             user_id=user_id,
-            session_text=session_data.session_text,
+            paragraph_id=paragraph_ids[session_data.session_text],
             total_phrases=session_data.total_phrases,
             total_words=session_data.total_words,
             elapsed_time_seconds=session_data.elapsed_time_seconds,
@@ -365,6 +542,13 @@ class ChunkReadingCRUD:
         db.refresh(db_session)
         return db_session
 
+    @staticmethod
+    def create_sessions_bulk(db: Session, sessions: List[dict]) -> int:
+        """Insert many completed sessions (rows with session_text)"""
+        db.bulk_insert_mappings(ChunkReadingSession, _with_paragraph_ids(db, sessions))
+        db.commit()
+        return len(sessions)
+
     @staticmethod
     def get_session_by_id(db: Session, session_id: int) -> Optional[ChunkReadingSession]:
         """Get chunk reading session by ID"""
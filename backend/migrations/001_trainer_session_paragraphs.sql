@@ -0,0 +1,31 @@
+-- Trainer session rows reference a shared paragraphs table instead of
+-- copying the paragraph text into every row.
+--
+-- New databases get this schema from init_db() (create_all). Run this
+-- once on databases created before paragraph_id existed:
+--   psql -U dyslexia_user -d dyslexia_db -f migrations/001_trainer_session_paragraphs.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS paragraphs (
+    id SERIAL PRIMARY KEY,
+    text_hash VARCHAR(64) NOT NULL,
+    text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS ix_paragraphs_id ON paragraphs (id);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_paragraphs_text_hash ON paragraphs (text_hash);
+
+ALTER TABLE speed_trainer_sessions
+    ADD COLUMN IF NOT EXISTS paragraph_id INTEGER REFERENCES paragraphs (id),
+    ALTER COLUMN session_text DROP NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_speed_trainer_sessions_paragraph_id
+    ON speed_trainer_sessions (paragraph_id);
+
+ALTER TABLE chunk_reading_sessions
+    ADD COLUMN IF NOT EXISTS paragraph_id INTEGER REFERENCES paragraphs (id),
+    ALTER COLUMN session_text DROP NOT NULL;
+CREATE INDEX IF NOT EXISTS ix_chunk_reading_sessions_paragraph_id
+    ON chunk_reading_sessions (paragraph_id);
+
+COMMIT;
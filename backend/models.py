@@ -5,7 +5,7 @@ Database schema definition
 
 from sqlalchemy import (
     Column, Integer, String, Float, Text, DateTime,
-    Boolean, ForeignKey, JSON
+    Boolean, ForeignKey, JSON, Index, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -41,6 +41,11 @@ class User(Base):
         back_populates="user",
         cascade="all, delete-orphan"
     )
+    word_mastery = relationship(
+        "WordMastery",
+        back_populates="user",
+        cascade="all, delete-orphan"
+    )
     progress_history = relationship(
         "ProgressHistory",
         back_populates="user",
@@ -151,6 +156,31 @@ class PronunciationAttempt(Base):
         return f"<PronunciationAttempt(word='{self.word}')>"
 
 
+class WordMastery(Base):
+    """Per-user pronunciation mastery of a word, updated on every attempt"""
+    __tablename__ = "word_mastery"
+    __table_args__ = (
+        UniqueConstraint("user_id", "word", name="uq_word_mastery_user_word"),
+        # Serves "top N weakest words for a user" without a sort
+        Index("ix_word_mastery_user_similarity", "user_id", "ema_similarity"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    word = Column(String(100), nullable=False)
+    attempt_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    # Exponential moving average of similarity_ratio (0.0 to 1.0)
+    ema_similarity = Column(Float, nullable=False, default=0.0)
+    last_seen = Column(DateTime, server_default=func.now())
+
+    # Relationships
+    user = relationship("User", back_populates="word_mastery")
+
+    def __repr__(self):
+        return f"<WordMastery(user_id={self.user_id}, word='{self.word}')>"
+
+
 class PronunciationCheck(Base):
     """Pronunciation check validation during assessment"""
     __tablename__ = "pronunciation_checks"
@@ -208,6 +238,21 @@ class ProgressHistory(Base):
         return f"<ProgressHistory(user_id={self.user_id}, week={week})>"
 
 
+# ================== Paragraph Models ==================
+
+class Paragraph(Base):
+    """Distinct texts read in trainer sessions (stored once)"""
+    __tablename__ = "paragraphs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    text_hash = Column(String(64), unique=True, nullable=False, index=True)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<Paragraph(id={self.id}, hash={self.text_hash[:8]})>"
+
+
 # ================== Speed Trainer Models ==================
 
 class SpeedTrainerSession(Base):
@@ -216,13 +261,19 @@ class SpeedTrainerSession(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    session_text = Column(Text, nullable=False)
+    paragraph_id = Column(
+        Integer, ForeignKey("paragraphs.id"), nullable=True, index=True
+    )
+    # Only set on rows written before paragraph_id existed
+    session_text = Column(Text, nullable=True)
     total_words = Column(Integer, nullable=False)
     elapsed_time_seconds = Column(Float, nullable=True)
     calculated_wpm = Column(Float, nullable=True)
     session_date = Column(DateTime, server_default=func.now())
     created_at = Column(DateTime, server_default=func.now())
 
+    paragraph = relationship("Paragraph")
+
     def __repr__(self):
         return f"<SpeedTrainerSession(wpm={self.calculated_wpm})>"
 
@@ -235,7 +286,11 @@ class ChunkReadingSession(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    session_text = Column(Text, nullable=False)
+    paragraph_id = Column(
+        Integer, ForeignKey("paragraphs.id"), nullable=True, index=True
+    )
+    # Only set on rows written before paragraph_id existed
+    session_text = Column(Text, nullable=True)
     total_phrases = Column(Integer, nullable=False)
     total_words = Column(Integer, nullable=False)
     elapsed_time_seconds = Column(Float, nullable=True)
@@ -244,5 +299,7 @@ class ChunkReadingSession(Base):
     session_date = Column(DateTime, server_default=func.now())
     created_at = Column(DateTime, server_default=func.now())
 
+    paragraph = relationship("Paragraph")
+
     def __repr__(self):
         return f"<ChunkReadingSession(wpm={self.calculated_wpm})>"
@@ -13,10 +13,180 @@ Features:
 """
 
 import re
-from typing import List, Dict, Optional
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 import json
 
+from text_tokens import (
+    PhraseView, WordView, word_offsets, pack_offsets, unpack_offsets
+)
+
+
+# Punctuation after a word that marks a natural phrase boundary
+BOUNDARY_PUNCTUATION = frozenset('.!?,;:')
+
+# Words that usually start a new phrase (conjunctions, prepositions,
+# relative pronouns): break before them once a phrase is long enough
+BREAK_BEFORE_WORDS = frozenset({
+    "and", "but", "or", "nor", "so", "yet", "because", "although", "though",
+    "while", "when", "where", "whenever", "if", "unless", "until", "since",
+    "after", "before", "then", "that", "which", "who", "whom", "whose",
+    "about", "above", "across", "against", "along", "among", "around", "at",
+    "behind", "below", "beneath", "beside", "between", "beyond", "by",
+    "down", "during", "for", "from", "in", "inside", "into", "near", "of",
+    "off", "on", "onto", "out", "outside", "over", "past", "through",
+    "to", "toward", "towards", "under", "up", "upon", "with", "within",
+    "without"
+})
+
+# Words that should not end a phrase (articles, determiners, possessives)
+NO_BREAK_AFTER_WORDS = frozenset({
+    "a", "an", "the", "this", "that", "these", "those", "my", "your", "his",
+    "her", "its", "our", "their", "some", "any", "each", "every", "no",
+    "very", "to"
+})
+
+# Chunkings of recently prepared paragraphs, keyed by
+# (text hash, min_length, max_length)
+CHUNK_CACHE_SIZE = 1024
+_chunk_cache: "OrderedDict[tuple, Tuple[array, array]]" = OrderedDict()
+_chunk_cache_lock = threading.Lock()
+
+
+def chunk_boundaries(
+    words: Sequence[str],
+    punctuated: Sequence[bool],
+    min_length: int,
+    max_length: int
+) -> array:
+    """
+    Group words into phrases in linear time.
+
+    A phrase ends when it reaches max_length, or once it has min_length
+    words: at punctuation, before a word that usually starts a phrase, or
+    early when the rest of the clause would not fit but can form a phrase
+    of its own. Phrases do not end on articles or determiners unless full.
+    A short tail is kept with the previous phrase when that fits within
+    max_length.
+
+    Args:
+        words: Cleaned words
+        punctuated: Whether boundary punctuation follows each word
+        min_length: Minimum words per phrase
+        max_length: Maximum words per phrase
+
+    Returns:
+        array('I') where phrase i spans words [b[i], b[i + 1])
+    """
+    count = len(words)
+    boundaries = array('I', [0])
+    if not count:
+        return boundaries
+
+    # Words after each word up to the end of its clause (next punctuation)
+    clause_rest = [0] * count
+    clause_end = count - 1
+    for idx in range(count - 1, -1, -1):
+        if punctuated[idx]:
+            clause_end = idx
+        clause_rest[idx] = clause_end - idx
+
+    start = 0
+    for idx in range(count - 1):
+        length = idx - start + 1
+        if length >= max_length:
+            split = True
+        elif length < min_length:
+            split = False
+        elif punctuated[idx]:
+            split = True
+        else:
+            word = words[idx].lower()
+            next_word = words[idx + 1].lower()
+            rest = clause_rest[idx]
+            if word in NO_BREAK_AFTER_WORDS:
+                split = False
+            elif length + rest > max_length and min_length <= rest <= max_length:
+                # The clause does not fit in this phrase: end it at the
+                # last point that leaves a full phrase, or earlier where the
+                # next phrase starts naturally
+                split = (
+                    rest == min_length
+                    or next_word in BREAK_BEFORE_WORDS
+                    or next_word in NO_BREAK_AFTER_WORDS
+                )
+            else:
+                # Only where the rest of the clause can form a phrase, so
+                # the next phrase does not run past the punctuation
+                split = next_word in BREAK_BEFORE_WORDS and rest >= min_length
+
+        remaining = count - idx - 1
+        if (split and length < max_length and remaining < min_length
+                and length + remaining <= max_length):
+            # Keep the short tail with this phrase
+            split = False
+
+        if split:
+            boundaries.append(idx + 1)
+            start = idx + 1
+
+    if (len(boundaries) > 1 and count - start < min_length
+            and count - boundaries[-2] <= max_length):
+        # Merge a short final phrase into the previous one
+        boundaries.pop()
+    boundaries.append(count)
+    return boundaries
+
+
+def chunk_text(text: str, min_length: int, max_length: int) -> Tuple[array, array]:
+    """
+    Tokenize and chunk a text, reusing cached results for paragraphs seen
+    before.
+
+    Args:
+        text: Raw text
+        min_length: Minimum words per phrase
+        max_length: Maximum words per phrase
+
+    Returns:
+        (word offsets, phrase boundaries) arrays (shared; do not modify)
+    """
+    key = (hashlib.sha1(text.encode('utf-8')).digest(), min_length, max_length)
+    with _chunk_cache_lock:
+        cached = _chunk_cache.get(key)
+        if cached is not None:
+            _chunk_cache.move_to_end(key)
+            return cached
+
+    offsets = word_offsets(text)
+    text_length = len(text)
+    punctuated = []
+    for end in offsets[1::2]:
+        # Trailing punctuation stripped from the word runs up to the
+        # next whitespace
+        found = False
+        while end < text_length and not text[end].isspace():
+            if text[end] in BOUNDARY_PUNCTUATION:
+                found = True
+            end += 1
+        punctuated.append(found)
+
+    result = (
+        offsets,
+        chunk_boundaries(
+            WordView(text, offsets), punctuated, min_length, max_length
+        )
+    )
+    with _chunk_cache_lock:
+        _chunk_cache[key] = result
+        while len(_chunk_cache) > CHUNK_CACHE_SIZE:
+            _chunk_cache.popitem(last=False)
+    return result
+
 
 @dataclass
 class PhraseChunk:
@@ -26,17 +196,32 @@ class PhraseChunk:
     position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkReadingSession:
-    """Represents a phrase training session"""
+    """
+    Represents a phrase training session.
+
+    The text is stored once; words are [start, end) offsets into it and
+    phrases are word-index boundaries, so phrase strings are only built
+    when accessed.
+    """
     text: str
-    phrases: List[str]
-    total_phrases: int
+    offsets: array  # array('I') of word start/end offsets
+    boundaries: array  # array('I'): phrase i spans words [b[i], b[i + 1])
     current_phrase_index: int = 0
     is_paused: bool = False
     is_completed: bool = False
     session_id: str = ""
 
+    @property
+    def phrases(self) -> PhraseView:
+        """Phrases of the text (built on access)"""
+        return PhraseView(WordView(self.text, self.offsets), self.boundaries)
+
+    @property
+    def total_phrases(self) -> int:
+        return max(0, len(self.boundaries) - 1)
+
 
 class PhraseTrainer:
     """
@@ -49,6 +234,8 @@ class PhraseTrainer:
     # Default phrase length configuration
     MIN_PHRASE_LENGTH = 2  # Minimum words per phrase
     MAX_PHRASE_LENGTH = 4  # Maximum words per phrase
+
+    __slots__ = ("text", "min_length", "max_length", "phrases", "session")
     
     def __init__(self, text: str = "", min_length: int = 2, max_length: int = 4):
         """
@@ -160,13 +347,11 @@ class PhraseTrainer:
         """
         Intelligently chunk words into phrases respecting sentence structure.
         
-        This method tries to:
-        1. Respect natural phrase boundaries (punctuation)
-        2. Keep phrase lengths between min and max
-        3. Create readable, meaningful chunks
+        Breaks at punctuation and before conjunctions/prepositions while
+        keeping phrase lengths between min and max (see chunk_boundaries).
         
         Args:
-            words: List of words
+            words: List of words (may keep trailing punctuation)
             
         Returns:
             List of phrase chunks
@@ -174,62 +359,19 @@ class PhraseTrainer:
         if not words:
             return []
         
-        if len(words) <= self.max_length:
-            return [' '.join(words)]
-        
-        phrases = []
-        current_chunk = []
-        
-        for idx, word in enumerate(words):
-            current_chunk.append(word)
-            chunk_len = len(current_chunk)
-            
-            # Always finalize if we reach max length
-            should_finalize = chunk_len >= self.max_length
-            
-            # Check for natural boundaries (punctuation)
-            has_terminal_punctuation = word.endswith(('.', '!', '?', ',', ':', ';'))
-            
-            # Finalize if we have terminal punctuation and minimum length
-            if has_terminal_punctuation and chunk_len >= self.min_length:
-                should_finalize = True
-            
-            # Check if we're at the last word
-            is_last_word = idx == len(words) - 1
-            
-            # Finalize if minimum length reached and next chunk would be short
-            remaining_words = len(words) - (idx + 1)
-            if chunk_len >= self.min_length and remaining_words > 0:
-                if remaining_words <= 2 and chunk_len < self.max_length:
-                    # Might combine later words
-                    pass
-            
-            if should_finalize or is_last_word:
-                if current_chunk:
-                    phrases.append(' '.join(current_chunk))
-                    current_chunk = []
-        
-        # Handle any remaining words
-        if current_chunk:
-            if phrases and len(current_chunk) < self.min_length:
-                # Append remaining short chunk to previous phrase
-                phrases[-1] = phrases[-1] + ' ' + ' '.join(current_chunk)
-            else:
-                phrases.append(' '.join(current_chunk))
-        
-        # Ensure no phrase exceeds max length
-        final_phrases = []
-        for phrase in phrases:
-            phrase_words = phrase.split()
-            if len(phrase_words) <= self.max_length:
-                final_phrases.append(phrase)
-            else:
-                # Split long phrase into max-length chunks
-                for i in range(0, len(phrase_words), self.max_length):
-                    chunk = ' '.join(phrase_words[i:i + self.max_length])
-                    final_phrases.append(chunk)
-        
-        return final_phrases if final_phrases else [' '.join(words)]
+        punctuated = [
+            word[-1] in BOUNDARY_PUNCTUATION for word in words
+        ]
+        cleaned = [
+            word.rstrip('.!?,;:"\')]}»') or word for word in words
+        ]
+        boundaries = chunk_boundaries(
+            cleaned, punctuated, self.min_length, self.max_length
+        )
+        return [
+            ' '.join(words[boundaries[i]:boundaries[i + 1]])
+            for i in range(len(boundaries) - 1)
+        ]
     
     def prepare_text(self, text: str) -> List[str]:
         """
@@ -241,14 +383,11 @@ class PhraseTrainer:
         Returns:
             List of phrase chunks
         """
-        # Step 1: Split into words
-        words = self.split_into_words(text)
-        
-        if not words:
+        if not text or not text.strip():
             return []
         
-        # Step 2: Group into meaningful phrases
-        self.phrases = self.smart_chunk_words(words)
+        offsets, boundaries = chunk_text(text, self.min_length, self.max_length)
+        self.phrases = list(PhraseView(WordView(text, offsets), boundaries))
         
         return self.phrases
     
@@ -264,24 +403,25 @@ class PhraseTrainer:
             ChunkReadingSession object
         """
         self.text = text
-        self.phrases = self.prepare_text(text)
+        offsets, boundaries = chunk_text(text, self.min_length, self.max_length)
         
-        if not self.phrases:
+        if not offsets:
             raise ValueError("Text must contain at least one word")
         
         # Create session
         self.session = ChunkReadingSession(
             text=text,
-            phrases=self.phrases,
-            total_phrases=len(self.phrases),
+            offsets=offsets,
+            boundaries=boundaries,
             session_id=session_id
         )
+        self.phrases = self.session.phrases
         
         return self.session
     
     def get_current_phrase(self) -> Optional[str]:
         """Get the currently highlighted phrase"""
-        if not self.session or self.session.current_phrase_index >= len(self.session.phrases):
+        if not self.session or self.session.current_phrase_index >= self.session.total_phrases:
             return None
         return self.session.phrases[self.session.current_phrase_index]
     
@@ -298,7 +438,7 @@ class PhraseTrainer:
         self.session.current_phrase_index += 1
         
         # Check if we've completed the session
-        if self.session.current_phrase_index >= len(self.session.phrases):
+        if self.session.current_phrase_index >= self.session.total_phrases:
             self.session.is_completed = True
             return False
         
@@ -327,6 +467,52 @@ class PhraseTrainer:
             return True
         return False
     
+    def to_state(self) -> list:
+        """
+        Serialize the session compactly (for shared session stores).
+
+        Returns:
+            JSON-compatible list
+        """
+        session = self.session
+        return [
+            session.text,
+            pack_offsets(session.offsets),
+            pack_offsets(session.boundaries),
+            self.min_length,
+            self.max_length,
+            session.current_phrase_index,
+            int(session.is_paused),
+            int(session.is_completed),
+            session.session_id
+        ]
+
+    @classmethod
+    def from_state(cls, state: list) -> "PhraseTrainer":
+        """
+        Rebuild a trainer from to_state() output.
+
+        Args:
+            state: Serialized session
+
+        Returns:
+            PhraseTrainer with the restored session
+        """
+        (text, offsets, boundaries, min_length, max_length,
+         current_phrase_index, is_paused, is_completed, session_id) = state
+        trainer = cls(text, min_length, max_length)
+        trainer.session = ChunkReadingSession(
+            text=text,
+            offsets=unpack_offsets(offsets),
+            boundaries=unpack_offsets(boundaries),
+            current_phrase_index=current_phrase_index,
+            is_paused=bool(is_paused),
+            is_completed=bool(is_completed),
+            session_id=session_id
+        )
+        trainer.phrases = trainer.session.phrases
+        return trainer
+
     def get_session_data(self) -> Dict:
         """
         Get the current session data as a dictionary.
@@ -339,7 +525,7 @@ class PhraseTrainer:
         
         return {
             "text": self.session.text,
-            "phrases": self.session.phrases,
+            "phrases": list(self.session.phrases),
             "total_phrases": self.session.total_phrases,
             "current_phrase_index": self.session.current_phrase_index,
             "current_phrase": self.get_current_phrase(),
@@ -348,6 +534,25 @@ class PhraseTrainer:
             "session_id": self.session.session_id
         }
     
+    def get_session_state(self) -> Dict:
+        """
+        Get only the mutable part of the session (for clients that already
+        have the text and phrases).
+
+        Returns:
+            Dictionary with position and flags
+        """
+        if not self.session:
+            return {}
+
+        return {
+            "current_phrase_index": self.session.current_phrase_index,
+            "current_phrase": self.get_current_phrase(),
+            "is_paused": self.session.is_paused,
+            "is_completed": self.session.is_completed,
+            "session_id": self.session.session_id
+        }
+
     def get_session_stats(self) -> Dict:
         """
         Get statistics about the training session.
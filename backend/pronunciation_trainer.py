@@ -11,11 +11,24 @@ Provides functionality to help users learn correct pronunciation of words they m
 import io
 import json
 import wave
-from typing import Dict, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional
 from vosk import Model, KaldiRecognizer
 import difflib
 
 
+# Letter pairs that beginning and dyslexic readers commonly confuse.
+# Used to build the phonetic neighbors of a target word for
+# grammar-limited single-word recognition.
+CONFUSABLE_LETTERS = {
+    "b": "dp", "d": "bt", "p": "bq", "q": "p",
+    "m": "nw", "n": "mu", "u": "n", "w": "m",
+    "f": "v", "v": "f", "s": "z", "z": "s",
+    "g": "k", "k": "g", "t": "d",
+}
+
+
 class PronunciationTrainer:
     """
     Manages pronunciation training for individual words.
@@ -33,6 +46,49 @@ class PronunciationTrainer:
         self.vosk_model = vosk_model
         self.tts_engine = tts_engine
         self.max_attempts = 3
+        # Decode single-word attempts against a small grammar
+        self.single_word_mode = True
+        self.max_neighbors = 12
+        # Recognizers are not thread-safe, so each recognition worker
+        # thread keeps its own and resets it between clips
+        self._local = threading.local()
+        # Grammar recognizers kept per thread (drills retry the same words)
+        self.max_grammar_recognizers = 32
+    
+    def _get_recognizer(self, sample_rate: int,
+                        grammar: Optional[str] = None) -> KaldiRecognizer:
+        """
+        Get a reusable recognizer for the calling thread.
+        
+        Args:
+            sample_rate: Sample rate of the audio to decode
+            grammar: Optional JSON list of allowed words
+            
+        Returns:
+            KaldiRecognizer ready to accept a new utterance
+        """
+        recognizers = getattr(self._local, "recognizers", None)
+        if recognizers is None:
+            recognizers = self._local.recognizers = OrderedDict()
+        
+        key = (sample_rate, grammar)
+        recognizer = recognizers.get(key)
+        if recognizer is None:
+            if grammar is None:
+                recognizer = KaldiRecognizer(self.vosk_model, sample_rate)
+            else:
+                recognizer = KaldiRecognizer(
+                    self.vosk_model, sample_rate, grammar
+                )
+                recognizer.SetWords(True)
+            recognizers[key] = recognizer
+            grammar_keys = [k for k in recognizers if k[1] is not None]
+            if len(grammar_keys) > self.max_grammar_recognizers:
+                del recognizers[grammar_keys[0]]
+        else:
+            recognizer.Reset()
+            recognizers.move_to_end(key)
+        return recognizer
     
     def normalize_word(self, word: str) -> str:
         """
@@ -46,6 +102,21 @@ class PronunciationTrainer:
         """
         return word.lower().strip()
     
+    def pronunciation_audio_url(self, word: str) -> str:
+        """
+        Get the URL of a word's cached pronunciation clip.
+        
+        Args:
+            word: Word to pronounce
+            
+        Returns:
+            Audio URL (synthesized first if needed), or '' if unavailable
+        """
+        if not self.tts_engine:
+            print(f"⚠️ TTS engine not available, cannot pronounce '{word}'")
+            return ''
+        return self.tts_engine.ensure_audio_url(word)
+    
     def speak_word(self, word: str, rate: int = 100) -> Tuple[bytes, str]:
         """
         Convert a word to speech using TTS engine.
@@ -62,7 +133,9 @@ class PronunciationTrainer:
             return b'', ''
         
         try:
-            audio_bytes, audio_base64 = self.tts_engine.generate_audio_file(word)
+            audio_bytes, audio_base64 = self.tts_engine.generate_audio_file(
+                word, rate=rate
+            )
             if audio_bytes:
                 print(f"✅ Generated pronunciation for '{word}'")
                 return audio_bytes, audio_base64
@@ -99,8 +172,8 @@ class PronunciationTrainer:
                     
                     print(f"🎵 Processing audio: {duration:.2f}s @ {sample_rate}Hz")
                     
-                    # Create recognizer
-                    recognizer = KaldiRecognizer(self.vosk_model, sample_rate)
+                    # Reuse this thread's recognizer for the sample rate
+                    recognizer = self._get_recognizer(sample_rate)
                     
                     # Feed audio to recognizer
                     audio_stream.seek(0)
@@ -138,6 +211,136 @@ class PronunciationTrainer:
             print(f"❌ Error processing audio: {e}")
             return ""
     
+    def get_phonetic_neighbors(self, word: str) -> list:
+        """
+        Build words that sound or look close to the target word.
+        Candidates come from confusable letter swaps, adjacent letter
+        transpositions, dropped letters and full reversal ("was"/"saw"),
+        and are kept only if the Vosk model knows them.
+        
+        Args:
+            word: Target word (normalized)
+            
+        Returns:
+            List of neighbor words, excluding the target itself
+        """
+        candidates = []
+        for i, ch in enumerate(word):
+            for swap in CONFUSABLE_LETTERS.get(ch, ""):
+                candidates.append(word[:i] + swap + word[i + 1:])
+            if i + 1 < len(word):
+                candidates.append(
+                    word[:i] + word[i + 1] + word[i] + word[i + 2:]
+                )
+            if len(word) > 2:
+                candidates.append(word[:i] + word[i + 1:])
+        candidates.append(word[::-1])
+        
+        neighbors = []
+        seen = {word}
+        for candidate in candidates:
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            if self.vosk_model.find_word(candidate) >= 0:
+                neighbors.append(candidate)
+                if len(neighbors) >= self.max_neighbors:
+                    break
+        return neighbors
+    
+    def listen_single_word(
+        self,
+        audio_bytes: bytes,
+        target_word: str
+    ) -> Tuple[str, Optional[float]]:
+        """
+        Fast path for recognizing one spoken word.
+        
+        The recognizer grammar is limited to the target word, its
+        phonetic neighbors and "[unk]", audio is fed in 100 ms chunks,
+        and decoding stops at the first endpoint after speech.
+        Falls back to open-vocabulary decoding when the target word is
+        not in the model vocabulary.
+        
+        Args:
+            audio_bytes: Raw WAV audio data from user
+            target_word: Word the user was asked to say
+            
+        Returns:
+            Tuple of (recognized_word, confidence); confidence is None
+            when the open-vocabulary fallback was used
+        """
+        target = self.normalize_word(target_word)
+        if (not self.single_word_mode or " " in target
+                or self.vosk_model.find_word(target) < 0):
+            return self.listen_word(audio_bytes), None
+        
+        if len(audio_bytes) < 100:
+            print(f"⚠️ Audio too short ({len(audio_bytes)} bytes)")
+            return "", None
+        
+        try:
+            with wave.open(io.BytesIO(audio_bytes), 'rb') as wav_file:
+                sample_rate = wav_file.getframerate()
+                channels = wav_file.getnchannels()
+                sample_width = wav_file.getsampwidth()
+                pcm = memoryview(wav_file.readframes(wav_file.getnframes()))
+        except Exception as e:
+            print(f"❌ Error parsing audio: {e}")
+            return "", None
+        
+        # Vosk decodes mono 16-bit PCM only
+        if channels != 1 or sample_width != 2:
+            print(
+                f"❌ Unsupported audio: {channels} channels, "
+                f"{sample_width * 8}-bit (expected mono 16-bit PCM)"
+            )
+            return "", None
+        frame_bytes = sample_width * channels
+        
+        grammar = [target] + self.get_phonetic_neighbors(target) + ["[unk]"]
+        recognizer = self._get_recognizer(sample_rate, json.dumps(grammar))
+        
+        chunk_size = max(1, sample_rate // 10) * frame_bytes
+        result = None
+        fed = 0
+        for offset in range(0, len(pcm), chunk_size):
+            fed = offset + chunk_size
+            if recognizer.AcceptWaveform(bytes(pcm[offset:fed])):
+                candidate = json.loads(recognizer.Result())
+                # An endpoint with only "[unk]" is breath or noise before
+                # the word - keep listening
+                if self._spoken_words(candidate):
+                    # Endpoint after speech - the word is complete
+                    result = candidate
+                    break
+        
+        if result is None:
+            result = json.loads(recognizer.FinalResult())
+        
+        words = self._spoken_words(result)
+        if not words:
+            print("❌ No speech recognized")
+            return "", 0.0
+        
+        # Grade the first word the child said, not any word that matches
+        # ("hat cat" is not a correct "cat")
+        best = words[0]
+        confidence = round(float(best.get("conf", 0.0)), 3)
+        decoded_ms = min(fed, len(pcm)) * 1000 // (frame_bytes * sample_rate)
+        print(
+            f"✅ Recognized: '{best['word']}' (conf {confidence}, "
+            f"decoded {decoded_ms} ms of audio)"
+        )
+        return best["word"], confidence
+    
+    @staticmethod
+    def _spoken_words(result: Dict) -> List[Dict]:
+        """Recognized words of a Vosk result, without "[unk]" entries"""
+        return [
+            w for w in result.get("result", []) if w.get("word") != "[unk]"
+        ]
+    
     def check_pronunciation(self, recognized_word: str, correct_word: str) -> Dict:
         """
         Compare recognized word with the correct word.
@@ -239,43 +442,58 @@ class PronunciationTrainer:
         print(f"🎯 PRONUNCIATION TRAINING: '{word}'")
         print(f"{'='*60}")
         
-        # Step 1: Pronounce the word
+        # Step 1: Pronounce the word (cached clip, returned by URL)
         print(f"\n1️⃣ Speaking the word...")
-        audio_bytes, audio_base64 = self.speak_word(word)
+        audio_url = self.pronunciation_audio_url(word)
         
-        # Step 2: Listen to user's attempt
-        print(f"2️⃣ Analyzing user's pronunciation...")
-        recognized_word = self.listen_word(user_audio_bytes)
+        # Steps 2-3: Listen to user's attempt and compare
+        result = self.evaluate_attempt(word, user_audio_bytes)
+        result["pronunciation_audio"] = audio_url  # For "Hear it" button response
+        
+        print(f"\n📊 RESULT:")
+        print(f"   Recognized: {result['recognized']}")
+        print(f"   Correct: {result['correct']}")
+        print(f"   Match: {result['is_correct']}")
+        print(f"   Similarity: {result['similarity_ratio']}")
+        print(f"\n💬 FEEDBACK: {result['feedback']}")
+        print(f"{'='*60}\n")
+        
+        return result
+    
+    def evaluate_attempt(self, word: str, user_audio_bytes: bytes) -> Dict:
+        """
+        Recognize a single attempt and compare it with the target word.
+        Unlike pronunciation_training, no reference audio is synthesized.
+        
+        Args:
+            word: Target word
+            user_audio_bytes: Raw WAV audio from user's attempt
+            
+        Returns:
+            Dict with comparison results and attempt details
+        """
+        print(f"2️⃣ Analyzing user's pronunciation of '{word}'...")
+        recognized_word, confidence = self.listen_single_word(
+            user_audio_bytes, word
+        )
         
-        # Step 3: Compare pronunciation
         print(f"3️⃣ Comparing pronunciation...")
         comparison = self.check_pronunciation(recognized_word, word)
         
-        # Step 4: Return results
-        result = {
+        return {
             "word": word,
             "is_correct": comparison["is_correct"],
             "recognized": comparison["normalized_recognized"],
             "correct": comparison["normalized_correct"],
             "similarity_ratio": comparison["similarity_ratio"],
             "feedback": comparison["feedback"],
-            "pronunciation_audio": audio_base64,  # For "Hear it" button response
+            "confidence": confidence,
             "attempt_details": {
                 "raw_recognized": recognized_word,
                 "exact_match": comparison["is_exact_match"],
                 "similarity_ratio": comparison["similarity_ratio"]
             }
         }
-        
-        print(f"\n📊 RESULT:")
-        print(f"   Recognized: {comparison['normalized_recognized']}")
-        print(f"   Correct: {comparison['normalized_correct']}")
-        print(f"   Match: {result['is_correct']}")
-        print(f"   Similarity: {comparison['similarity_ratio']}")
-        print(f"\n💬 FEEDBACK: {comparison['feedback']}")
-        print(f"{'='*60}\n")
-        
-        return result
     
     def training_session(
         self,
@@ -142,6 +142,18 @@ class PronunciationAttemptResponse(BaseModel):
         from_attributes = True
 
 
+class WordMasteryResponse(BaseModel):
+    """Schema for a user's mastery of one word"""
+    word: str
+    attempt_count: int
+    success_count: int
+    ema_similarity: float
+    last_seen: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 # ================== Pronunciation Check Schemas ==================
 
 class PronunciationCheckCreate(BaseModel):
@@ -202,7 +214,8 @@ class SpeedTrainerSessionCreate(BaseModel):
 class SpeedTrainerSessionResponse(BaseModel):
     """Schema for speed trainer session response"""
     id: int
-    session_text: str
+    paragraph_id: Optional[int] = None
+    session_text: Optional[str] = None
     total_words: int
     calculated_wpm: Optional[float] = None
     created_at: datetime
@@ -226,7 +239,8 @@ class ChunkReadingSessionCreate(BaseModel):
 class ChunkReadingSessionResponse(BaseModel):
     """Schema for chunk reading session response"""
     id: int
-    session_text: str
+    paragraph_id: Optional[int] = None
+    session_text: Optional[str] = None
     total_phrases: int
     total_words: int
     calculated_wpm: Optional[float] = None
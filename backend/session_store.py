@@ -0,0 +1,935 @@
+"""
+Session Store Module
+
+Bounded, thread-safe store for in-progress trainer sessions (speed
+trainer, chunk reading). Sessions are dropped after `ttl_seconds` without
+access, and the least recently used ones are evicted once the store holds
+more than `max_entries` sessions or `max_bytes` of (estimated) memory.
+A background sweeper removes expired sessions even when no requests
+arrive.
+
+Two backends share the same interface:
+
+- SessionStore: live objects in process memory (default, single worker),
+  optionally snapshotted to a local SQLite file (SessionSnapshot) so
+  sessions survive restarts; snapshots are restored lazily on first access
+- SQLiteSessionStore: compact serialized sessions in a local SQLite file
+  in WAL mode, shared by all uvicorn workers on the host
+
+Callers must put() a session again after mutating it so shared backends
+see the change; wrapping get/mutate/put in `with store.lock(session_id)`
+makes the update atomic. Locks block, so async code should run the
+locked cycle in a worker thread. create_session_store() picks the backend
+from the environment.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a SQLite connection in autocommit mode with WAL enabled"""
+    connection = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # Sessions are ephemeral: skip the fsync on every commit
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def approximate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estimate the memory held by an object graph (strings, containers,
+    arrays, dataclasses and plain or __slots__ objects).
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(
+            approximate_size(k, _seen) + approximate_size(v, _seen)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(approximate_size(item, _seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += approximate_size(vars(obj), _seen)
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                size += approximate_size(getattr(obj, name), _seen)
+    return size
+
+
+class _Entry:
+    """A stored session with its bookkeeping"""
+
+    __slots__ = ("value", "size", "last_access", "lock")
+
+    def __init__(self, value: Any, size: int):
+        self.value = value
+        self.size = size
+        self.last_access = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class SessionSnapshot:
+    """
+    Snapshot of session states in a local SQLite file. Each session is one
+    row holding its zlib-compressed compact JSON state, replaced whenever
+    the session changed since the previous snapshot.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        dumps: Callable[[Any], Any],
+        loads: Callable[[Any], Any]
+    ):
+        """
+        Initialize the snapshot and create its table.
+
+        Args:
+            path: SQLite database file
+            table: Table holding this store's sessions
+            dumps: Converts a session to a JSON-compatible state
+            loads: Rebuilds a session from its state
+        """
+        self.path = path
+        self.table = table
+        self.dumps = dumps
+        self.loads = loads
+        self._local = threading.local()
+
+        self._connection().execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "id TEXT PRIMARY KEY, state BLOB NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _connect(self.path)
+            self._local.connection = connection
+        return connection
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a session to compressed compact JSON"""
+        state = json.dumps(self.dumps(value), separators=(",", ":"))
+        return zlib.compress(state.encode("utf-8"), 1)
+
+    def write(
+        self,
+        rows: List[Tuple[str, bytes, float]],
+        deleted: Iterable[str] = ()
+    ):
+        """
+        Replace changed sessions and drop deleted ones in one transaction.
+
+        Args:
+            rows: (session_id, encode() output, last_access wall time)
+                tuples; sessions are encoded by the caller, which holds
+                each session's lock while doing so
+            deleted: IDs of sessions removed from the store
+        """
+        connection = self._connection()
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} "
+                "(id, state, last_access) VALUES (?, ?, ?)",
+                rows
+            )
+            connection.executemany(
+                f"DELETE FROM {self.table} WHERE id = ?",
+                [(session_id,) for session_id in deleted]
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def read(self, session_id: str) -> Optional[Tuple[Any, float]]:
+        """
+        Load one session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            (session, last_access wall time), or None if not snapshotted
+        """
+        row = self._connection().execute(
+            f"SELECT state, last_access FROM {self.table} WHERE id = ?",
+            (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        state = json.loads(zlib.decompress(row[0]))
+        return self.loads(state), row[1]
+
+    def prune(self, cutoff: float, keep: Iterable[str] = ()) -> int:
+        """
+        Drop sessions last accessed before a wall time.
+
+        Args:
+            cutoff: Wall time (time.time()) before which sessions expired
+            keep: IDs to keep anyway (sessions still live in memory)
+
+        Returns:
+            Number of sessions dropped
+        """
+        keep = set(keep)
+        connection = self._connection()
+        expired = [
+            (session_id,) for (session_id,) in connection.execute(
+                f"SELECT id FROM {self.table} WHERE last_access < ?",
+                (cutoff,)
+            )
+            if session_id not in keep
+        ]
+        if expired:
+            connection.executemany(
+                f"DELETE FROM {self.table} WHERE id = ?", expired
+            )
+        return len(expired)
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            f"SELECT COUNT(*) FROM {self.table}"
+        ).fetchone()[0]
+
+
+class SessionStore:
+    """
+    Bounded TTL/LRU session store with a background sweeper and optional
+    snapshots.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = 1800,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+        size_func: Callable[[Any], int] = approximate_size,
+        snapshot: Optional[SessionSnapshot] = None,
+        snapshot_interval: float = 5.0
+    ):
+        """
+        Initialize the store (call start() to run the sweeper).
+
+        Args:
+            name: Name used in logs and metrics
+            ttl_seconds: Idle time after which a session expires
+            max_entries: Maximum number of live sessions
+            max_bytes: Maximum estimated memory of live sessions
+            sweep_interval: Seconds between expiry sweeps
+            size_func: Estimates the memory of a session
+            snapshot: Where changed sessions are written for restarts
+                (None keeps sessions in memory only)
+            snapshot_interval: Seconds between snapshots of changed
+                sessions
+        """
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.size_func = size_func
+        self.snapshot = snapshot
+        self.snapshot_interval = snapshot_interval
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        # Changes not yet in the snapshot
+        self._dirty = set()
+        # Evicted sessions with unsaved changes: (value, wall time, lock)
+        self._evicted_dirty: Dict[str, Tuple[Any, float, Any]] = {}
+        self._deleted = set()
+
+        # Metrics
+        self._created = 0
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+        self._restored = 0
+        self._snapshotted = 0
+        self._last_snapshot_ms = 0.0
+
+    def start(self):
+        """Start the background sweeper thread"""
+        if self._thread:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sweep_loop,
+            name=f"session-sweeper-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sweeper thread and write a final snapshot"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+        if self.snapshot is not None:
+            self.write_snapshot()
+
+    def put(self, session_id: str, value: Any):
+        """
+        Store (or replace) a session, evicting LRU sessions over the caps.
+
+        Args:
+            session_id: Session ID
+            value: Session object
+        """
+        with self._lock:
+            previous = self._entries.get(session_id)
+            if previous is not None and previous.value is value:
+                # Saving a mutated session: the size barely changes
+                previous.last_access = time.monotonic()
+                self._entries.move_to_end(session_id)
+                self._mark_dirty(session_id)
+                return
+        entry = _Entry(value, self.size_func(value))
+        with self._lock:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                self._bytes -= previous.size
+                entry.lock = previous.lock
+            else:
+                self._created += 1
+            self._insert(session_id, entry)
+            self._mark_dirty(session_id)
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """
+        Get a session and mark it as recently used. Sessions missing from
+        memory are restored from the snapshot if it still has them.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Session object, or None if unknown, expired or evicted
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and self._is_expired(entry):
+                self._remove(session_id)
+                self._expired += 1
+                entry = None
+            if entry is not None:
+                entry.last_access = time.monotonic()
+                self._entries.move_to_end(session_id)
+                self._hits += 1
+                return entry.value
+
+        if self.snapshot is not None:
+            value = self._restore(session_id)
+            if value is not None:
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def lock(self, session_id: str):
+        """
+        Serialize read-modify-write cycles on one session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Context manager holding the session's lock (a no-op for an
+            unknown session, whose get() returns None anyway)
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+        if entry is None and self.snapshot is not None:
+            # Restore first so the lock belongs to the live entry
+            self.get(session_id)
+            with self._lock:
+                entry = self._entries.get(session_id)
+        return entry.lock if entry is not None else nullcontext()
+
+    def delete(self, session_id: str) -> bool:
+        """
+        Remove a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            True if the session existed
+        """
+        with self._lock:
+            if self.snapshot is not None:
+                self._deleted.add(session_id)
+                self._evicted_dirty.pop(session_id, None)
+            if session_id not in self._entries:
+                return False
+            self._remove(session_id)
+            return True
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            return entry is not None and not self._is_expired(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sweep(self) -> int:
+        """
+        Remove expired sessions now (from memory and the snapshot).
+
+        Returns:
+            Number of sessions removed from memory
+        """
+        with self._lock:
+            removed = self._prune()
+            live = list(self._entries)
+        if self.snapshot is not None:
+            try:
+                self.snapshot.prune(time.time() - self.ttl_seconds, live)
+            except sqlite3.Error as e:
+                print(f"⚠️ Session store '{self.name}' snapshot prune failed: {e}")
+        return removed
+
+    def write_snapshot(self) -> int:
+        """
+        Write sessions changed since the last snapshot.
+
+        Returns:
+            Number of sessions written
+        """
+        if self.snapshot is None:
+            return 0
+
+        start = time.perf_counter()
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            evicted, self._evicted_dirty = self._evicted_dirty, {}
+            deleted, self._deleted = self._deleted, set()
+            sessions = [
+                (session_id, entry.value, self._wall_time(entry), entry.lock)
+                for session_id, entry in (
+                    (session_id, self._entries.get(session_id))
+                    for session_id in dirty
+                )
+                if entry is not None
+            ]
+        sessions.extend(
+            (session_id, value, last_access, lock)
+            for session_id, (value, last_access, lock) in evicted.items()
+        )
+        if not sessions and not deleted:
+            return 0
+
+        try:
+            rows = []
+            for session_id, value, last_access, lock in sessions:
+                # Encode under the session lock so a concurrent
+                # read-modify-write cycle cannot tear the state
+                with lock:
+                    state = self.snapshot.encode(value)
+                rows.append((session_id, state, last_access))
+            self.snapshot.write(rows, deleted)
+        except Exception as e:
+            print(f"⚠️ Session store '{self.name}' snapshot failed: {e}")
+            with self._lock:
+                # Retry with the next snapshot
+                self._dirty.update(dirty)
+                for session_id, item in evicted.items():
+                    self._evicted_dirty.setdefault(session_id, item)
+                self._deleted.update(deleted)
+            return 0
+
+        self._snapshotted += len(sessions)
+        self._last_snapshot_ms = (time.perf_counter() - start) * 1000
+        return len(sessions)
+
+    def _restore(self, session_id: str) -> Optional[Any]:
+        """Load a session from the snapshot back into memory"""
+        with self._lock:
+            if session_id in self._deleted:
+                return None
+            # Evicted before its changes reached the snapshot
+            restored = self._evicted_dirty.get(session_id)
+        unsaved = restored is not None
+        if unsaved:
+            value, last_access, lock = restored
+        else:
+            try:
+                restored = self.snapshot.read(session_id)
+            except Exception as e:
+                print(f"⚠️ Session store '{self.name}' restore failed: {e}")
+                return None
+            if restored is None:
+                return None
+            value, last_access = restored
+            lock = None
+        if time.time() - last_access > self.ttl_seconds:
+            return None
+
+        entry = _Entry(value, self.size_func(value))
+        if lock is not None:
+            # A cycle may still hold the evicted entry's lock
+            entry.lock = lock
+        with self._lock:
+            current = self._entries.get(session_id)
+            if current is not None:
+                # Restored concurrently by another request
+                self._hits += 1
+                return current.value
+            self._insert(session_id, entry)
+            if unsaved:
+                self._mark_dirty(session_id)
+            self._restored += 1
+            self._hits += 1
+        return value
+
+    def _mark_dirty(self, session_id: str):
+        """Remember a change for the next snapshot (lock held)"""
+        if self.snapshot is not None:
+            self._dirty.add(session_id)
+            self._deleted.discard(session_id)
+            self._evicted_dirty.pop(session_id, None)
+
+    def _wall_time(self, entry: _Entry) -> float:
+        """Last access of an entry as a time.time() value"""
+        return time.time() - (time.monotonic() - entry.last_access)
+
+    def _insert(self, session_id: str, entry: _Entry):
+        """Add an entry and evict LRU sessions over the caps (lock held)"""
+        self._entries[session_id] = entry
+        self._bytes += entry.size
+        self._prune()
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            evicted_id, evicted = self._remove_oldest()
+            self._evicted += 1
+            if evicted_id in self._dirty:
+                # Keep unsaved changes for the next snapshot; the session
+                # can then be restored on its next access
+                self._dirty.discard(evicted_id)
+                self._evicted_dirty[evicted_id] = (
+                    evicted.value, self._wall_time(evicted), evicted.lock
+                )
+
+    def _is_expired(self, entry: _Entry) -> bool:
+        return time.monotonic() - entry.last_access > self.ttl_seconds
+
+    def _remove(self, session_id: str):
+        """Remove a session (lock held)"""
+        entry = self._entries.pop(session_id)
+        self._bytes -= entry.size
+        self._dirty.discard(session_id)
+
+    def _remove_oldest(self) -> Tuple[str, _Entry]:
+        """Remove the least recently used session (lock held)"""
+        session_id, entry = self._entries.popitem(last=False)
+        self._bytes -= entry.size
+        return session_id, entry
+
+    def _prune(self) -> int:
+        """Drop sessions idle for longer than the TTL (lock held)"""
+        removed = 0
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if not self._is_expired(oldest):
+                break
+            session_id, _ = self._remove_oldest()
+            self._dirty.discard(session_id)
+            removed += 1
+        self._expired += removed
+        return removed
+
+    def _sweep_loop(self):
+        interval = self.sweep_interval
+        if self.snapshot is not None:
+            interval = min(interval, self.snapshot_interval)
+        next_sweep = time.monotonic() + self.sweep_interval
+        while not self._stop_event.wait(interval):
+            if self.snapshot is not None:
+                self.write_snapshot()
+            if time.monotonic() < next_sweep:
+                continue
+            next_sweep = time.monotonic() + self.sweep_interval
+            removed = self.sweep()
+            if removed:
+                print(f"🧹 Session store '{self.name}' expired {removed} sessions")
+
+    def metrics(self) -> Dict:
+        """
+        Get store metrics.
+
+        Returns:
+            Dictionary with live sessions, memory, eviction and snapshot
+            counters
+        """
+        metrics = {
+            "name": self.name,
+            "backend": "memory",
+            "live_sessions": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "created": self._created,
+            "hits": self._hits,
+            "misses": self._misses,
+            "expired": self._expired,
+            "evicted": self._evicted
+        }
+        if self.snapshot is not None:
+            metrics["snapshot"] = {
+                "path": self.snapshot.path,
+                "dirty": len(self._dirty) + len(self._evicted_dirty),
+                "snapshotted": self._snapshotted,
+                "restored": self._restored,
+                "last_snapshot_ms": round(self._last_snapshot_ms, 2)
+            }
+        return metrics
+
+
+class SQLiteSessionStore:
+    """
+    Session store backed by a SQLite file in WAL mode, so every worker
+    process on the host sees the same sessions. Sessions are stored as
+    compact JSON produced by `dumps` and rebuilt with `loads`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        dumps: Callable[[Any], Any],
+        loads: Callable[[Any], Any],
+        ttl_seconds: float = 1800,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: float = 60.0
+    ):
+        """
+        Initialize the store and create its table (call start() to run
+        the sweeper).
+
+        Args:
+            name: Name used as table suffix, in logs and in metrics
+            path: SQLite database file (shared by all workers)
+            dumps: Converts a session to a JSON-compatible state
+            loads: Rebuilds a session from its state
+            ttl_seconds: Idle time after which a session expires
+            max_entries: Maximum number of live sessions
+            max_bytes: Maximum size of the serialized sessions
+            sweep_interval: Seconds between expiry sweeps
+        """
+        self.name = name
+        self.path = path
+        self.dumps = dumps
+        self.loads = loads
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.table = f"sessions_{name}"
+
+        self._local = threading.local()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        # Metrics (this process only)
+        self._created = 0
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+
+        self._connection().execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "id TEXT PRIMARY KEY, state TEXT NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+        self._connection().execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_last_access "
+            f"ON {self.table} (last_access)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection in autocommit mode"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _connect(self.path)
+            self._local.connection = connection
+        return connection
+
+    def start(self):
+        """Start the background sweeper thread"""
+        if self._thread:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sweep_loop,
+            name=f"session-sweeper-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sweeper thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+
+    def put(self, session_id: str, value: Any):
+        """
+        Store (or replace) a session.
+
+        Args:
+            session_id: Session ID
+            value: Session object
+        """
+        state = json.dumps(self.dumps(value), separators=(",", ":"))
+        cursor = self._connection().execute(
+            f"UPDATE {self.table} SET state = ?, last_access = ? WHERE id = ?",
+            (state, time.time(), session_id)
+        )
+        if cursor.rowcount:
+            return
+        self._connection().execute(
+            f"INSERT OR REPLACE INTO {self.table} (id, state, last_access) "
+            "VALUES (?, ?, ?)",
+            (session_id, state, time.time())
+        )
+        self._created += 1
+        self._enforce_limits()
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """
+        Load a session and mark it as recently used.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Session object, or None if unknown, expired or evicted
+        """
+        row = self._connection().execute(
+            f"SELECT state, last_access FROM {self.table} WHERE id = ?",
+            (session_id,)
+        ).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            if row is not None:
+                self.delete(session_id)
+                self._expired += 1
+            self._misses += 1
+            return None
+        if now - row[1] > self.ttl_seconds / 10:
+            # Refresh the idle timer without a write on every read
+            self._connection().execute(
+                f"UPDATE {self.table} SET last_access = ? WHERE id = ?",
+                (now, session_id)
+            )
+        self._hits += 1
+        return self.loads(json.loads(row[0]))
+
+    @contextmanager
+    def lock(self, session_id: str):
+        """
+        Serialize read-modify-write cycles across worker processes by
+        running them in an immediate (write-locked) transaction.
+
+        SQLite write locks cover the whole database, so this serializes
+        cycles on all sessions of the file, not just this one; cycles are
+        a single read and write, so they are short. Acquiring the lock
+        blocks for up to the busy timeout: call it from a worker thread,
+        never from the event loop.
+
+        Args:
+            session_id: Session ID (unused; kept for the store interface)
+        """
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def delete(self, session_id: str) -> bool:
+        """
+        Remove a session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            True if the session existed
+        """
+        cursor = self._connection().execute(
+            f"DELETE FROM {self.table} WHERE id = ?", (session_id,)
+        )
+        return cursor.rowcount > 0
+
+    def __contains__(self, session_id: str) -> bool:
+        row = self._connection().execute(
+            f"SELECT last_access FROM {self.table} WHERE id = ?",
+            (session_id,)
+        ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttl_seconds
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            f"SELECT COUNT(*) FROM {self.table}"
+        ).fetchone()[0]
+
+    def sweep(self) -> int:
+        """
+        Remove expired sessions now.
+
+        Returns:
+            Number of sessions removed
+        """
+        cursor = self._connection().execute(
+            f"DELETE FROM {self.table} WHERE last_access < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        self._expired += cursor.rowcount
+        return cursor.rowcount
+
+    def _enforce_limits(self):
+        """Evict least recently used sessions over the entry/byte caps"""
+        count, size = self._connection().execute(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(state)), 0) "
+            f"FROM {self.table}"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        excess = max(count - self.max_entries, 0)
+        if size > self.max_bytes:
+            # Drop a proportional share of sessions to get under the cap
+            excess = max(excess, int(count * (1 - self.max_bytes / size)) + 1)
+        excess = min(excess, count - 1)
+        cursor = self._connection().execute(
+            f"DELETE FROM {self.table} WHERE id IN ("
+            f"SELECT id FROM {self.table} ORDER BY last_access LIMIT ?)",
+            (excess,)
+        )
+        self._evicted += cursor.rowcount
+
+    def _sweep_loop(self):
+        while not self._stop_event.wait(self.sweep_interval):
+            try:
+                removed = self.sweep()
+            except sqlite3.Error as e:
+                print(f"⚠️ Session store '{self.name}' sweep failed: {e}")
+                continue
+            if removed:
+                print(f"🧹 Session store '{self.name}' expired {removed} sessions")
+
+    def metrics(self) -> Dict:
+        """
+        Get store metrics.
+
+        Returns:
+            Dictionary with live sessions, size and eviction counters
+        """
+        count, size = self._connection().execute(
+            f"SELECT COUNT(*), COALESCE(SUM(LENGTH(state)), 0) "
+            f"FROM {self.table}"
+        ).fetchone()
+        return {
+            "name": self.name,
+            "backend": "sqlite",
+            "path": self.path,
+            "live_sessions": count,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "created": self._created,
+            "hits": self._hits,
+            "misses": self._misses,
+            "expired": self._expired,
+            "evicted": self._evicted
+        }
+
+
+def create_session_store(
+    name: str,
+    dumps: Callable[[Any], Any],
+    loads: Callable[[Any], Any],
+    **limits
+):
+    """
+    Create a session store using the backend selected by SESSION_BACKEND
+    ("memory" or "sqlite"; the SQLite file is SESSION_DB_PATH). Memory
+    stores are snapshotted every SESSION_SNAPSHOT_INTERVAL seconds only
+    when SESSION_SNAPSHOT_PATH names a snapshot file.
+
+    Args:
+        name: Store name
+        dumps: Converts a session to a JSON-compatible state
+        loads: Rebuilds a session from its state
+        **limits: ttl_seconds, max_entries, max_bytes, sweep_interval
+
+    Returns:
+        SessionStore or SQLiteSessionStore
+    """
+    backend = os.getenv("SESSION_BACKEND", "memory").lower()
+    if backend == "sqlite":
+        path = os.getenv("SESSION_DB_PATH", "./sessions.db")
+        return SQLiteSessionStore(name, path, dumps, loads, **limits)
+    if backend != "memory":
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend}")
+
+    snapshot = None
+    snapshot_path = os.getenv("SESSION_SNAPSHOT_PATH")
+    if snapshot_path:
+        snapshot = SessionSnapshot(
+            snapshot_path, f"snapshot_{name}", dumps, loads
+        )
+    return SessionStore(
+        name,
+        snapshot=snapshot,
+        snapshot_interval=float(os.getenv("SESSION_SNAPSHOT_INTERVAL", "5")),
+        **limits
+    )
@@ -13,12 +13,15 @@ Features:
 """
 
 import re
+from array import array
 from typing import List, Dict, Tuple
 from dataclasses import dataclass, asdict
 import json
 
+from text_tokens import WordView, word_offsets, pack_offsets, unpack_offsets
 
-@dataclass
+
+@dataclass(slots=True)
 class ReadingRound:
     """Represents a single training round with its configuration"""
     round_number: int
@@ -28,12 +31,16 @@ class ReadingRound:
     status: str = "pending"  # pending, in_progress, completed
     
 
-@dataclass
+@dataclass(slots=True)
 class SpeedTrainerSession:
-    """Represents a complete speed training session"""
+    """
+    Represents a complete speed training session.
+
+    The text is stored once; words are [start, end) offsets into it and
+    are only materialized when accessed.
+    """
     text: str
-    words: List[str]
-    total_words: int
+    offsets: array  # array('I') of word start/end offsets
     rounds: List[ReadingRound]
     current_round: int = 0
     current_word_index: int = 0
@@ -41,6 +48,15 @@ class SpeedTrainerSession:
     is_completed: bool = False
     session_id: str = ""
 
+    @property
+    def words(self) -> WordView:
+        """Words of the text (built on access)"""
+        return WordView(self.text, self.offsets)
+
+    @property
+    def total_words(self) -> int:
+        return len(self.offsets) // 2
+
 
 class SpeedTrainer:
     """
@@ -52,6 +68,8 @@ class SpeedTrainer:
     
     # Default speed progression for training rounds
     DEFAULT_SPEEDS = [60, 75, 90]  # WPM values
+
+    __slots__ = ("text", "speeds", "words", "session")
     
     def __init__(self, text: str = "", speeds: List[int] = None):
         """
@@ -147,18 +165,19 @@ class SpeedTrainer:
             SpeedTrainerSession object representing the session
         """
         self.text = text
-        self.words = self.prepare_text(text)
+        offsets = word_offsets(text)
         
-        if not self.words:
+        if not offsets:
             raise ValueError("Text must contain at least one word")
         
         speeds = speeds or self.speeds
+        word_count = len(offsets) // 2
         
         # Create rounds with calculated intervals
         rounds = []
         for idx, wpm in enumerate(speeds, 1):
             interval_ms = self.calculate_interval(wpm)
-            duration = self.calculate_round_duration(wpm, len(self.words))
+            duration = self.calculate_round_duration(wpm, word_count)
             
             round_data = ReadingRound(
                 round_number=idx,
@@ -171,11 +190,11 @@ class SpeedTrainer:
         # Create session
         self.session = SpeedTrainerSession(
             text=text,
-            words=self.words,
-            total_words=len(self.words),
+            offsets=offsets,
             rounds=rounds,
             session_id=session_id
         )
+        self.words = self.session.words
         
         return self.session
     
@@ -187,7 +206,7 @@ class SpeedTrainer:
     
     def get_current_word(self) -> str | None:
         """Get the current word being highlighted"""
-        if not self.session or self.session.current_word_index >= len(self.session.words):
+        if not self.session or self.session.current_word_index >= self.session.total_words:
             return None
         return self.session.words[self.session.current_word_index]
     
@@ -204,7 +223,7 @@ class SpeedTrainer:
         self.session.current_word_index += 1
         
         # Check if round is complete
-        if self.session.current_word_index >= len(self.session.words):
+        if self.session.current_word_index >= self.session.total_words:
             return self._complete_round()
         
         return True
@@ -271,6 +290,195 @@ class SpeedTrainer:
             return True
         return False
     
+    def get_word_offsets(self) -> List[int]:
+        """
+        Character offset of every word in the original text.
+
+        Returns:
+            Start offset per word (a word ends at offset + len(word))
+        """
+        if not self.session:
+            return []
+        return self.session.offsets[0::2].tolist()
+
+    def build_timeline(self, weighted: bool = False) -> Dict:
+        """
+        Precompute the complete pacing timeline so a client can run the
+        session locally.
+
+        Args:
+            weighted: Give longer words proportionally more display time
+                (each round keeps its total duration)
+
+        Returns:
+            Dictionary with word offsets and, per round, its boundaries on
+            the session timeline and the start time of every word (ms,
+            relative to the round start)
+        """
+        if not self.session:
+            return {}
+
+        offsets = self.session.offsets
+        lengths = [offsets[i + 1] - offsets[i] for i in range(0, len(offsets), 2)]
+        if weighted:
+            mean_length = sum(lengths) / len(lengths)
+            weights = [length / mean_length for length in lengths]
+        else:
+            weights = [1.0] * len(lengths)
+
+        rounds = []
+        round_start_ms = 0
+        for round_data in self.session.rounds:
+            word_start_ms = []
+            elapsed = 0.0
+            for weight in weights:
+                word_start_ms.append(round(elapsed))
+                elapsed += round_data.interval_ms * weight
+            rounds.append({
+                "round_number": round_data.round_number,
+                "wpm": round_data.wpm,
+                "interval_ms": round_data.interval_ms,
+                "start_ms": round_start_ms,
+                "end_ms": round_start_ms + round(elapsed),
+                "word_start_ms": word_start_ms
+            })
+            round_start_ms += round(elapsed)
+
+        return {
+            "weighted": weighted,
+            "word_offsets": self.get_word_offsets(),
+            "total_duration_ms": round_start_ms,
+            "rounds": rounds
+        }
+
+    def get_position(self) -> Dict:
+        """
+        Get the compact reading position (no text or word list).
+
+        Returns:
+            Dictionary with round, word index, interval and flags
+        """
+        if not self.session:
+            return {}
+        current_round = self.get_current_round()
+        return {
+            "round": self.session.current_round,
+            "word_index": self.session.current_word_index,
+            "interval_ms": current_round.interval_ms if current_round else None,
+            "is_paused": self.session.is_paused,
+            "is_completed": self.session.is_completed
+        }
+
+    def sync_position(
+        self,
+        round_index: int,
+        word_index: int,
+        is_paused: bool = False,
+        is_completed: bool = False
+    ) -> bool:
+        """
+        Move the session to a position reported by a client that runs the
+        timeline locally.
+
+        Args:
+            round_index: Zero-based round the client is in
+            word_index: Word highlighted by the client
+            is_paused: Whether the client is paused
+            is_completed: Whether the client finished all rounds
+
+        Returns:
+            True if applied, False if the position is out of range
+        """
+        if not self.session:
+            return False
+        if not 0 <= round_index < len(self.session.rounds):
+            return False
+        if not 0 <= word_index < self.session.total_words:
+            return False
+
+        self.session.current_round = round_index
+        self.session.current_word_index = word_index
+        self.session.is_paused = is_paused
+        self.session.is_completed = is_completed
+
+        for idx, round_data in enumerate(self.session.rounds):
+            if idx < round_index or (idx == round_index and is_completed):
+                round_data.status = "completed"
+            elif idx == round_index:
+                round_data.status = "in_progress"
+            else:
+                round_data.status = "pending"
+        return True
+
+    # Compact codes for round statuses in serialized state
+    STATUS_CODES = {"pending": "p", "in_progress": "i", "completed": "c"}
+    STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+    def to_state(self) -> list:
+        """
+        Serialize the session compactly (for shared session stores).
+
+        Word offsets are packed as base64 (native byte order; shared
+        stores are host-local). Rounds are stored as their WPM and a
+        one-letter status; intervals and durations are recomputed on load.
+
+        Returns:
+            JSON-compatible list
+        """
+        session = self.session
+        return [
+            session.text,
+            pack_offsets(session.offsets),
+            [r.wpm for r in session.rounds],
+            "".join(self.STATUS_CODES[r.status] for r in session.rounds),
+            session.current_round,
+            session.current_word_index,
+            int(session.is_paused),
+            int(session.is_completed),
+            session.session_id
+        ]
+
+    @classmethod
+    def from_state(cls, state: list) -> "SpeedTrainer":
+        """
+        Rebuild a trainer from to_state() output.
+
+        Args:
+            state: Serialized session
+
+        Returns:
+            SpeedTrainer with the restored session
+        """
+        (text, offsets, speeds, statuses, current_round, current_word_index,
+         is_paused, is_completed, session_id) = state
+        trainer = cls(text, speeds)
+        offsets = unpack_offsets(offsets)
+        word_count = len(offsets) // 2
+        rounds = [
+            ReadingRound(
+                round_number=idx,
+                wpm=wpm,
+                interval_ms=trainer.calculate_interval(wpm),
+                duration_seconds=trainer.calculate_round_duration(
+                    wpm, word_count
+                ),
+                status=cls.STATUS_NAMES[code]
+            )
+            for idx, (wpm, code) in enumerate(zip(speeds, statuses), 1)
+        ]
+        trainer.session = SpeedTrainerSession(
+            text=text,
+            offsets=offsets,
+            rounds=rounds,
+            current_round=current_round,
+            current_word_index=current_word_index,
+            is_paused=bool(is_paused),
+            is_completed=bool(is_completed),
+            session_id=session_id
+        )
+        trainer.words = trainer.session.words
+        return trainer
+
     def get_session_data(self) -> Dict:
         """
         Get the current session data as a dictionary.
@@ -283,7 +491,7 @@ class SpeedTrainer:
         
         return {
             "text": self.session.text,
-            "words": self.session.words,
+            "words": list(self.session.words),
             "total_words": self.session.total_words,
             "current_round": self.session.current_round,
             "current_word_index": self.session.current_word_index,
@@ -295,6 +503,27 @@ class SpeedTrainer:
             "session_id": self.session.session_id
         }
     
+    def get_session_state(self) -> Dict:
+        """
+        Get only the mutable part of the session (for clients that already
+        have the text, words and round configuration).
+
+        Returns:
+            Dictionary with position, flags and round statuses
+        """
+        if not self.session:
+            return {}
+
+        return {
+            "current_round": self.session.current_round,
+            "current_word_index": self.session.current_word_index,
+            "current_word": self.get_current_word(),
+            "is_paused": self.session.is_paused,
+            "is_completed": self.session.is_completed,
+            "round_statuses": [r.status for r in self.session.rounds],
+            "session_id": self.session.session_id
+        }
+
     def get_session_stats(self) -> Dict:
         """
         Get statistics about the training session.
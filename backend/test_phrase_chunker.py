@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Phrase chunker checks: phrase boundaries, length limits and punctuation.
+No server or database needed.
+
+Run from the backend directory:
+    python test_phrase_chunker.py
+"""
+
+from age_based_paragraphs import AGE_BASED_PARAGRAPHS
+from phrase_trainer import PhraseTrainer, chunk_boundaries
+
+LIBRARY = [p for paragraphs in AGE_BASED_PARAGRAPHS.values() for p in paragraphs]
+
+
+def chunk(sentence: str, min_length: int = 2, max_length: int = 4):
+    trainer = PhraseTrainer(min_length=min_length, max_length=max_length)
+    return trainer.smart_chunk_words(sentence.split())
+
+
+def test_boundaries_cover_every_word_in_order():
+    for paragraph in LIBRARY:
+        words = paragraph.split()
+        punctuated = [word[-1] in ".!?,;:" for word in words]
+        boundaries = chunk_boundaries(words, punctuated, 2, 4)
+        assert boundaries[0] == 0 and boundaries[-1] == len(words)
+        lengths = [
+            boundaries[i + 1] - boundaries[i]
+            for i in range(len(boundaries) - 1)
+        ]
+        assert all(1 <= length <= 4 for length in lengths), lengths
+
+
+def test_phrases_stay_within_length_limits():
+    for paragraph in LIBRARY:
+        phrases = chunk(paragraph)
+        assert " ".join(phrases) == " ".join(paragraph.split())
+        assert all(len(phrase.split()) <= 4 for phrase in phrases)
+        # Only a text shorter than min_length has a one-word phrase
+        assert all(len(phrase.split()) >= 2 for phrase in phrases)
+
+
+def test_punctuation_ends_a_phrase():
+    phrases = chunk("The cat sat down. The dog ran away quickly.")
+    assert phrases == ["The cat sat down.", "The dog ran", "away quickly."]
+
+
+def test_phrases_do_not_end_on_articles():
+    for paragraph in LIBRARY:
+        for phrase in chunk(paragraph)[:-1]:
+            words = phrase.split()
+            if len(words) < 4:
+                assert words[-1].lower() not in ("a", "an", "the"), phrase
+
+
+def test_short_text_is_one_phrase():
+    assert chunk("Hello") == ["Hello"]
+    assert chunk("") == []
+
+
+TESTS = [
+    test_boundaries_cover_every_word_in_order,
+    test_phrases_stay_within_length_limits,
+    test_punctuation_ends_a_phrase,
+    test_phrases_do_not_end_on_articles,
+    test_short_text_is_one_phrase,
+]
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Phrase Chunker Tests")
+    print("=" * 60)
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print("=" * 60)
+    print(f"{len(TESTS) - failed}/{len(TESTS)} passed")
+    raise SystemExit(1 if failed else 0)
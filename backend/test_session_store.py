@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+"""
+Session store checks: TTL expiry, LRU eviction, per-session locking,
+the SQLite store and snapshot restore. No server or database needed.
+
+Run from the backend directory:
+    python test_session_store.py
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from session_store import SessionSnapshot, SessionStore, SQLiteSessionStore
+from speed_trainer import SpeedTrainer
+
+
+def make_trainer(text: str) -> SpeedTrainer:
+    trainer = SpeedTrainer()
+    trainer.create_session(text, [100, 200])
+    return trainer
+
+
+def snapshot_path() -> str:
+    return os.path.join(tempfile.mkdtemp(), "session_snapshots.db")
+
+
+def make_snapshot(path: str) -> SessionSnapshot:
+    return SessionSnapshot(
+        path, "snapshot_test", SpeedTrainer.to_state, SpeedTrainer.from_state
+    )
+
+
+def test_ttl_expiry():
+    store = SessionStore("ttl", ttl_seconds=0.05)
+    store.put("a", {"n": 1})
+    assert store.get("a") == {"n": 1}
+    time.sleep(0.1)
+    assert store.get("a") is None
+    assert "a" not in store
+    assert store.metrics()["expired"] == 1
+
+
+def test_sweep_removes_idle_sessions():
+    store = SessionStore("sweep", ttl_seconds=0.05)
+    for i in range(3):
+        store.put(str(i), {"n": i})
+    time.sleep(0.1)
+    assert store.sweep() == 3
+    assert len(store) == 0
+
+
+def test_lru_eviction_by_count():
+    store = SessionStore("lru", max_entries=2)
+    store.put("a", {"n": 1})
+    store.put("b", {"n": 2})
+    store.get("a")  # "b" is now least recently used
+    store.put("c", {"n": 3})
+    assert store.get("b") is None
+    assert store.get("a") == {"n": 1}
+    assert store.get("c") == {"n": 3}
+    assert store.metrics()["evicted"] == 1
+
+
+def test_lru_eviction_by_bytes():
+    store = SessionStore("bytes", max_bytes=25, size_func=lambda value: 10)
+    for session_id in "abc":
+        store.put(session_id, {"id": session_id})
+    assert len(store) == 2
+    assert "a" not in store
+    assert store.metrics()["bytes"] == 20
+
+
+def test_lock_serializes_updates():
+    store = SessionStore("lock")
+    store.put("a", {"count": 0})
+
+    def increment():
+        for _ in range(50):
+            with store.lock("a"):
+                value = store.get("a")
+                count = value["count"]
+                time.sleep(0)
+                store.put("a", {"count": count + 1})
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.get("a")["count"] == 200
+
+
+def test_sqlite_store_round_trip_and_lock():
+    path = os.path.join(tempfile.mkdtemp(), "sessions.db")
+    store = SQLiteSessionStore(
+        "test", path, SpeedTrainer.to_state, SpeedTrainer.from_state
+    )
+    trainer = make_trainer("The quick brown fox jumps.")
+    trainer.advance_to_next_word()
+    store.put("a", trainer)
+    restored = store.get("a")
+    assert restored.get_session_state() == trainer.get_session_state()
+
+    def advance():
+        for _ in range(10):
+            with store.lock("a"):
+                current = store.get("a")
+                current.session.current_word_index += 1
+                store.put("a", current)
+
+    threads = [threading.Thread(target=advance) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.get("a").session.current_word_index == 41
+
+
+def test_snapshot_restores_evicted_session():
+    store = SessionStore(
+        "evict", max_entries=1, snapshot=make_snapshot(snapshot_path())
+    )
+    first = make_trainer("One two three four.")
+    first.advance_to_next_word()
+    store.put("a", first)
+    store.put("b", make_trainer("Five six seven."))
+    assert len(store) == 1
+
+    # Evicted before any snapshot was written: restored from pending changes
+    restored = store.get("a")
+    assert restored is not None
+    assert restored.session.current_word_index == 1
+    assert store.metrics()["snapshot"]["restored"] == 1
+
+
+def test_snapshot_survives_restart():
+    path = snapshot_path()
+    store = SessionStore("restart", snapshot=make_snapshot(path))
+    trainer = make_trainer("Reading every day helps.")
+    trainer.advance_to_next_word()
+    trainer.pause()
+    store.put("a", trainer)
+    store.put("b", make_trainer("Deleted before the restart."))
+    store.delete("b")
+    store.stop()  # Writes the final snapshot
+
+    restarted = SessionStore("restart", snapshot=make_snapshot(path))
+    assert len(restarted) == 0  # Nothing is loaded eagerly
+    restored = restarted.get("a")
+    assert restored.get_session_state() == trainer.get_session_state()
+    assert restarted.get("b") is None
+
+
+def test_snapshot_skips_expired_sessions():
+    path = snapshot_path()
+    store = SessionStore("expired", ttl_seconds=0.05, snapshot=make_snapshot(path))
+    store.put("a", make_trainer("Too old to restore."))
+    assert store.write_snapshot() == 1
+    time.sleep(0.1)
+
+    restarted = SessionStore(
+        "expired", ttl_seconds=0.05, snapshot=make_snapshot(path)
+    )
+    assert restarted.get("a") is None
+    restarted.sweep()
+    assert len(restarted.snapshot) == 0
+
+
+def test_snapshot_writes_only_dirty_sessions():
+    store = SessionStore("dirty", snapshot=make_snapshot(snapshot_path()))
+    for i in range(5):
+        store.put(str(i), make_trainer(f"Session number {i}."))
+    assert store.write_snapshot() == 5
+    assert store.write_snapshot() == 0
+    store.put("3", store.get("3"))
+    assert store.write_snapshot() == 1
+
+
+def test_snapshot_waits_for_session_lock():
+    store = SessionStore("torn", snapshot=make_snapshot(snapshot_path()))
+    store.put("a", make_trainer("Half way through an update."))
+    written = []
+    with store.lock("a"):
+        writer = threading.Thread(
+            target=lambda: written.append(store.write_snapshot())
+        )
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()  # Blocked until the update is done
+    writer.join()
+    assert written == [1]
+
+
+TESTS = [
+    test_ttl_expiry,
+    test_sweep_removes_idle_sessions,
+    test_lru_eviction_by_count,
+    test_lru_eviction_by_bytes,
+    test_lock_serializes_updates,
+    test_sqlite_store_round_trip_and_lock,
+    test_snapshot_restores_evicted_session,
+    test_snapshot_survives_restart,
+    test_snapshot_skips_expired_sessions,
+    test_snapshot_writes_only_dirty_sessions,
+    test_snapshot_waits_for_session_lock,
+]
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Session Store Tests")
+    print("=" * 60)
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print("=" * 60)
+    print(f"{len(TESTS) - failed}/{len(TESTS)} passed")
+    raise SystemExit(1 if failed else 0)
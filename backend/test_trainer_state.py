@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Compact session state checks: word offsets and the to_state()/
+from_state() round trip of both trainers. No server or database needed.
+
+Run from the backend directory:
+    python test_trainer_state.py
+"""
+
+import json
+
+from age_based_paragraphs import AGE_BASED_PARAGRAPHS
+from phrase_trainer import PhraseTrainer
+from speed_trainer import SpeedTrainer
+from text_tokens import pack_offsets, unpack_offsets, word_offsets
+
+LIBRARY = [p for paragraphs in AGE_BASED_PARAGRAPHS.values() for p in paragraphs]
+
+
+def test_word_offsets_strip_outer_punctuation():
+    text = '"Hello," she said (quietly). Don\'t stop!'
+    offsets = word_offsets(text)
+    words = [
+        text[offsets[i]:offsets[i + 1]] for i in range(0, len(offsets), 2)
+    ]
+    assert words == ["Hello", "she", "said", "quietly", "Don't", "stop"]
+    assert unpack_offsets(pack_offsets(offsets)) == offsets
+
+
+def test_speed_trainer_state_round_trip():
+    trainer = SpeedTrainer()
+    trainer.create_session(LIBRARY[0], [100, 150, 200], "speed-1")
+    for _ in range(len(trainer.session.words) + 3):
+        trainer.advance_to_next_word()
+    trainer.pause()
+
+    state = json.loads(json.dumps(SpeedTrainer.to_state(trainer)))
+    restored = SpeedTrainer.from_state(state)
+    assert restored.get_session_state() == trainer.get_session_state()
+    assert restored.get_session_data() == trainer.get_session_data()
+    assert restored.build_timeline() == trainer.build_timeline()
+
+
+def test_phrase_trainer_state_round_trip():
+    trainer = PhraseTrainer(min_length=2, max_length=5)
+    trainer.create_session(LIBRARY[-1], "phrase-1")
+    trainer.advance_to_next_phrase()
+    trainer.advance_to_next_phrase()
+
+    state = json.loads(json.dumps(PhraseTrainer.to_state(trainer)))
+    restored = PhraseTrainer.from_state(state)
+    assert restored.min_length == 2 and restored.max_length == 5
+    assert restored.get_session_state() == trainer.get_session_state()
+    assert restored.get_session_data() == trainer.get_session_data()
+    assert list(restored.session.phrases) == list(trainer.session.phrases)
+
+
+TESTS = [
+    test_word_offsets_strip_outer_punctuation,
+    test_speed_trainer_state_round_trip,
+    test_phrase_trainer_state_round_trip,
+]
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Session State Tests")
+    print("=" * 60)
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print("=" * 60)
+    print(f"{len(TESTS) - failed}/{len(TESTS)} passed")
+    raise SystemExit(1 if failed else 0)
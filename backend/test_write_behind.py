@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Write-behind queue checks: batching, retries, dropping of bad rows and
+back-pressure. No server or database needed.
+
+Run from the backend directory:
+    python test_write_behind.py
+"""
+
+import time
+
+from write_behind import WriteBehindQueue
+
+
+class Sink:
+    """Flush function that records batches and fails on demand"""
+
+    def __init__(self, failures: int = 0, bad_rows=()):
+        self.failures = failures
+        self.bad_rows = set(bad_rows)
+        self.batches = []
+        self.calls = 0
+
+    def __call__(self, batch):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        if self.bad_rows.intersection(batch):
+            raise ValueError("foreign key violation")
+        self.batches.append(list(batch))
+
+    @property
+    def rows(self):
+        return [row for batch in self.batches for row in batch]
+
+
+def test_flushes_full_batches_in_background():
+    sink = Sink()
+    queue = WriteBehindQueue("batches", sink, max_batch_size=10, flush_interval=5.0)
+    queue.start()
+    for i in range(25):
+        queue.put(i)
+    deadline = time.monotonic() + 2
+    while len(sink.rows) < 20 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sink.batches[:2] == [list(range(10)), list(range(10, 20))]
+    queue.stop()  # Drains the partial batch
+    assert sink.rows == list(range(25))
+    assert queue.metrics()["flushed"] == 25
+
+
+def test_retries_a_failing_batch_in_order():
+    sink = Sink(failures=2)
+    queue = WriteBehindQueue("retry", sink, max_batch_size=5, max_retries=3)
+    for i in range(8):
+        queue.put(i)
+    assert not queue.flush()
+    assert not queue.flush()
+    assert len(queue) == 8  # Nothing lost while retrying
+    assert queue.flush()
+    assert queue.flush()
+    assert sink.batches == [[0, 1, 2, 3, 4], [5, 6, 7]]
+    metrics = queue.metrics()
+    assert metrics["failed_flushes"] == 2
+    assert metrics["dropped"] == 0
+
+
+def test_drops_only_bad_rows_after_retries():
+    sink = Sink(bad_rows={3})
+    queue = WriteBehindQueue("bad-row", sink, max_batch_size=8, max_retries=2)
+    for i in range(8):
+        queue.put(i)
+    for _ in range(3):
+        assert not queue.flush()
+    assert len(queue) == 0
+    assert sorted(sink.rows) == [0, 1, 2, 4, 5, 6, 7]
+    metrics = queue.metrics()
+    assert metrics["dropped"] == 1
+    assert metrics["flushed"] == 7
+
+
+def test_counts_retries_per_batch():
+    sink = Sink(failures=1)
+    queue = WriteBehindQueue("per-batch", sink, max_batch_size=2, max_retries=1)
+    for i in range(4):
+        queue.put(i)
+    assert not queue.flush()  # First batch fails once
+    assert queue.flush()      # ...and succeeds on its retry
+    sink.failures = 1
+    assert not queue.flush()  # Second batch has its own retry budget
+    assert queue.flush()
+    assert sink.rows == [0, 1, 2, 3]
+    assert queue.metrics()["dropped"] == 0
+
+
+def test_drops_when_buffer_is_full():
+    queue = WriteBehindQueue("full", Sink(), max_buffer_size=2)
+    assert queue.put(1)
+    assert queue.put(2)
+    assert not queue.put(3)
+    assert queue.metrics()["dropped"] == 1
+    assert len(queue) == 2
+
+
+TESTS = [
+    test_flushes_full_batches_in_background,
+    test_retries_a_failing_batch_in_order,
+    test_drops_only_bad_rows_after_retries,
+    test_counts_retries_per_batch,
+    test_drops_when_buffer_is_full,
+]
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Write-Behind Queue Tests")
+    print("=" * 60)
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print("=" * 60)
+    print(f"{len(TESTS) - failed}/{len(TESTS)} passed")
+    raise SystemExit(1 if failed else 0)
@@ -1,118 +1,664 @@
 """
 Text-to-Speech (TTS) Module for Dyslexia Assistance
-Uses subprocess to isolate pyttsx3 instances and handle multiple requests
+Uses a pool of persistent worker processes to isolate pyttsx3 instances
+and handle multiple requests
 """
 
-import subprocess
 import io
 import base64
-from typing import Dict, List, Tuple
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 import json
 import hashlib
 import os
 import tempfile
-import sys
+from tts_pool import TTSWorkerPool
+from tts_cache import TTSAudioCache, make_cache_key
+from audio_profiles import AUDIO_PROFILES, convert_wav
+
+
+# Audio clips are served from the cache by the /tts/audio/{key} endpoint;
+# the URL query carries the text and settings so any worker can
+# re-synthesize a clip that is not (or no longer) cached
+AUDIO_URL_PREFIX = "/tts/audio/"
 
 
 class DyslexiaAssistanceEngine:
     """
     Provides pronunciation assistance for incorrect words
     Generates audio files for corrected words and detailed feedback
-    Uses subprocess to isolate TTS instances
+    Uses a pool of persistent worker processes to isolate TTS instances
     """
     
-    def __init__(self, rate: int = 100, volume: float = 0.9):
+    def __init__(self, rate: int = 100, volume: float = 0.9, pool_size: int = 2,
+                 cache: TTSAudioCache = None, batch_size: int = 8,
+                 output_format: str = "wav", public_url: str = "",
+                 max_prefetch: int = 256):
         """
-        Initialize TTS engine (subprocess-based)
+        Initialize TTS engine (worker-pool based)
         
         Args:
             rate: Speech rate (100 = normal, 50-300 available)
             volume: Volume level (0.0-1.0)
+            pool_size: Number of persistent TTS worker processes
+            cache: Audio cache (memory-only cache if None)
+            batch_size: Maximum texts per batched worker run
+            output_format: Default audio profile (see audio_profiles)
+            public_url: Absolute base URL of the API for audio URLs
+                (e.g. "http://localhost:8000"; '' for relative URLs)
+            max_prefetch: Maximum texts queued for background prefetch
         """
         self.engine = True  # Mark as available
         self.rate = rate
         self.volume = volume
+        self.voice = None  # System default voice
+        # Voices requests may pick; the installed voices if not configured
+        self.allowed_voices = [
+            voice.strip()
+            for voice in os.getenv("TTS_VOICES", "").split(",")
+            if voice.strip()
+        ]
+        if output_format not in AUDIO_PROFILES:
+            raise ValueError(f"Unknown audio format: {output_format}")
+        self.output_format = output_format
+        self.batch_size = max(1, batch_size)
+        self.public_url = public_url.rstrip("/")
+        # Workers hand clips over through files; keep them in RAM if possible
+        self.scratch_dir = os.getenv("TTS_SCRATCH_DIR") or (
+            "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        )
+        self.cache = cache or TTSAudioCache()
         self.worker_script = os.path.join(os.path.dirname(__file__), 'tts_worker.py')
+        self.pool = None
+        # Bounds concurrent synthesis of multi-word requests
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, pool_size), thread_name_prefix="tts"
+        )
+        # Drives background prefetches; each driver feeds its batches to
+        # self.executor one at a time, so a live request waits behind at
+        # most one prefetch batch per driver (with pool_size 1 the single
+        # executor thread alternates between the two)
+        self.prefetch_executor = ThreadPoolExecutor(
+            max_workers=max(1, pool_size - 1), thread_name_prefix="tts-prefetch"
+        )
+        # Texts claimed by queued or running prefetches; beyond the limit
+        # texts are not prefetched and their URLs synthesize on request
+        self.max_prefetch = max_prefetch
+        self._prefetch_pending = 0
+        # In-flight syntheses by cache key, shared by concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.synthesis_calls = 0
+        self.coalesced_calls = 0
         
         # Check if worker script exists
         if os.path.exists(self.worker_script):
-            print("[OK] TTS Engine initialized successfully (subprocess mode)")
+            self.pool = TTSWorkerPool(self.worker_script, size=pool_size)
+            print("[OK] TTS Engine initialized successfully (worker pool mode)")
         else:
             print(f"[WARN] TTS worker script not found: {self.worker_script}")
             self.engine = None
     
-    def generate_audio_file(self, text: str) -> Tuple[bytes, str]:
+    def shutdown(self):
+        """Stop the TTS worker processes"""
+        self.prefetch_executor.shutdown(wait=False)
+        self.executor.shutdown(wait=False)
+        if self.pool:
+            self.pool.shutdown()
+    
+    def is_known_voice(self, voice: str) -> bool:
         """
-        Generate audio bytes for given text using subprocess isolation
+        Check a requested voice ID against the allowed voices
+        
+        Args:
+            voice: Voice ID from a request
+            
+        Returns:
+            True if the voice is configured (TTS_VOICES) or installed
+        """
+        if self.allowed_voices:
+            return voice in self.allowed_voices
+        return bool(self.pool) and voice in self.pool.voice_ids()
+    
+    def settings(self, output_format: Optional[str] = None, rate: Optional[int] = None,
+                 volume: Optional[float] = None, voice: Optional[str] = None) -> Dict:
+        """
+        Resolve per-request voice settings against the engine defaults
+        
+        Args:
+            output_format: Audio profile (see audio_profiles)
+            rate: Speech rate
+            volume: Volume level (0.0-1.0)
+            voice: Voice ID
+            
+        Returns:
+            Dictionary with output_format, rate, volume and voice
+        """
+        return {
+            "output_format": output_format or self.output_format,
+            "rate": self.rate if rate is None else rate,
+            "volume": self.volume if volume is None else volume,
+            "voice": voice or self.voice
+        }
+    
+    def cache_key(self, text: str, **overrides) -> str:
+        """
+        Get the audio cache key for text with this engine's settings
         
         Args:
             text: Text to convert to speech
+            **overrides: output_format, rate, volume or voice for this text
             
         Returns:
-            Tuple of (audio_bytes, audio_base64) for transmission
+            Content-addressed cache key
+        """
+        return make_cache_key(text, **self.settings(**overrides))
+    
+    def get_audio(self, text: str, **overrides) -> bytes:
+        """
+        Get audio bytes for given text, served from the audio cache when
+        possible and synthesized on a pooled TTS worker otherwise
+        
+        Args:
+            text: Text to convert to speech
+            **overrides: output_format, rate, volume or voice for this text
+            
+        Returns:
+            WAV audio bytes, or b'' on failure
         """
         if not self.engine:
             print("❌ TTS Engine not available")
-            return b'', ''
+            return b''
         
         try:
-            # Create unique filename
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            import time
-            timestamp = str(int(time.time() * 1000000))
+            settings = self.settings(**overrides)
+            key = make_cache_key(text, **settings)
+            audio_bytes = self.cache.get(key)
+            if audio_bytes is None:
+                audio_bytes = self._synthesize_once(key, text, settings)
+            return audio_bytes
             
-            # Use system temp directory
-            temp_dir = tempfile.gettempdir()
-            temp_filepath = os.path.join(temp_dir, f'dyslexia_audio_{text_hash}_{timestamp}.wav')
+        except Exception as e:
+            print(f"❌ Error generating audio: {e}")
+            return b''
+    
+    def generate_audio_file(self, text: str, **overrides) -> Tuple[bytes, str]:
+        """
+        Generate audio bytes for given text (see get_audio)
+        
+        Args:
+            text: Text to convert to speech
+            **overrides: output_format, rate, volume or voice for this text
             
-            print(f"🎵 Generating audio for '{text}'...")
+        Returns:
+            Tuple of (audio_bytes, audio_base64) for transmission
+        """
+        audio_bytes = self.get_audio(text, **overrides)
+        if not audio_bytes:
+            return b'', ''
+        
+        # Convert to base64 for transmission
+        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        return audio_bytes, audio_base64
+    
+    def audio_url(self, text: str, **overrides) -> str:
+        """
+        Get the URL that serves the clip of text
+        
+        Args:
+            text: Text of the clip
+            **overrides: output_format, rate, volume or voice of the clip
             
-            # Call subprocess worker
-            result = subprocess.run(
-                [sys.executable, self.worker_script, text, temp_filepath],
-                capture_output=True,
-                text=True,
-                timeout=15  # 15 second timeout per request
-            )
+        Returns:
+            URL of the audio endpoint (absolute when public_url is set)
+        """
+        settings = self.settings(**overrides)
+        query = {
+            "text": text,
+            "format": settings["output_format"],
+            "rate": settings["rate"],
+            "volume": settings["volume"]
+        }
+        if settings["voice"]:
+            query["voice"] = settings["voice"]
+        key = make_cache_key(text, **settings)
+        return f"{self.public_url}{AUDIO_URL_PREFIX}{key}?{urlencode(query)}"
+    
+    def ensure_audio_url(self, text: str, **overrides) -> str:
+        """
+        Make sure the audio of text is cached and get its URL
+        
+        Args:
+            text: Text to convert to speech
+            **overrides: output_format, rate, volume or voice for this text
             
-            if result.returncode != 0:
-                print(f"❌ TTS worker failed: {result.stderr}")
-                return b'', ''
+        Returns:
+            Audio URL, or '' on failure
+        """
+        if not self.get_audio(text, **overrides):
+            return ''
+        return self.audio_url(text, **overrides)
+    
+    def generate_audio_urls(self, texts: List[str], **overrides) -> Dict[str, str]:
+        """
+        Generate audio for several texts at once. Duplicates are synthesized
+        once and cache misses are batched across the TTS pool.
+        
+        Args:
+            texts: Texts to convert to speech (may contain duplicates)
+            **overrides: output_format, rate, volume or voice for all texts
             
-            # Read the generated WAV file
-            if not os.path.exists(temp_filepath):
-                print(f"❌ Audio file not created")
-                return b'', ''
+        Returns:
+            Dictionary mapping each text to its audio URL ('' on failure)
+        """
+        audio = self.generate_audio_batch(texts, **overrides)
+        return {
+            text: self.audio_url(text, **overrides) if audio_bytes else ''
+            for text, audio_bytes in audio.items()
+        }
+    
+    def generate_audio_batch(self, texts: List[str],
+                             batch_size: Optional[int] = None,
+                             **overrides) -> Dict[str, bytes]:
+        """
+        Generate audio for several texts, synthesizing cache misses in
+        batches (one worker engine run per batch) that run concurrently
+        
+        Args:
+            texts: Texts to convert to speech (may contain duplicates)
+            batch_size: Texts per worker run (default: spread the misses
+                over the pool, at most self.batch_size per run)
+            **overrides: output_format, rate, volume or voice for all texts
             
-            with open(temp_filepath, 'rb') as f:
-                audio_bytes = f.read()
+        Returns:
+            Dictionary mapping each text to its audio bytes (b'' on failure)
+        """
+        if not self.engine:
+            return {text: b'' for text in texts}
+        
+        settings = self.settings(**overrides)
+        keys = {text: make_cache_key(text, **settings) for text in texts}
+        unique = {}
+        for text, key in keys.items():
+            unique.setdefault(key, text)
+        
+        results, owned, waiting = self._claim(unique)
+        if owned:
+            results.update(
+                self._synthesize_claimed(owned, unique, settings, batch_size)
+            )
+        for key, flight in waiting.items():
+            results[key] = flight.result()
+        
+        return {text: results[key] for text, key in keys.items()}
+    
+    def prefetch_audio(self, texts: List[str], batch_size: int = 2,
+                       **overrides) -> Dict[str, str]:
+        """
+        Start background synthesis of texts (in order) and return their
+        audio URLs right away. A URL requested before its clip is ready
+        waits for the in-flight synthesis (see get_ready_audio)
+        
+        Args:
+            texts: Texts to convert to speech, most urgent first
+            batch_size: Texts per worker run (small keeps early texts early)
+            **overrides: output_format, rate, volume or voice for all texts
             
-            # Clean up the temporary file
+        Returns:
+            Dictionary mapping each text to its audio URL
+        """
+        settings = self.settings(**overrides)
+        keys = {text: make_cache_key(text, **settings) for text in texts}
+        if not self.engine:
+            return {text: '' for text in texts}
+        
+        unique = {}
+        for text, key in keys.items():
+            unique.setdefault(key, text)
+        
+        with self._inflight_lock:
+            room = max(0, self.max_prefetch - self._prefetch_pending)
+            if len(unique) > room:
+                print(f"⚠️ Prefetch queue full, skipping {len(unique) - room} texts")
+                unique = dict(list(unique.items())[:room])
+            self._prefetch_pending += len(unique)
+        
+        _, owned, _ = self._claim(unique)
+        # Cached and already in-flight texts need no prefetch slot
+        self._finish_prefetch(len(unique) - len(owned))
+        if owned:
             try:
-                os.remove(temp_filepath)
-            except Exception as cleanup_err:
-                print(f"⚠️ Could not clean temp file: {cleanup_err}")
+                self.prefetch_executor.submit(
+                    self._run_prefetch, owned, unique, settings, batch_size
+                )
+            except RuntimeError:  # Shut down
+                for key in owned:
+                    self._resolve(key, b'')
+                self._finish_prefetch(len(owned))
+        return {text: self.audio_url(text, **overrides) for text in keys}
+    
+    def _run_prefetch(self, owned: List[str], unique: Dict[str, str],
+                      settings: Dict, batch_size: int):
+        """Synthesize the keys claimed by a prefetch, one batch at a time"""
+        try:
+            self._synthesize_claimed(
+                owned, unique, settings, batch_size, sequential=True
+            )
+        finally:
+            self._finish_prefetch(len(owned))
+    
+    def _finish_prefetch(self, count: int):
+        """Release prefetch queue slots"""
+        with self._inflight_lock:
+            self._prefetch_pending -= count
+    
+    def get_ready_audio(self, key: str, text: Optional[str] = None,
+                        timeout: float = 30.0, **overrides) -> Optional[bytes]:
+        """
+        Get a clip by cache key, waiting for it if it is being synthesized
+        and synthesizing it if it is not cached (e.g. evicted, or
+        prefetched by another worker process)
+        
+        Args:
+            key: Cache key of the clip
+            text: Text of the clip (from the audio URL); None only serves
+                cached or in-flight clips
+            timeout: Seconds to wait for an in-flight synthesis
+            **overrides: output_format, rate, volume or voice of the clip
             
-            # Convert to base64 for transmission
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        Returns:
+            Audio bytes, or None if unknown, failed or timed out
+        """
+        audio_bytes = self.cache.get(key)
+        if audio_bytes is not None:
+            return audio_bytes
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+        known_text = (
+            text is not None and self.cache_key(text, **overrides) == key
+        )
+        if flight is not None:
+            try:
+                audio_bytes = flight.result(timeout=timeout)
+            except FutureTimeoutError:
+                # Still queued behind other work: synthesize it right away
+                # instead of waiting for the queue
+                if not known_text:
+                    return None
+                settings = self.settings(**overrides)
+                audio_bytes = self._convert(
+                    self._synthesize(text, settings), settings["output_format"]
+                )
+                if audio_bytes:
+                    self.cache.put(key, audio_bytes)
+                return audio_bytes or None
+            if audio_bytes:
+                return audio_bytes
+        
+        if not known_text:
+            return None
+        return self.get_audio(text, **overrides) or None
+    
+    def _claim(self, unique: Dict[str, str]):
+        """
+        Split keys into cache hits, misses this caller must synthesize
+        (registered as in-flight) and misses already being synthesized
+        
+        Args:
+            unique: Mapping of cache key to text
             
-            print(f"✅ Generated audio for '{text}' ({len(audio_bytes)} bytes)")
-            return audio_bytes, audio_base64
+        Returns:
+            Tuple of ({key: audio} hits, [owned keys], {key: Future} waiting)
+        """
+        results = {}
+        misses = []
+        for key in unique:
+            audio_bytes = self.cache.get(key)
+            if audio_bytes is None:
+                misses.append(key)
+            else:
+                results[key] = audio_bytes
+        
+        owned, waiting = [], {}
+        with self._inflight_lock:
+            for key in misses:
+                if key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                    self.coalesced_calls += 1
+                else:
+                    self._inflight[key] = Future()
+                    self.synthesis_calls += 1
+                    owned.append(key)
+        return results, owned, waiting
+    
+    def _synthesize_claimed(self, owned: List[str], unique: Dict[str, str],
+                            settings: Dict, batch_size: Optional[int] = None,
+                            sequential: bool = False) -> Dict[str, bytes]:
+        """
+        Synthesize claimed keys in concurrent batches, cache the clips and
+        resolve their in-flight futures
+        
+        Args:
+            owned: Keys claimed by _claim
+            unique: Mapping of cache key to text
+            settings: Resolved voice settings (see settings())
+            batch_size: Texts per worker run (default: spread over the pool)
+            sequential: Submit each batch only after the previous one is
+                done (background work must not hog the executor queue)
             
-        except subprocess.TimeoutExpired:
-            print(f"❌ TTS generation timed out for '{text}'")
-            return b'', ''
+        Returns:
+            Dictionary mapping each key to its audio bytes (b'' on failure)
+        """
+        if not batch_size:
+            per_worker = -(-len(owned) // self.pool.size)
+            batch_size = min(self.batch_size, per_worker)
+        batches = [
+            owned[i:i + batch_size]
+            for i in range(0, len(owned), batch_size)
+        ]
+
+        def submit(batch):
+            return self.executor.submit(
+                self._synthesize_batch, [unique[key] for key in batch], settings
+            )
+        
+        results = {}
+        try:
+            futures = [] if sequential else [submit(batch) for batch in batches]
+            for index, batch in enumerate(batches):
+                future = submit(batch) if sequential else futures[index]
+                try:
+                    batch_audio = future.result()
+                except Exception as e:
+                    print(f"❌ Error generating audio batch: {e}")
+                    batch_audio = [b''] * len(batch)
+                for key, audio_bytes in zip(batch, batch_audio):
+                    audio_bytes = self._convert(
+                        audio_bytes, settings["output_format"]
+                    )
+                    if audio_bytes:
+                        self.cache.put(key, audio_bytes)
+                    self._resolve(key, audio_bytes)
+                    results[key] = audio_bytes
+        finally:
+            # Never leave a claimed key in flight (e.g. submit() raising
+            # after shutdown), or its waiters would block forever
+            for key in owned:
+                if key not in results:
+                    self._resolve(key, b'')
+        return results
+    
+    def _resolve(self, key: str, audio_bytes: bytes):
+        """Publish the result of a claimed key to its waiters"""
+        with self._inflight_lock:
+            flight = self._inflight.pop(key)
+        flight.set_result(audio_bytes)
+    
+    def _synthesize_once(self, key: str, text: str, settings: Dict) -> bytes:
+        """
+        Synthesize a cache miss, coalescing concurrent requests for the
+        same key: the first caller synthesizes, the others wait for its
+        result instead of starting their own synthesis
+        
+        Args:
+            key: Cache key of the text
+            text: Text to convert to speech
+            settings: Resolved voice settings (see settings())
+            
+        Returns:
+            WAV audio bytes, or b'' on failure
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.synthesis_calls += 1
+            else:
+                self.coalesced_calls += 1
+        
+        if not leader:
+            return future.result()
+        
+        audio_bytes = b''
+        try:
+            audio_bytes = self._convert(
+                self._synthesize(text, settings), settings["output_format"]
+            )
+            if audio_bytes:
+                self.cache.put(key, audio_bytes)
+        finally:
+            # Publish to waiters only after the cache holds the clip, so
+            # later callers hit the cache instead of starting a new flight
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_result(audio_bytes)
+        return audio_bytes
+    
+    def _job_options(self, settings: Dict) -> Dict:
+        """Worker job fields for resolved voice settings"""
+        return {
+            "rate": settings["rate"],
+            "volume": settings["volume"],
+            "voice": settings["voice"]
+        }
+    
+    def _convert(self, audio_bytes: bytes, output_format: str) -> bytes:
+        """Convert synthesized WAV to an audio profile (b'' on failure)"""
+        if not audio_bytes:
+            return b''
+        try:
+            return convert_wav(audio_bytes, output_format)
         except Exception as e:
-            print(f"❌ Error generating audio: {e}")
-            return b'', ''
+            print(f"❌ Could not convert audio to {output_format}: {e}")
+            return b''
     
-    def generate_word_assistance(self, wrong_word: str, correct_word: str) -> Dict:
+    def metrics(self) -> Dict:
+        """
+        Get synthesis metrics
+        
+        Returns:
+            Dictionary with synthesis and coalesced (saved) call counts
+        """
+        return {
+            "synthesis_calls": self.synthesis_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "in_flight": len(self._inflight)
+        }
+    
+    def _temp_path(self, text: str, index: int = 0) -> str:
+        """Unique temporary WAV path for a worker to write"""
+        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
+        timestamp = str(int(time.time() * 1000000))
+        return os.path.join(
+            self.scratch_dir,
+            f'dyslexia_audio_{text_hash}_{timestamp}_{index}.wav'
+        )
+    
+    def _read_output(self, temp_filepath: str) -> bytes:
+        """Read and delete a WAV file written by a worker"""
+        if not os.path.exists(temp_filepath):
+            print(f"❌ Audio file not created")
+            return b''
+        
+        with open(temp_filepath, 'rb') as f:
+            audio_bytes = f.read()
+        
+        # Clean up the temporary file
+        try:
+            os.remove(temp_filepath)
+        except Exception as cleanup_err:
+            print(f"⚠️ Could not clean temp file: {cleanup_err}")
+        return audio_bytes
+    
+    def _synthesize(self, text: str, settings: Dict) -> bytes:
+        """
+        Synthesize text on a pooled TTS worker (no caching)
+        
+        Args:
+            text: Text to convert to speech
+            settings: Resolved voice settings (see settings())
+            
+        Returns:
+            WAV audio bytes, or b'' on failure
+        """
+        temp_filepath = self._temp_path(text)
+        
+        print(f"🎵 Generating audio for '{text}'...")
+        
+        # Synthesize on a persistent worker (timeout handled by pool)
+        if not self.pool.synthesize(text, temp_filepath, **self._job_options(settings)):
+            print(f"❌ TTS worker failed for '{text}'")
+            return b''
+        
+        audio_bytes = self._read_output(temp_filepath)
+        if audio_bytes:
+            print(f"✅ Generated audio for '{text}' ({len(audio_bytes)} bytes)")
+        return audio_bytes
+    
+    def _synthesize_batch(self, texts: List[str], settings: Dict) -> List[bytes]:
+        """
+        Synthesize several texts in one pooled worker run (no caching)
+        
+        Args:
+            texts: Texts to convert to speech
+            settings: Resolved voice settings (see settings())
+            
+        Returns:
+            WAV audio bytes per text (b'' for failures)
+        """
+        paths = [self._temp_path(text, i) for i, text in enumerate(texts)]
+        
+        print(f"🎵 Generating audio batch of {len(texts)} texts...")
+        results = self.pool.synthesize_batch(
+            [
+                {"text": text, "output_path": path}
+                for text, path in zip(texts, paths)
+            ],
+            **self._job_options(settings)
+        )
+        
+        audio = [
+            self._read_output(path) if ok else b''
+            for path, ok in zip(paths, results)
+        ]
+        print(f"✅ Generated {sum(1 for data in audio if data)}/{len(texts)} batch clips")
+        return audio
+    
+    def generate_word_assistance(self, wrong_word: str, correct_word: str,
+                                 audio_url: Optional[str] = None) -> Dict:
         """
         Generate complete assistance for a misread word
         
         Args:
             wrong_word: What the user said
             correct_word: What should have been said
+            audio_url: Already generated audio URL of correct_word (optional)
             
         Returns:
             Dictionary with pronunciation guide and audio
@@ -121,22 +667,22 @@ class DyslexiaAssistanceEngine:
             return {
                 "wrong_word": wrong_word,
                 "correct_word": correct_word,
-                "audio_base64": "",
+                "audio_url": "",
                 "message": "TTS unavailable",
                 "status": "error"
             }
         
         try:
-            # Generate correct pronunciation audio
-            _, audio_base64 = self.generate_audio_file(correct_word)
+            # Generate correct pronunciation audio (served by URL)
+            if audio_url is None:
+                audio_url = self.ensure_audio_url(correct_word)
             
             return {
                 "wrong_word": wrong_word,
                 "correct_word": correct_word,
-                "audio_base64": audio_base64,
-                "audio_url": f"data:audio/wav;base64,{audio_base64}",
+                "audio_url": audio_url,
                 "message": f"You said '{wrong_word}' instead of '{correct_word}'. Listen to the correct pronunciation above.",
-                "status": "success"
+                "status": "success" if audio_url else "error"
             }
         
         except Exception as e:
@@ -144,17 +690,19 @@ class DyslexiaAssistanceEngine:
             return {
                 "wrong_word": wrong_word,
                 "correct_word": correct_word,
-                "audio_base64": "",
+                "audio_url": "",
                 "error": str(e),
                 "status": "error"
             }
     
-    def generate_missing_word_assistance(self, missing_word: str) -> Dict:
+    def generate_missing_word_assistance(self, missing_word: str,
+                                         audio_url: Optional[str] = None) -> Dict:
         """
         Generate assistance for a missing word
         
         Args:
             missing_word: Word that was skipped
+            audio_url: Already generated audio URL of missing_word (optional)
             
         Returns:
             Dictionary with pronunciation guide for the missing word
@@ -162,27 +710,27 @@ class DyslexiaAssistanceEngine:
         if not self.engine:
             return {
                 "missing_word": missing_word,
-                "audio_base64": "",
+                "audio_url": "",
                 "message": "TTS unavailable",
                 "status": "error"
             }
         
         try:
-            _, audio_base64 = self.generate_audio_file(missing_word)
+            if audio_url is None:
+                audio_url = self.ensure_audio_url(missing_word)
             
             return {
                 "missing_word": missing_word,
-                "audio_base64": audio_base64,
-                "audio_url": f"data:audio/wav;base64,{audio_base64}",
+                "audio_url": audio_url,
                 "message": f"You skipped this word. Listen: '{missing_word}'. Try reading it again.",
-                "status": "success"
+                "status": "success" if audio_url else "error"
             }
         
         except Exception as e:
             print(f"❌ Error in missing word assistance: {e}")
             return {
                 "missing_word": missing_word,
-                "audio_base64": "",
+                "audio_url": "",
                 "error": str(e),
                 "status": "error"
             }
@@ -208,16 +756,22 @@ class DyslexiaAssistanceEngine:
             "status": "success" if self.engine else "warning"
         }
         
+        # Synthesize each distinct word once, concurrently
+        audio = {}
+        if self.engine:
+            words = [correct for _, correct in wrong_words_list]
+            audio = self.generate_audio_urls(words + list(missing_words_list))
+        
         # Generate word error assistance
         for wrong, correct in wrong_words_list:
             assistance["word_errors"].append(
-                self.generate_word_assistance(wrong, correct)
+                self.generate_word_assistance(wrong, correct, audio.get(correct))
             )
         
         # Generate missing word assistance
         for missing in missing_words_list:
             assistance["missing_words"].append(
-                self.generate_missing_word_assistance(missing)
+                self.generate_missing_word_assistance(missing, audio.get(missing))
             )
         
         # Create practice plan
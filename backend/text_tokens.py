@@ -0,0 +1,117 @@
+"""
+Text Tokens Module
+
+Offset-based word and phrase views for trainer sessions. A session keeps
+its text once plus an array('I') of word start/end offsets (and phrase
+boundary word indices); word and phrase strings are only built when
+accessed.
+"""
+
+import base64
+import re
+from array import array
+from collections.abc import Sequence
+from typing import List
+
+# Same cleaning rules as SpeedTrainer.prepare_text / PhraseTrainer.split_into_words
+LEADING_PUNCTUATION = re.compile(r'^[\"\'\(\[\{«]+')
+TRAILING_PUNCTUATION = re.compile(r'[\"\')\]\}»\.!?,;:\-]+$')
+TOKEN = re.compile(r'\S+')
+
+
+def word_offsets(text: str) -> array:
+    """
+    Find the cleaned words of a text (leading/trailing punctuation
+    removed, in-word punctuation kept).
+
+    Args:
+        text: Raw text
+
+    Returns:
+        array('I') of [start, end, start, end, ...] character offsets
+    """
+    offsets = array('I')
+    for match in TOKEN.finditer(text):
+        token = match.group()
+        leading = LEADING_PUNCTUATION.match(token)
+        start = leading.end() if leading else 0
+        trailing = TRAILING_PUNCTUATION.search(token, start)
+        end = trailing.start() if trailing else len(token)
+        if end > start:
+            offsets.append(match.start() + start)
+            offsets.append(match.start() + end)
+    return offsets
+
+
+def pack_offsets(offsets: array) -> str:
+    """Encode an offset array as base64 text (for serialized sessions)"""
+    return base64.b64encode(offsets.tobytes()).decode('ascii')
+
+
+def unpack_offsets(data: str) -> array:
+    """Decode pack_offsets() output"""
+    offsets = array('I')
+    offsets.frombytes(base64.b64decode(data))
+    return offsets
+
+
+class WordView(Sequence):
+    """Read-only sequence of the words of a text, built on access"""
+
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, text: str, offsets: array):
+        self.text = text
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return self.text[self.offsets[2 * index]:self.offsets[2 * index + 1]]
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"WordView({list(self)!r})"
+
+
+class PhraseView(Sequence):
+    """Read-only sequence of phrases (space-joined words), built on access"""
+
+    __slots__ = ("words", "boundaries")
+
+    def __init__(self, words: WordView, boundaries: array):
+        self.words = words
+        self.boundaries = boundaries
+
+    def __len__(self) -> int:
+        return max(0, len(self.boundaries) - 1)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("phrase index out of range")
+        return ' '.join(
+            self.words[self.boundaries[index]:self.boundaries[index + 1]]
+        )
+
+    def word_count(self, index: int) -> int:
+        """Number of words in a phrase"""
+        return self.boundaries[index + 1] - self.boundaries[index]
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"PhraseView({list(self)!r})"
@@ -0,0 +1,305 @@
+"""
+TTS Audio Cache Module
+
+Two-tier, content-addressed cache for synthesized audio:
+1. In-memory LRU bounded by total bytes (per process)
+2. Persistent on-disk store shared by all uvicorn workers and kept
+   across restarts
+
+Entries are keyed by a hash of everything that changes the output:
+normalized text, rate, volume, voice and output format. Disk writes go
+to a temp file that is atomically renamed into place, so concurrent
+workers never see partial files. The disk tier is capped in bytes: hits
+in either tier refresh a file's mtime (memory hits at most once a minute)
+and, once the cap is exceeded, the least recently used files are deleted
+until the tier is back under 90% of the cap.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+# Minimum seconds between disk mtime refreshes for a clip hit in memory
+DISK_TOUCH_INTERVAL = 60.0
+
+
+def normalize_tts_text(text: str) -> str:
+    """
+    Normalize text so trivially different requests share a cache entry.
+
+    Args:
+        text: Raw text to synthesize
+
+    Returns:
+        Lowercased text with collapsed whitespace
+    """
+    return " ".join(text.lower().split())
+
+
+def make_cache_key(
+    text: str,
+    rate: int,
+    volume: float,
+    voice: Optional[str] = None,
+    output_format: str = "wav"
+) -> str:
+    """
+    Build the content address of a synthesized clip.
+
+    Args:
+        text: Text to synthesize
+        rate: Speech rate
+        volume: Volume level (0.0-1.0)
+        voice: Voice ID (None = system default)
+        output_format: Output format/profile name
+
+    Returns:
+        Hex SHA-256 digest identifying the clip
+    """
+    material = json.dumps([
+        normalize_tts_text(text), int(rate), round(float(volume), 3),
+        voice or "", output_format
+    ])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """
+    Thread-safe two-tier (memory LRU + disk) cache of audio bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        disk_max_bytes: int = 512 * 1024 * 1024
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the persistent tier (created if
+                missing); None disables the disk tier
+            memory_max_bytes: Byte cap of the in-memory LRU tier
+            disk_max_bytes: Byte cap of the disk tier
+        """
+        self.cache_dir = cache_dir
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        # Last disk mtime refresh of each clip in the memory tier
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._prune_lock = threading.Lock()
+        self._disk_bytes = 0
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writes = 0
+        self.disk_evictions = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_bytes = sum(
+                size for _, size, _ in self._disk_entries()
+            )
+
+    def _path(self, key: str) -> str:
+        """Disk location of a key (sharded by the first two hex chars)"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.wav")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up audio by key, promoting disk hits into memory.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Audio bytes, or None on a miss
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                now = time.monotonic()
+                touch = now - self._touched.get(key, 0.0) > DISK_TOUCH_INTERVAL
+                if touch:
+                    self._touched[key] = now
+        if audio is not None:
+            if touch:
+                # Keep clips that are used from memory recent on disk too
+                self._touch_disk(key)
+            return audio
+
+        audio = self._read_disk(key)
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, audio)
+        return audio
+
+    def contains(self, key: str) -> bool:
+        """Check for a key without touching LRU order or counters"""
+        with self._lock:
+            if key in self._memory:
+                return True
+        return bool(self.cache_dir) and os.path.exists(self._path(key))
+
+    def put(self, key: str, audio: bytes):
+        """
+        Store audio in both tiers.
+
+        Args:
+            key: Cache key from make_cache_key
+            audio: Audio bytes to store
+        """
+        if not audio:
+            return
+        self._write_disk(key, audio)
+        with self._lock:
+            self.writes += 1
+            self._remember(key, audio)
+
+    def _remember(self, key: str, audio: bytes):
+        """Insert into the memory tier and evict LRU entries (lock held)"""
+        if len(audio) > self.memory_max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        # The disk file was just read or written
+        self._touched[key] = time.monotonic()
+        while self._memory_bytes > self.memory_max_bytes:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._touched.pop(evicted_key, None)
+            self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = f.read()
+        except OSError:
+            return None
+        self._touch_disk(key)
+        return audio
+
+    def _touch_disk(self, key: str):
+        """Mark a disk file as recently used for disk pruning"""
+        if not self.cache_dir:
+            return
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _write_disk(self, key: str, audio: bytes):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path), suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not write TTS cache entry: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            self._disk_bytes += len(audio)
+            over_cap = self._disk_bytes > self.disk_max_bytes
+        if over_cap:
+            self._prune_disk()
+
+    def _disk_entries(self):
+        """Yield (path, size, mtime) of every cached file on disk"""
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith(".wav"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield entry.path, stat.st_size, stat.st_mtime
+
+    def _prune_disk(self):
+        """Delete least recently used files until under 90% of the cap"""
+        if not self._prune_lock.acquire(blocking=False):
+            return  # Another thread is already pruning
+        try:
+            # Rescan: other workers share the directory
+            entries = sorted(self._disk_entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            target = self.disk_max_bytes * 9 // 10
+            removed = 0
+            for path, size, _ in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            with self._lock:
+                self._disk_bytes = total
+                self.disk_evictions += removed
+        except OSError as e:
+            print(f"⚠️ Could not prune TTS disk cache: {e}")
+        finally:
+            self._prune_lock.release()
+
+    def metrics(self) -> Dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and memory usage
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "memory_max_bytes": self.memory_max_bytes,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "writes": self.writes,
+            "hit_rate": round(
+                (self.memory_hits + self.disk_hits) / lookups, 3
+            ) if lookups else 0.0,
+            "disk_enabled": bool(self.cache_dir),
+            "disk_bytes": self._disk_bytes,
+            "disk_max_bytes": self.disk_max_bytes,
+            "disk_evictions": self.disk_evictions
+        }
@@ -0,0 +1,316 @@
+"""
+TTS Worker Pool Module
+
+Keeps a pool of long-lived `tts_worker.py --serve` processes, each with an
+initialized pyttsx3 engine, so a synthesis request only pays for the
+synthesis itself instead of interpreter startup and engine setup.
+Each worker still runs in its own process, which keeps pyttsx3's
+thread-unsafety away from the API server.
+
+Workers are restarted when they crash, time out, or reach
+`max_jobs_per_worker` jobs (pyttsx3 drivers tend to leak over time).
+"""
+
+import json
+import queue
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class TTSWorkerError(Exception):
+    """Raised when a worker cannot be started or fails a job"""
+
+
+class _TTSWorker:
+    """A single `tts_worker.py --serve` process"""
+
+    def __init__(self, worker_script: str, startup_timeout: float):
+        self.process = subprocess.Popen(
+            [sys.executable, worker_script, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1
+        )
+        self.jobs_done = 0
+        self._next_id = 0
+        self._responses = queue.Queue()
+        # Pipes cannot be polled with a timeout on every platform, so a
+        # reader thread forwards response lines to a queue
+        self._reader = threading.Thread(
+            target=self._read_responses, daemon=True
+        )
+        self._reader.start()
+
+        ready = self._wait_response(startup_timeout)
+        if not ready or not ready.get("ready"):
+            error = (ready or {}).get("error", "no ready message")
+            self.kill()
+            raise TTSWorkerError(f"TTS worker failed to start: {error}")
+        self.pid = ready.get("pid", self.process.pid)
+        self.voices = ready.get("voices") or []
+
+    def _read_responses(self):
+        for line in self.process.stdout:
+            try:
+                self._responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self._responses.put({"eof": True})  # Process exited
+
+    def _wait_response(self, timeout: float) -> Optional[Dict]:
+        try:
+            return self._responses.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run_job(self, job: Dict, timeout: float) -> Dict:
+        """
+        Send one job and wait for its response.
+
+        Args:
+            job: Job fields (without "id")
+            timeout: Seconds to wait for the response
+
+        Returns:
+            Response dictionary from the worker
+
+        Raises:
+            TTSWorkerError: If the worker died or timed out
+        """
+        self._next_id += 1
+        job_id = self._next_id
+        try:
+            self.process.stdin.write(json.dumps({"id": job_id, **job}) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise TTSWorkerError(f"TTS worker pipe closed: {e}")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            response = self._wait_response(max(0.0, remaining))
+            if response is None:
+                raise TTSWorkerError(f"TTS worker timed out after {timeout}s")
+            if response.get("eof"):
+                raise TTSWorkerError("TTS worker crashed")
+            if response.get("id") == job_id:
+                self.jobs_done += 1
+                return response
+
+    def kill(self):
+        """Terminate the worker process"""
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+        if self.is_alive():
+            self.process.kill()
+        try:
+            self.process.wait(timeout=2)
+        except Exception:
+            pass
+
+
+class TTSWorkerPool:
+    """
+    Pool of persistent TTS worker processes.
+
+    synthesize() blocks the calling thread until a worker is free, so call
+    it from a thread pool (not directly on the asyncio event loop).
+    """
+
+    def __init__(
+        self,
+        worker_script: str,
+        size: int = 2,
+        max_jobs_per_worker: int = 200,
+        job_timeout: float = 15.0,
+        startup_timeout: float = 20.0
+    ):
+        """
+        Initialize the pool (workers are started lazily on first use).
+
+        Args:
+            worker_script: Path to tts_worker.py
+            size: Number of worker processes
+            max_jobs_per_worker: Recycle a worker after this many jobs
+            job_timeout: Seconds allowed per synthesis job
+            startup_timeout: Seconds allowed for a worker to initialize
+        """
+        self.worker_script = worker_script
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.job_timeout = job_timeout
+        self.startup_timeout = startup_timeout
+
+        # Free slots hold either a live worker or None (not yet started)
+        self._idle = queue.LifoQueue()
+        for _ in range(self.size):
+            self._idle.put(None)
+        self._closed = False
+        # Installed voice IDs, reported by the first worker that starts
+        self.voices: Optional[List[str]] = None
+
+        # Metrics
+        self._jobs = 0
+        self._failures = 0
+        self._restarts = 0
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, output_path: str, **options) -> bool:
+        """
+        Synthesize text into a WAV file on a pooled worker.
+
+        Args:
+            text: Text to synthesize
+            output_path: Where the worker should write the WAV file
+            **options: Extra job fields understood by tts_worker.py
+
+        Returns:
+            True if the worker reported success
+        """
+        response = self._run(
+            {"text": text, "output_path": output_path, **options},
+            self.job_timeout
+        )
+        return bool(response and response.get("ok"))
+
+    def synthesize_batch(self, items: List[Dict], **options) -> List[bool]:
+        """
+        Synthesize several texts in one engine run on a pooled worker.
+
+        Args:
+            items: List of {"text": ..., "output_path": ...} dicts
+            **options: Extra job fields (e.g. rate, volume, voice) applied
+                to the whole batch
+
+        Returns:
+            List of success flags, one per item
+        """
+        if not items:
+            return []
+        # Each utterance gets the single-job budget
+        response = self._run(
+            {"items": items, **options}, self.job_timeout * len(items)
+        )
+        if not response:
+            return [False] * len(items)
+        results = response.get("results") or []
+        if len(results) != len(items):
+            return [False] * len(items)
+        return [bool(ok) for ok in results]
+
+    def _run(self, job: Dict, timeout: float) -> Optional[Dict]:
+        """Run one job on a free worker (None if the worker failed)"""
+        if self._closed:
+            raise TTSWorkerError("TTS worker pool is shut down")
+
+        worker = self._idle.get()
+        with self._lock:
+            self._busy += 1
+        try:
+            if worker is not None and not worker.is_alive():
+                self._retire(worker)
+                worker = None
+            if worker is None:
+                worker = self._spawn()
+
+            response = worker.run_job(job, timeout)
+            with self._lock:
+                self._jobs += 1
+
+            if worker.jobs_done >= self.max_jobs_per_worker:
+                self._retire(worker)
+                worker = None
+            return response
+
+        except TTSWorkerError as e:
+            print(f"❌ {e}")
+            with self._lock:
+                self._failures += 1
+            if worker is not None:
+                self._retire(worker)
+            worker = None
+            return None
+
+        finally:
+            with self._lock:
+                self._busy -= 1
+            self._idle.put(worker)
+
+    def _spawn(self) -> _TTSWorker:
+        """Start a worker process"""
+        worker = _TTSWorker(self.worker_script, self.startup_timeout)
+        print(f"[OK] TTS worker started (pid {worker.pid})")
+        if self.voices is None:
+            self.voices = worker.voices
+        return worker
+
+    def _retire(self, worker: _TTSWorker):
+        """Stop a crashed, hung or worn-out worker; its slot restarts lazily"""
+        worker.kill()
+        with self._lock:
+            self._restarts += 1
+
+    def warm_up(self):
+        """Start all workers now instead of on first request"""
+        workers = [self._idle.get() for _ in range(self.size)]
+        try:
+            for i, worker in enumerate(workers):
+                if worker is not None and not worker.is_alive():
+                    self._retire(worker)
+                    worker = None
+                if worker is None:
+                    try:
+                        workers[i] = self._spawn()
+                    except TTSWorkerError as e:
+                        print(f"⚠️ {e}")
+                        workers[i] = None
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def voice_ids(self) -> List[str]:
+        """
+        Get the voice IDs installed for the workers' TTS driver.
+
+        Starts the workers if none has started yet.
+
+        Returns:
+            Voice IDs (empty if no worker could start)
+        """
+        if self.voices is None:
+            self.warm_up()
+        return self.voices or []
+
+    def shutdown(self):
+        """Stop all worker processes"""
+        self._closed = True
+        for _ in range(self.size):
+            worker = self._idle.get()
+            if worker is not None:
+                worker.kill()
+
+    def metrics(self) -> Dict:
+        """
+        Get pool metrics.
+
+        Returns:
+            Dictionary with pool size, busy workers and job counters
+        """
+        return {
+            "size": self.size,
+            "busy": self._busy,
+            "jobs": self._jobs,
+            "failures": self._failures,
+            "restarts": self._restarts
+        }
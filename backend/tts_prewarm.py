@@ -0,0 +1,273 @@
+"""
+TTS Prewarm Module
+
+Fills the TTS audio cache in the background with the vocabulary of the
+paragraph library, so the first child to hit a misread word does not pay
+for the synthesis and a fresh deploy is not completely cold.
+
+- Words are ranked by historical error frequency (most misread first)
+- Background words only use the TTS pool while it is idle, so live
+  requests are never starved
+- Words are synthesized in batches (one worker engine run per batch)
+- Paragraphs handed to a reader can be prioritized (see prioritize())
+- Words already in the cache are skipped, so with the persistent disk
+  tier an interrupted run resumes where it left off
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+from text_comparison import clean_text
+
+
+class TTSPrewarmer:
+    """
+    Background job that synthesizes a vocabulary into the TTS cache.
+    """
+
+    def __init__(
+        self,
+        engine,
+        error_counts_func: Optional[Callable[[], Dict[str, int]]] = None,
+        idle_poll_interval: float = 0.25
+    ):
+        """
+        Initialize the prewarmer (call start() to begin).
+
+        Args:
+            engine: DyslexiaAssistanceEngine whose cache is filled
+            error_counts_func: Returns {word: error_count} used to rank the
+                vocabulary (alphabetical order if None or failing)
+            idle_poll_interval: Seconds between checks for pool capacity
+        """
+        self.engine = engine
+        self.error_counts_func = error_counts_func
+        self.idle_poll_interval = idle_poll_interval
+
+        self._sources: Dict[str, List[str]] = {}
+        self._background = deque()
+        self._priority = deque()
+        self._seen = set()  # Words handled in this run
+        self._planned = set()  # Words counted in total
+        self._stale = True
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        # Progress
+        self.state = "idle"
+        self.total = 0
+        self.cached = 0
+        self.synthesized = 0
+        self.failed = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def add_source(self, name: str, paragraphs: Iterable[str]):
+        """
+        Register paragraphs whose vocabulary should be prewarmed.
+
+        Args:
+            name: Source name (re-registering replaces the source)
+            paragraphs: Paragraph texts
+        """
+        with self._condition:
+            self._sources[name] = list(paragraphs)
+            self._stale = True
+            self._condition.notify()
+
+    def vocabulary(self) -> List[str]:
+        """Unique words of all registered sources, ranked for prewarming"""
+        with self._condition:
+            paragraphs = [p for texts in self._sources.values() for p in texts]
+        words = {word for p in paragraphs for word in clean_text(p).split()}
+
+        error_counts = {}
+        if self.error_counts_func:
+            try:
+                error_counts = self.error_counts_func()
+            except Exception as e:
+                print(f"⚠️ Could not load word error counts: {e}")
+        return sorted(words, key=lambda w: (-error_counts.get(w, 0), w))
+
+    def prioritize(self, text: str):
+        """
+        Warm the words of a text ahead of the background vocabulary.
+
+        Args:
+            text: Paragraph about to be read
+        """
+        with self._condition:
+            for word in clean_text(text).split():
+                if word not in self._seen and word not in self._priority:
+                    self._priority.append(word)
+                    if word not in self._planned:
+                        self._planned.add(word)
+                        self.total += 1
+            self._condition.notify()
+
+    def start(self):
+        """Start the background thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self.started_at = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name="tts-prewarm", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the background thread (progress is kept in the cache).
+
+        Args:
+            timeout: Seconds to wait for the current word to finish
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.state = "stopped"
+
+    def _refresh(self):
+        """(Re)build the ranked background queue from the sources"""
+        self.state = "ranking"
+        ranked = self.vocabulary()
+        with self._condition:
+            self._stale = False
+            self._background = deque(
+                word for word in ranked if word not in self._seen
+            )
+            self._planned.update(ranked)
+            self.total = len(self._planned)
+        self.state = "warming"
+
+    def _next_word(self):
+        """
+        Wait for the next word to warm.
+
+        Returns:
+            (word, urgent) tuple, or None when stopped
+        """
+        with self._condition:
+            while True:
+                if not self._running:
+                    return None
+                while self._priority:
+                    word = self._priority.popleft()
+                    if word not in self._seen:
+                        return word, True
+                if self._stale:
+                    # Sources changed: rebuild the background queue first
+                    return "", False
+                while self._background:
+                    word = self._background.popleft()
+                    if word not in self._seen:
+                        return word, False
+                if self.state != "complete":
+                    self.state = "complete"
+                    self.finished_at = time.time()
+                self._condition.wait()
+
+    def _run(self):
+        while True:
+            item = self._next_word()
+            if item is None:
+                return
+            word, urgent = item
+            if not word:
+                self._refresh()
+                continue
+
+            self.state = "warming"
+            if not self._wait_for_capacity(urgent):
+                if not urgent:
+                    # Preempted by a prioritized paragraph; retry later
+                    with self._condition:
+                        self._background.appendleft(word)
+                continue
+            self._warm([word] + self._take_more(urgent))
+
+    def _wait_for_capacity(self, urgent: bool) -> bool:
+        """
+        Block until the TTS pool can take a prewarm job.
+
+        Background words wait for a fully idle pool; prioritized words only
+        need one free worker.
+
+        Returns:
+            False if stopped, or if a background word was preempted by a
+            prioritized one
+        """
+        pool = self.engine.pool
+        while True:
+            busy = pool.metrics()["busy"]
+            if busy == 0 or (urgent and busy < pool.size):
+                return True
+            with self._condition:
+                if not self._running:
+                    return False
+                if not urgent and self._priority:
+                    return False
+                self._condition.wait(self.idle_poll_interval)
+
+    def _take_more(self, urgent: bool) -> List[str]:
+        """Pop more words of the same kind to fill a synthesis batch"""
+        words = []
+        with self._condition:
+            queue = self._priority if urgent else self._background
+            while queue and len(words) < self.engine.batch_size - 1:
+                word = queue.popleft()
+                if word not in self._seen and word not in words:
+                    words.append(word)
+        return words
+
+    def _warm(self, words: List[str]):
+        """Synthesize words into the cache (one batch) unless cached"""
+        with self._condition:
+            self._seen.update(words)
+        missing = [
+            word for word in words
+            if not self.engine.cache.contains(self.engine.cache_key(word))
+        ]
+        self.cached += len(words) - len(missing)
+        if not missing:
+            return
+        audio = self.engine.generate_audio_batch(
+            missing, batch_size=len(missing)
+        )
+        for word in missing:
+            if audio.get(word):
+                self.synthesized += 1
+            else:
+                self.failed += 1
+
+    def status(self) -> Dict:
+        """
+        Get prewarm progress.
+
+        Returns:
+            Dictionary with state, counts and percent complete
+        """
+        done = self.cached + self.synthesized + self.failed
+        return {
+            "state": self.state,
+            "running": self._running,
+            "total_words": self.total,
+            "already_cached": self.cached,
+            "synthesized": self.synthesized,
+            "failed": self.failed,
+            "remaining": max(0, self.total - done),
+            "priority_pending": len(self._priority),
+            "percent_complete": round(
+                100.0 * done / self.total, 1
+            ) if self.total else 0.0,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
@@ -2,49 +2,195 @@
 """
 Isolated TTS Worker Process
 Runs in a subprocess to avoid pyttsx3 singleton/threading issues
+
+Modes:
+    tts_worker.py <text> <output_path>   One-shot synthesis, then exit
+    tts_worker.py --serve                Long-lived worker for TTSWorkerPool:
+                                         reads one JSON job per line on stdin
+                                         and answers one JSON line on stdout
 """
 
 import sys
+import json
 import pyttsx3
 import os
 
-def generate_tts(text: str, output_path: str) -> bool:
+
+DEFAULT_RATE = 100
+DEFAULT_VOLUME = 0.9
+
+
+def create_engine():
+    """Initialize a pyttsx3 engine with the assistance module settings"""
+    engine = pyttsx3.init()
+    engine.setProperty('rate', DEFAULT_RATE)
+    engine.setProperty('volume', DEFAULT_VOLUME)
+    return engine
+
+
+class VoiceSettings:
+    """Applies per-job rate/volume/voice, skipping unchanged properties"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.default_voice = engine.getProperty('voice')
+        self.current = {
+            'rate': DEFAULT_RATE,
+            'volume': DEFAULT_VOLUME,
+            'voice': self.default_voice
+        }
+
+    def apply(self, job: dict):
+        """
+        Set the engine properties requested by a job
+
+        Args:
+            job: Job with optional "rate", "volume" and "voice" fields
+                (missing or null fields reset to the defaults)
+        """
+        wanted = {
+            'rate': int(job.get('rate') or DEFAULT_RATE),
+            'volume': float(
+                DEFAULT_VOLUME if job.get('volume') is None else job['volume']
+            ),
+            'voice': job.get('voice') or self.default_voice
+        }
+        for name, value in wanted.items():
+            if value is not None and value != self.current[name]:
+                self.engine.setProperty(name, value)
+                self.current[name] = value
+
+
+def generate_tts(text: str, output_path: str, engine=None) -> bool:
     """
     Generate TTS audio in isolation
-    
+
     Args:
         text: Text to synthesize
         output_path: Where to save the WAV file
-        
+        engine: Already-initialized engine to reuse (created if None)
+
     Returns:
         True if successful, False otherwise
     """
     try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 100)
-        engine.setProperty('volume', 0.9)
-        
+        if engine is None:
+            engine = create_engine()
+
         engine.save_to_file(text, output_path)
         engine.runAndWait()
-        
+
         # Verify file was created
         if os.path.exists(output_path):
             return True
         else:
             print(f"ERROR: Output file not created: {output_path}", file=sys.stderr)
             return False
-            
+
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return False
 
+
+def generate_tts_batch(items: list, engine=None) -> list:
+    """
+    Generate several TTS files in one engine run
+
+    Queues every item before a single runAndWait(), so per-utterance
+    driver startup and teardown is paid once per batch.
+
+    Args:
+        items: List of {"text": ..., "output_path": ...} dicts
+        engine: Already-initialized engine to reuse (created if None)
+
+    Returns:
+        List of success flags, one per item
+    """
+    try:
+        if engine is None:
+            engine = create_engine()
+
+        for item in items:
+            engine.save_to_file(item["text"], item["output_path"])
+        engine.runAndWait()
+
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return [False] * len(items)
+
+    results = []
+    for item in items:
+        created = os.path.exists(item["output_path"])
+        if not created:
+            print(f"ERROR: Output file not created: {item['output_path']}", file=sys.stderr)
+        results.append(created)
+    return results
+
+
+def serve() -> int:
+    """
+    Serve synthesis jobs until stdin closes, reusing one engine.
+
+    Ready:    {"ready": true, "pid": 123, "voices": ["voice-id", ...]}
+
+    Job:      {"id": 1, "text": "word", "output_path": "/tmp/x.wav",
+               "rate": 100, "volume": 0.9, "voice": null}
+    Response: {"id": 1, "ok": true}
+
+    Batch job:      {"id": 2, "items": [{"text": ..., "output_path": ...}],
+                     "rate": 100, "volume": 0.9, "voice": null}
+    Batch response: {"id": 2, "ok": true, "results": [true, ...]}
+    """
+    # Keep stdout for the protocol; anything pyttsx3 prints goes to stderr
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    def respond(message: dict):
+        protocol.write(json.dumps(message) + "\n")
+        protocol.flush()
+
+    try:
+        engine = create_engine()
+    except Exception as e:
+        respond({"ready": False, "error": str(e)})
+        return 1
+    settings = VoiceSettings(engine)
+    voices = [voice.id for voice in engine.getProperty('voices') or []]
+    respond({"ready": True, "pid": os.getpid(), "voices": voices})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            respond({"id": None, "ok": False, "error": f"Bad job: {e}"})
+            continue
+        try:
+            settings.apply(job)
+        except Exception as e:
+            respond({"id": job.get("id"), "ok": False, "error": f"Bad voice settings: {e}"})
+            continue
+        if "items" in job:
+            results = generate_tts_batch(job["items"], engine)
+            respond({"id": job.get("id"), "ok": all(results), "results": results})
+            continue
+        ok = generate_tts(job["text"], job["output_path"], engine)
+        respond({"id": job.get("id"), "ok": ok})
+    return 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) == 2 and sys.argv[1] == "--serve":
+        sys.exit(serve())
+
     if len(sys.argv) != 3:
         print("Usage: tts_worker.py <text> <output_path>", file=sys.stderr)
+        print("       tts_worker.py --serve", file=sys.stderr)
         sys.exit(1)
-    
+
     text = sys.argv[1]
     output_path = sys.argv[2]
-    
+
     success = generate_tts(text, output_path)
     sys.exit(0 if success else 1)
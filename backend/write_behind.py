@@ -0,0 +1,230 @@
+"""
+Write-Behind Queue Module
+
+Buffers rows in process and hands them to a flush function in batches
+from a background thread, so request handlers never wait on the
+database. A batch is flushed when it reaches `max_batch_size` rows or
+when `flush_interval` seconds have passed since the last flush,
+whichever comes first. Remaining rows are flushed on stop().
+
+A failing batch is retried as a unit; once it runs out of retries it is
+bisected so that only the rows that fail on their own are dropped.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List
+
+
+class WriteBehindQueue:
+    """
+    Thread-safe write-behind buffer with size/time based batch flushing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_func: Callable[[List[Any]], None],
+        max_batch_size: int = 100,
+        flush_interval: float = 2.0,
+        max_buffer_size: int = 10000,
+        max_retries: int = 3
+    ):
+        """
+        Initialize the queue (call start() to begin flushing).
+
+        Args:
+            name: Name used in logs and metrics
+            flush_func: Called with a list of buffered items; must persist
+                them or raise
+            max_batch_size: Flush as soon as this many items are buffered
+            flush_interval: Flush at least this often (seconds)
+            max_buffer_size: Items beyond this are dropped (back-pressure)
+            max_retries: Times a failing batch is retried before its
+                failing rows are dropped
+        """
+        self.name = name
+        self.flush_func = flush_func
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.max_retries = max_retries
+
+        self._buffer = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        # Failed batches awaiting a retry, with their failure counts
+        self._retry_batches = deque()
+
+        # Metrics
+        self._enqueued = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+        self._flush_count = 0
+        self._last_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    def start(self):
+        """Start the background flush thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """
+        Stop the flush thread and flush everything still buffered.
+
+        Args:
+            timeout: Seconds to wait for the flush thread to finish
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        # Final drain in the caller's thread (no retries left to wait for)
+        while len(self):
+            if not self.flush():
+                break
+
+    def put(self, item: Any) -> bool:
+        """
+        Buffer an item for writing.
+
+        Args:
+            item: Row to persist
+
+        Returns:
+            True if buffered, False if dropped because the buffer is full
+        """
+        with self._condition:
+            if len(self._buffer) >= self.max_buffer_size:
+                self._dropped += 1
+                return False
+            self._buffer.append(item)
+            self._enqueued += 1
+            if len(self._buffer) >= self.max_batch_size:
+                self._condition.notify()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Flush one batch now.
+
+        Returns:
+            True if the batch was written (or nothing was buffered)
+        """
+        with self._flush_lock:
+            with self._condition:
+                if self._retry_batches:
+                    batch, failures = self._retry_batches.popleft()
+                else:
+                    batch = [
+                        self._buffer.popleft()
+                        for _ in range(
+                            min(self.max_batch_size, len(self._buffer))
+                        )
+                    ]
+                    failures = 0
+            if not batch:
+                return True
+
+            start = time.perf_counter()
+            try:
+                self.flush_func(batch)
+            except Exception as e:
+                self._failed_flushes += 1
+                print(f"⚠️ Write-behind '{self.name}' flush failed: {e}")
+                self._requeue(batch, failures + 1)
+                return False
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._flush_count += 1
+            self._flushed += len(batch)
+            self._last_flush_ms = elapsed_ms
+            self._total_flush_ms += elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            return True
+
+    def _requeue(self, batch: List[Any], failures: int):
+        """Queue a failed batch for retry, or salvage it after max_retries"""
+        if failures > self.max_retries:
+            self._salvage(batch)
+            return
+        with self._condition:
+            self._retry_batches.appendleft((batch, failures))
+
+    def _salvage(self, batch: List[Any]):
+        """
+        Write a batch that keeps failing by bisecting it, so one bad row
+        (e.g. a foreign key violation) does not take the good rows with it.
+
+        Args:
+            batch: Items that failed max_retries + 1 times together
+        """
+        if len(batch) == 1:
+            self._dropped += 1
+            print(
+                f"❌ Write-behind '{self.name}' dropped 1 item "
+                f"after {self.max_retries} retries"
+            )
+            return
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                self.flush_func(half)
+            except Exception:
+                self._salvage(half)
+            else:
+                self._flushed += len(half)
+
+    def _run(self):
+        """Background loop: flush on size or interval"""
+        while True:
+            with self._condition:
+                if self._running and len(self) < self.max_batch_size:
+                    self._condition.wait(self.flush_interval)
+                if not self._running:
+                    return
+            if not self.flush():
+                # Back off before retrying a failing sink
+                time.sleep(self.flush_interval)
+
+    def __len__(self) -> int:
+        return len(self._buffer) + sum(
+            len(batch) for batch, _ in self._retry_batches
+        )
+
+    def metrics(self) -> Dict:
+        """
+        Get queue metrics.
+
+        Returns:
+            Dictionary with buffer depth, throughput and flush latency
+        """
+        flush_count = self._flush_count
+        return {
+            "name": self.name,
+            "buffer_depth": len(self),
+            "enqueued": self._enqueued,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+            "flush_count": flush_count,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+            "avg_flush_ms": round(
+                self._total_flush_ms / flush_count, 2
+            ) if flush_count else 0.0,
+            "max_flush_ms": round(self._max_flush_ms, 2)
+        }
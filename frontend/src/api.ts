@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { AssessmentResponse } from './types';
+import { AuthAPI } from './utils/authAPI';
 
 export const API_BASE_URL = 'http://localhost:8000';
 
@@ -114,6 +115,12 @@ export const getHealth = async () => {
   }
 };
 
+// Bearer token of the signed-in user, so results are saved to their progress
+const authHeaders = (): Record<string, string> => {
+  const token = AuthAPI.getToken();
+  return token ? { Authorization: `Bearer ${token}` } : {};
+};
+
 export const submitSpeedTrainerResults = async (
   sessionId: string,
   elapsedTimeSeconds: number
@@ -130,6 +137,7 @@ export const submitSpeedTrainerResults = async (
       },
       {
         timeout: 30000,
+        headers: authHeaders(),
       }
     );
 
@@ -170,6 +178,7 @@ export const submitChunkReadingResults = async (
       },
       {
         timeout: 30000,
+        headers: authHeaders(),
       }
     );
 